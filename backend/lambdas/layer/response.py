@@ -5,9 +5,24 @@ Standardized HTTP response formatting for Lambda functions.
 """
 
 import json
+from decimal import Decimal
 from typing import Any
 
 
+def _json_default(value: Any) -> Any:
+    """Serialize values json cannot, such as the Decimal numbers DynamoDB returns.
+
+    Args:
+        value: Value json.dumps could not serialize
+
+    Returns:
+        JSON-serializable equivalent (int for whole Decimals, float otherwise)
+    """
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 def create_response(
     status_code: int,
     body: dict[str, Any] | list[Any] | str,
@@ -38,7 +53,11 @@ def create_response(
         default_headers.update(headers)
 
     # Convert body to JSON string if not already a string
-    response_body = body if isinstance(body, str) else json.dumps(body, ensure_ascii=False)
+    response_body = (
+        body
+        if isinstance(body, str)
+        else json.dumps(body, ensure_ascii=False, default=_json_default)
+    )
 
     return {
         "statusCode": status_code,
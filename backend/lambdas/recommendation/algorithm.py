@@ -4,8 +4,26 @@ Sake Sensei - Recommendation Algorithm
 Content-based filtering algorithm for sake recommendations.
 """
 
+import heapq
+from decimal import Decimal
 from typing import Any
 
+from boto3.dynamodb.conditions import Key
+
+# Lambda Layer imports (no 'backend.lambdas.layer' prefix in Lambda environment)
+try:
+    from logger import get_logger
+except ImportError:
+    # Fallback for local development
+    from backend.lambdas.layer.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Beginner-friendly categories
+BEGINNER_CATEGORIES = frozenset({"junmai", "honjozo", "futsushu"})
+# Advanced categories
+ADVANCED_CATEGORIES = frozenset({"daiginjo", "junmai_daiginjo", "koshu"})
+
 
 class RecommendationEngine:
     """Recommendation engine using content-based filtering."""
@@ -45,47 +63,49 @@ class RecommendationEngine:
         Returns:
             List of recommended sake with scores
         """
-        # Get all sake from database
-        all_sake = self._get_all_sake()
-
-        # Filter by budget if specified
         budget = preferences.get("budget")
-        if budget:
-            all_sake = [s for s in all_sake if s.get("price", 0) <= budget]
-
-        # Filter by preferred categories if specified
         preferred_categories = preferences.get("categories", [])
         if preferred_categories:
-            all_sake = [s for s in all_sake if s.get("category") in preferred_categories]
+            # Read only the preferred categories (and budget) via the CategoryIndex GSI
+            all_sake = self._get_sake_by_categories(preferred_categories, budget)
+        else:
+            # Get all sake from database
+            all_sake = self._get_all_sake()
+
+            # Filter by budget if specified
+            if budget:
+                all_sake = [s for s in all_sake if s.get("price", 0) <= budget]
 
         # Filter out already tasted sake
         tasted_sake_ids = {record.get("sake_id") for record in tasting_history}
         candidate_sake = [s for s in all_sake if s.get("sake_id") not in tasted_sake_ids]
 
+        # Breweries the user has tried, computed once rather than per candidate
+        tried_breweries = {record.get("brewery_id") for record in tasting_history}
+
         # Score each sake based on preferences
-        scored_sake = []
-        for sake in candidate_sake:
-            score = self._calculate_score(sake, preferences, tasting_history)
-            match_reason = self._generate_match_reason(sake, preferences)
-
-            scored_sake.append(
-                {
-                    "sake_id": sake["sake_id"],
-                    "name": sake["name"],
-                    "brewery_id": sake["brewery_id"],
-                    "category": sake["category"],
-                    "price": sake.get("price", 0),
-                    "sweetness": sake.get("sweetness", 3),
-                    "acidity": sake.get("acidity", 3),
-                    "richness": sake.get("richness", 3),
-                    "score": round(score, 2),
-                    "match_reason": match_reason,
-                }
-            )
-
-        # Sort by score descending and return top N
-        scored_sake.sort(key=lambda x: x["score"], reverse=True)
-        return scored_sake[:limit]
+        scored_sake = [
+            (round(self._calculate_score(sake, preferences, tried_breweries), 2), sake)
+            for sake in candidate_sake
+        ]
+
+        # Take the top N by score with a partial sort, building results only for those
+        top_sake = heapq.nlargest(limit, scored_sake, key=lambda pair: pair[0])
+        return [
+            {
+                "sake_id": sake["sake_id"],
+                "name": sake["name"],
+                "brewery_id": sake["brewery_id"],
+                "category": sake["category"],
+                "price": sake.get("price", 0),
+                "sweetness": sake.get("sweetness", 3),
+                "acidity": sake.get("acidity", 3),
+                "richness": sake.get("richness", 3),
+                "score": score,
+                "match_reason": self._generate_match_reason(sake, preferences),
+            }
+            for score, sake in top_sake
+        ]
 
     def _get_all_sake(self) -> list[dict[str, Any]]:
         """Get all sake from DynamoDB.
@@ -99,18 +119,63 @@ class RecommendationEngine:
         except Exception:
             return []
 
+    def _get_sake_by_categories(
+        self,
+        categories: list[str],
+        budget: float | None,
+    ) -> list[dict[str, Any]]:
+        """Get sake in the given categories from the CategoryIndex GSI.
+
+        The index is keyed on category with price as its sort key, so the
+        budget is applied as a key condition rather than after reading. The
+        index is sparse: sake without a price are not in it and are never
+        returned here.
+
+        A category whose query fails is logged and skipped; the other
+        categories are still returned.
+
+        Args:
+            categories: Sake categories to include
+            budget: Maximum price, or None for no limit
+
+        Returns:
+            List of matching sake records
+        """
+        items: list[dict[str, Any]] = []
+        for category in dict.fromkeys(categories):
+            condition = Key("category").eq(category)
+            if budget:
+                condition &= Key("price").lte(Decimal(str(budget)))
+            query_kwargs: dict[str, Any] = {
+                "IndexName": "CategoryIndex",
+                "KeyConditionExpression": condition,
+            }
+            category_items: list[dict[str, Any]] = []
+            try:
+                while True:
+                    response = self.sake_table.query(**query_kwargs)
+                    category_items.extend(response.get("Items", []))
+                    if "LastEvaluatedKey" not in response:
+                        break
+                    query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+            except Exception as e:
+                logger.error("Failed to query sake by category", category=category, error=str(e))
+                continue
+            items.extend(category_items)
+        return items
+
     def _calculate_score(
         self,
         sake: dict[str, Any],
         preferences: dict[str, Any],
-        tasting_history: list[dict[str, Any]],
+        tried_breweries: set[Any],
     ) -> float:
         """Calculate recommendation score for a sake.
 
         Args:
             sake: Sake record
             preferences: User preferences
-            tasting_history: User's tasting history
+            tried_breweries: Brewery IDs from the user's tasting history
 
         Returns:
             Score (0-100)
@@ -126,11 +191,11 @@ class RecommendationEngine:
         score += experience_score * 0.2
 
         # Diversity bonus (10% weight) - prefer sake from different breweries
-        diversity_score = self._calculate_diversity_score(sake, tasting_history)
+        diversity_score = self._calculate_diversity_score(sake, tried_breweries)
         score += diversity_score * 0.1
 
         # Popularity bonus (10% weight) - based on rating if available
-        popularity_score = sake.get("rating", 3.0) * 20  # Scale 0-5 to 0-100
+        popularity_score = float(sake.get("rating", 3.0)) * 20  # Scale 0-5 to 0-100
         score += popularity_score * 0.1
 
         return min(score, 100.0)
@@ -154,10 +219,10 @@ class RecommendationEngine:
         pref_acidity = preferences.get("acidity", 3)
         pref_richness = preferences.get("richness", 3)
 
-        # Get sake's taste profile
-        sake_sweetness = sake.get("sweetness", 3)
-        sake_acidity = sake.get("acidity", 3)
-        sake_richness = sake.get("richness", 3)
+        # Get sake's taste profile (DynamoDB returns numbers as Decimal)
+        sake_sweetness = float(sake.get("sweetness", 3))
+        sake_acidity = float(sake.get("acidity", 3))
+        sake_richness = float(sake.get("richness", 3))
 
         # Calculate distance for each dimension (0-4 scale)
         sweetness_diff = abs(pref_sweetness - sake_sweetness)
@@ -189,24 +254,19 @@ class RecommendationEngine:
         experience_level = preferences.get("experience_level", "beginner")
         sake_category = sake.get("category", "")
 
-        # Beginner-friendly categories
-        beginner_categories = ["junmai", "honjozo", "futsushu"]
-        # Advanced categories
-        advanced_categories = ["daiginjo", "junmai_daiginjo", "koshu"]
-
         if experience_level == "beginner":
-            return 100.0 if sake_category in beginner_categories else 50.0
+            return 100.0 if sake_category in BEGINNER_CATEGORIES else 50.0
         elif experience_level == "intermediate":
             return 80.0  # Intermediate users can try anything
         elif experience_level == "advanced":
-            return 100.0 if sake_category in advanced_categories else 70.0
+            return 100.0 if sake_category in ADVANCED_CATEGORIES else 70.0
         else:
             return 50.0
 
     def _calculate_diversity_score(
         self,
         sake: dict[str, Any],
-        tasting_history: list[dict[str, Any]],
+        tried_breweries: set[Any],
     ) -> float:
         """Calculate diversity bonus score.
 
@@ -214,17 +274,14 @@ class RecommendationEngine:
 
         Args:
             sake: Sake record
-            tasting_history: User's tasting history
+            tried_breweries: Brewery IDs from the user's tasting history
 
         Returns:
             Score (0-100)
         """
-        if not tasting_history:
+        if not tried_breweries:
             return 100.0  # Maximum diversity for new users
 
-        # Get breweries the user has tried
-        tried_breweries = {record.get("brewery_id") for record in tasting_history}
-
         # Give bonus if this is a new brewery
         if sake.get("brewery_id") not in tried_breweries:
             return 100.0
@@ -112,7 +112,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     # Generate recommendations
     recommendations = engine.recommend(
-        user_id=user_id,
+        user_id,
         preferences=preferences,
         tasting_history=tasting_history,
         limit=limit,
@@ -242,14 +242,17 @@ def handle_create_record(body: dict[str, Any], auth_user_id: str | None) -> dict
 
     logger.info("Creating tasting record", user_id=user_id, record_id=record_id)
 
+    # JSON mode stores datetimes as ISO strings, which boto3 cannot serialize itself
+    item = record.model_dump(mode="json")
+
     try:
         # Save to DynamoDB
-        tasting_table.put_item(Item=record.model_dump())
+        tasting_table.put_item(Item=item)
 
         logger.info("Tasting record created", user_id=user_id, record_id=record_id)
 
         return created_response(
-            {"record": record.model_dump()},
+            {"record": item},
             location=f"/api/tasting/{user_id}/{record_id}",
         )
 
@@ -299,13 +302,15 @@ def handle_update_record(
 
     logger.info("Updating tasting record", user_id=user_id, record_id=record_id)
 
+    item = record.model_dump(mode="json")
+
     try:
         # Update in DynamoDB
-        tasting_table.put_item(Item=record.model_dump())
+        tasting_table.put_item(Item=item)
 
         logger.info("Tasting record updated", user_id=user_id, record_id=record_id)
 
-        return success_response({"record": record.model_dump()})
+        return success_response({"record": item})
 
     except Exception as e:
         logger.error(
@@ -382,7 +382,7 @@ def main():
                     "エクスポート日時": datetime.now().isoformat(),
                 }
 
-                summary_text = "\n".join([f"{k}: {v}" for k, v in summary.items()])
+                summary_text = "\n".join(f"{k}: {v}" for k, v in summary.items())
 
                 st.download_button(
                     label="📊 サマリーレポート",
@@ -10,15 +10,26 @@ Direct Lambda invocation is a temporary fallback until Gateway is properly set u
 
 import contextlib
 import json
+import threading
+import weakref
 from datetime import datetime
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any
 
 import boto3
+import orjson
 import requests
 from utils.config import config
 from utils.session import SessionManager
 
 
+@lru_cache(maxsize=4)
+def _lambda_client(region: str) -> Any:
+    """Create the Lambda client once per region; boto3 clients are thread-safe."""
+    return boto3.client("lambda", region_name=region)
+
+
 class BackendError(Exception):
     """Custom exception for backend API errors."""
 
@@ -39,23 +50,38 @@ class BackendClient:
         self.timeout = 30
         self.use_gateway = bool(self.gateway_url)
 
-        # Initialize Lambda client for fallback
-        if not self.use_gateway:
-            self.lambda_client = boto3.client("lambda", region_name=config.AWS_REGION)
-
-    def _get_headers(self) -> dict[str, str]:
+        if self.use_gateway:
+            # Gateway sessions, one per script thread (see the http property)
+            self._local = threading.local()
+        else:
+            # Initialize Lambda client for fallback
+            self.lambda_client = _lambda_client(config.AWS_REGION)
+
+    @property
+    def http(self) -> requests.Session:
+        """Pooled Gateway session for the calling thread.
+
+        Sequential Gateway calls in one script run reuse the open connection.
+        requests.Session is not documented as thread-safe, and Streamlit runs
+        each session's script in its own thread, so the module-level client
+        never shares a session across threads. The session is closed once its
+        thread is gone.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            # The shared client serves every user: auth is the per-call token, never cookies
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            weakref.finalize(threading.current_thread(), session.close)
+        return session
+
+    def _get_headers(self, id_token: str) -> dict[str, str]:
         """Get request headers with authentication."""
-        headers = {
+        return {
             "Content-Type": "application/json",
+            "Authorization": f"Bearer {id_token}",
         }
 
-        # Add ID token for authentication
-        id_token = SessionManager.get_id_token()
-        if id_token:
-            headers["Authorization"] = f"Bearer {id_token}"
-
-        return headers
-
     def _invoke_lambda_direct(self, function_arn: str, payload: dict[str, Any]) -> dict[str, Any]:
         """
         Invoke Lambda function directly (fallback mode).
@@ -85,8 +111,8 @@ class BackendClient:
                 Payload=json.dumps(event),
             )
 
-            # Parse response
-            response_payload = json.loads(response["Payload"].read())
+            # Parse response; orjson reads the payload bytes without decoding to str first
+            response_payload = orjson.loads(response["Payload"].read())
 
             # Check for Lambda errors
             if "errorMessage" in response_payload:
@@ -99,12 +125,12 @@ class BackendClient:
                     if isinstance(error_body, str):
                         # Try to parse JSON error body, keep string if fails
                         with contextlib.suppress(json.JSONDecodeError):
-                            error_body = json.loads(error_body)  # noqa: PLW2901
+                            error_body = orjson.loads(error_body)  # noqa: PLW2901
                     raise BackendError(f"Lambda returned error: {error_body}")
 
                 body = response_payload.get("body", "{}")
                 if isinstance(body, str):
-                    return json.loads(body)
+                    return orjson.loads(body)
                 return body
 
             # Direct response
@@ -137,11 +163,16 @@ class BackendClient:
         """
         # Use AgentCore Gateway if configured (recommended)
         if self.use_gateway:
+            # Fail fast instead of paying for a round-trip that ends in 401
+            id_token = SessionManager.get_id_token()
+            if not id_token:
+                raise BackendError("Not authenticated")
+
             try:
-                response = requests.post(
+                response = self.http.post(
                     f"{self.gateway_url}/invoke-tool",
                     json={"tool": tool_name, "arguments": parameters},
-                    headers=self._get_headers(),
+                    headers=self._get_headers(id_token),
                     timeout=timeout or self.timeout,
                 )
 
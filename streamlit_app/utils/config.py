@@ -5,21 +5,60 @@ Loads configuration from environment variables and provides app-wide settings.
 """
 
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
 
-# Load environment variables
+# Load environment variables once per process; Streamlit reruns and worker
+# processes inherit the sentinel and skip re-parsing the .env file.
 env_path = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(env_path)
+if (
+    os.environ.get("_SAKE_DOTENV_LOADED") != "1"
+    and os.environ.get("APP_ENV") != "production"
+    and env_path.exists()
+):
+    load_dotenv(env_path)
+    os.environ["_SAKE_DOTENV_LOADED"] = "1"
 
+_env = os.environ
 
+
+def _env_str(name: str, default: str | None = None) -> Any:
+    """Field read from an environment variable."""
+    return field(default_factory=lambda: _env.get(name, default))
+
+
+def _env_region(name: str) -> Any:
+    """Field read from an environment variable, defaulting to AWS_REGION."""
+    return field(default_factory=lambda: _env.get(name, _env.get("AWS_REGION", "us-west-2")))
+
+
+def _env_bool(name: str, default: str) -> Any:
+    """Boolean field read from an environment variable ("true" / "false")."""
+    return field(default_factory=lambda: _env.get(name, default).lower() == "true")
+
+
+def _env_int(name: str, default: str) -> Any:
+    """Integer field read from an environment variable."""
+    return field(default_factory=lambda: int(_env.get(name, default)))
+
+
+def _env_float(name: str, default: str) -> Any:
+    """Float field read from an environment variable."""
+    return field(default_factory=lambda: float(_env.get(name, default)))
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """
     Application configuration.
 
     All environment-specific settings are loaded from environment variables.
     See .env.example for a complete list of available configuration options.
+    Values are read once when the instance is created; use
+    dataclasses.replace() to derive a modified copy.
 
     IMPORTANT:
     - All region-specific settings default to us-west-2
@@ -28,125 +67,132 @@ class Config:
     """
 
     # AWS Configuration
-    AWS_REGION = os.getenv("AWS_REGION", "us-west-2")
-    AWS_ACCOUNT_ID = os.getenv("AWS_ACCOUNT_ID")
+    AWS_REGION: str = _env_str("AWS_REGION", "us-west-2")
+    AWS_ACCOUNT_ID: str | None = _env_str("AWS_ACCOUNT_ID")
 
     # CDK Configuration (defaults to AWS_REGION)
-    CDK_DEFAULT_REGION = os.getenv("CDK_DEFAULT_REGION", AWS_REGION)
-    CDK_DEFAULT_ACCOUNT = os.getenv("CDK_DEFAULT_ACCOUNT", AWS_ACCOUNT_ID)
+    CDK_DEFAULT_REGION: str = _env_region("CDK_DEFAULT_REGION")
+    CDK_DEFAULT_ACCOUNT: str | None = field(
+        default_factory=lambda: _env.get("CDK_DEFAULT_ACCOUNT", _env.get("AWS_ACCOUNT_ID"))
+    )
 
     # Cognito Configuration
-    COGNITO_REGION = os.getenv("COGNITO_REGION", AWS_REGION)
-    COGNITO_USER_POOL_ID = os.getenv("COGNITO_USER_POOL_ID")
-    COGNITO_CLIENT_ID = os.getenv("COGNITO_CLIENT_ID")
-    COGNITO_CLIENT_SECRET = os.getenv("COGNITO_CLIENT_SECRET")  # Optional
-    COGNITO_DOMAIN = os.getenv("COGNITO_DOMAIN", "")
+    COGNITO_REGION: str = _env_region("COGNITO_REGION")
+    COGNITO_USER_POOL_ID: str | None = _env_str("COGNITO_USER_POOL_ID")
+    COGNITO_CLIENT_ID: str | None = _env_str("COGNITO_CLIENT_ID")
+    COGNITO_CLIENT_SECRET: str | None = _env_str("COGNITO_CLIENT_SECRET")  # Optional
+    COGNITO_DOMAIN: str = _env_str("COGNITO_DOMAIN", "")
 
     # AgentCore Configuration
-    AGENTCORE_GATEWAY_URL = os.getenv("AGENTCORE_GATEWAY_URL", "")
-    AGENTCORE_GATEWAY_ID = os.getenv("AGENTCORE_GATEWAY_ID")
-    AGENTCORE_GATEWAY_ARN = os.getenv("AGENTCORE_GATEWAY_ARN")
-    AGENTCORE_RUNTIME_URL = os.getenv("AGENTCORE_RUNTIME_URL", "")
-    AGENTCORE_AGENT_ID = os.getenv("AGENTCORE_AGENT_ID", "")
-    AGENTCORE_AGENT_ALIAS_ID = os.getenv("AGENTCORE_AGENT_ALIAS_ID", "")
-    AGENTCORE_MEMORY_ID = os.getenv("AGENTCORE_MEMORY_ID")
-    AGENTCORE_MEMORY_TTL = int(os.getenv("AGENTCORE_MEMORY_TTL", "86400"))
+    AGENTCORE_GATEWAY_URL: str = _env_str("AGENTCORE_GATEWAY_URL", "")
+    AGENTCORE_GATEWAY_ID: str | None = _env_str("AGENTCORE_GATEWAY_ID")
+    AGENTCORE_GATEWAY_ARN: str | None = _env_str("AGENTCORE_GATEWAY_ARN")
+    AGENTCORE_RUNTIME_URL: str = _env_str("AGENTCORE_RUNTIME_URL", "")
+    AGENTCORE_AGENT_ID: str = _env_str("AGENTCORE_AGENT_ID", "")
+    AGENTCORE_AGENT_ALIAS_ID: str = _env_str("AGENTCORE_AGENT_ALIAS_ID", "")
+    AGENTCORE_MEMORY_ID: str | None = _env_str("AGENTCORE_MEMORY_ID")
+    AGENTCORE_MEMORY_TTL: int = _env_int("AGENTCORE_MEMORY_TTL", "86400")
 
     # Lambda Function ARNs
-    LAMBDA_RECOMMENDATION_ARN = os.getenv("LAMBDA_RECOMMENDATION_ARN")
-    LAMBDA_PREFERENCE_ARN = os.getenv("LAMBDA_PREFERENCE_ARN")
-    LAMBDA_TASTING_ARN = os.getenv("LAMBDA_TASTING_ARN")
-    LAMBDA_BREWERY_ARN = os.getenv("LAMBDA_BREWERY_ARN")
-    LAMBDA_IMAGE_RECOGNITION_ARN = os.getenv("LAMBDA_IMAGE_RECOGNITION_ARN")
+    LAMBDA_RECOMMENDATION_ARN: str | None = _env_str("LAMBDA_RECOMMENDATION_ARN")
+    LAMBDA_PREFERENCE_ARN: str | None = _env_str("LAMBDA_PREFERENCE_ARN")
+    LAMBDA_TASTING_ARN: str | None = _env_str("LAMBDA_TASTING_ARN")
+    LAMBDA_BREWERY_ARN: str | None = _env_str("LAMBDA_BREWERY_ARN")
+    LAMBDA_IMAGE_RECOGNITION_ARN: str | None = _env_str("LAMBDA_IMAGE_RECOGNITION_ARN")
 
     # DynamoDB Configuration
-    DYNAMODB_ENDPOINT = os.getenv("DYNAMODB_ENDPOINT", "")  # For local dev
-    DYNAMODB_USERS_TABLE = os.getenv("DYNAMODB_USERS_TABLE", "SakeSensei-Users")
-    DYNAMODB_SAKE_TABLE = os.getenv("DYNAMODB_SAKE_TABLE", "SakeSensei-SakeMaster")
-    DYNAMODB_BREWERY_TABLE = os.getenv("DYNAMODB_BREWERY_TABLE", "SakeSensei-BreweryMaster")
-    DYNAMODB_TASTING_TABLE = os.getenv("DYNAMODB_TASTING_TABLE", "SakeSensei-TastingRecords")
+    DYNAMODB_ENDPOINT: str = _env_str("DYNAMODB_ENDPOINT", "")  # For local dev
+    DYNAMODB_USERS_TABLE: str = _env_str("DYNAMODB_USERS_TABLE", "SakeSensei-Users")
+    DYNAMODB_SAKE_TABLE: str = _env_str("DYNAMODB_SAKE_TABLE", "SakeSensei-SakeMaster")
+    DYNAMODB_BREWERY_TABLE: str = _env_str("DYNAMODB_BREWERY_TABLE", "SakeSensei-BreweryMaster")
+    DYNAMODB_TASTING_TABLE: str = _env_str("DYNAMODB_TASTING_TABLE", "SakeSensei-TastingRecords")
 
     # S3 Configuration
-    S3_BUCKET_IMAGES = os.getenv("S3_BUCKET_IMAGES", f"sakesensei-images-{AWS_ACCOUNT_ID or 'dev'}")
-    S3_BUCKET_REGION = os.getenv("S3_BUCKET_REGION", AWS_REGION)
+    S3_BUCKET_IMAGES: str = field(
+        default_factory=lambda: _env.get(
+            "S3_BUCKET_IMAGES", f"sakesensei-images-{_env.get('AWS_ACCOUNT_ID') or 'dev'}"
+        )
+    )
+    S3_BUCKET_REGION: str = _env_region("S3_BUCKET_REGION")
 
     # Application Configuration
-    APP_NAME = os.getenv("APP_NAME", "Sake Sensei")
-    APP_ENV = os.getenv("APP_ENV", "development")
-    APP_DEBUG = os.getenv("APP_DEBUG", "false").lower() == "true"
-    APP_LOG_LEVEL = os.getenv("APP_LOG_LEVEL", "INFO")
+    APP_NAME: str = _env_str("APP_NAME", "Sake Sensei")
+    APP_ENV: str = _env_str("APP_ENV", "development")
+    APP_DEBUG: bool = _env_bool("APP_DEBUG", "false")
+    APP_LOG_LEVEL: str = _env_str("APP_LOG_LEVEL", "INFO")
 
     # Bedrock Model Configuration
     # Using inference profile for Sonnet 4.5
-    BEDROCK_MODEL_ID = os.getenv("BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-5-20250929-v1:0")
-    BEDROCK_MAX_TOKENS = int(os.getenv("BEDROCK_MAX_TOKENS", "4096"))
-    BEDROCK_TEMPERATURE = float(os.getenv("BEDROCK_TEMPERATURE", "0.7"))
-    BEDROCK_STREAMING = os.getenv("BEDROCK_STREAMING", "true").lower() == "true"
+    BEDROCK_MODEL_ID: str = _env_str(
+        "BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
+    )
+    BEDROCK_MAX_TOKENS: int = _env_int("BEDROCK_MAX_TOKENS", "4096")
+    BEDROCK_TEMPERATURE: float = _env_float("BEDROCK_TEMPERATURE", "0.7")
+    BEDROCK_STREAMING: bool = _env_bool("BEDROCK_STREAMING", "true")
 
     # Vision Model Configuration
-    VISION_MODEL_ID = os.getenv("VISION_MODEL_ID", "anthropic.claude-3-5-sonnet-20241022-v2:0")
-    IMAGE_MAX_SIZE_MB = int(os.getenv("IMAGE_MAX_SIZE_MB", "5"))
-    IMAGE_ALLOWED_TYPES = os.getenv("IMAGE_ALLOWED_TYPES", "image/jpeg,image/png,image/webp")
+    VISION_MODEL_ID: str = _env_str("VISION_MODEL_ID", "anthropic.claude-3-5-sonnet-20241022-v2:0")
+    IMAGE_MAX_SIZE_MB: int = _env_int("IMAGE_MAX_SIZE_MB", "5")
+    IMAGE_ALLOWED_TYPES: str = _env_str("IMAGE_ALLOWED_TYPES", "image/jpeg,image/png,image/webp")
 
     # Recommendation Algorithm Settings
-    RECOMMENDATION_MAX_RESULTS = int(os.getenv("RECOMMENDATION_MAX_RESULTS", "5"))
-    RECOMMENDATION_DIVERSITY_WEIGHT = float(os.getenv("RECOMMENDATION_DIVERSITY_WEIGHT", "0.3"))
-    RECOMMENDATION_COLLABORATIVE_WEIGHT = float(
-        os.getenv("RECOMMENDATION_COLLABORATIVE_WEIGHT", "0.3")
+    RECOMMENDATION_MAX_RESULTS: int = _env_int("RECOMMENDATION_MAX_RESULTS", "5")
+    RECOMMENDATION_DIVERSITY_WEIGHT: float = _env_float("RECOMMENDATION_DIVERSITY_WEIGHT", "0.3")
+    RECOMMENDATION_COLLABORATIVE_WEIGHT: float = _env_float(
+        "RECOMMENDATION_COLLABORATIVE_WEIGHT", "0.3"
     )
-    RECOMMENDATION_CONTENT_WEIGHT = float(os.getenv("RECOMMENDATION_CONTENT_WEIGHT", "0.4"))
+    RECOMMENDATION_CONTENT_WEIGHT: float = _env_float("RECOMMENDATION_CONTENT_WEIGHT", "0.4")
 
     # Streamlit Configuration
-    STREAMLIT_SERVER_PORT = int(os.getenv("STREAMLIT_SERVER_PORT", "8501"))
-    STREAMLIT_SERVER_ADDRESS = os.getenv("STREAMLIT_SERVER_ADDRESS", "localhost")
+    STREAMLIT_SERVER_PORT: int = _env_int("STREAMLIT_SERVER_PORT", "8501")
+    STREAMLIT_SERVER_ADDRESS: str = _env_str("STREAMLIT_SERVER_ADDRESS", "localhost")
 
     # Security
-    SECRET_KEY = os.getenv("SECRET_KEY", "")
-    JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "")
-    JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
-    JWT_EXPIRATION_MINUTES = int(os.getenv("JWT_EXPIRATION_MINUTES", "60"))
+    SECRET_KEY: str = _env_str("SECRET_KEY", "")
+    JWT_SECRET_KEY: str = _env_str("JWT_SECRET_KEY", "")
+    JWT_ALGORITHM: str = _env_str("JWT_ALGORITHM", "HS256")
+    JWT_EXPIRATION_MINUTES: int = _env_int("JWT_EXPIRATION_MINUTES", "60")
 
     # Feature Flags
-    FEATURE_IMAGE_RECOGNITION = os.getenv("FEATURE_IMAGE_RECOGNITION", "true").lower() == "true"
-    FEATURE_FOOD_PAIRING = os.getenv("FEATURE_FOOD_PAIRING", "true").lower() == "true"
-    FEATURE_SOCIAL_SHARING = os.getenv("FEATURE_SOCIAL_SHARING", "false").lower() == "true"
-    FEATURE_EXPORT_HISTORY = os.getenv("FEATURE_EXPORT_HISTORY", "true").lower() == "true"
+    FEATURE_IMAGE_RECOGNITION: bool = _env_bool("FEATURE_IMAGE_RECOGNITION", "true")
+    FEATURE_FOOD_PAIRING: bool = _env_bool("FEATURE_FOOD_PAIRING", "true")
+    FEATURE_SOCIAL_SHARING: bool = _env_bool("FEATURE_SOCIAL_SHARING", "false")
+    FEATURE_EXPORT_HISTORY: bool = _env_bool("FEATURE_EXPORT_HISTORY", "true")
 
     # Development/Testing Flags
-    USE_MOCK_DATA = os.getenv("USE_MOCK_DATA", "false").lower() == "true"
-    DEBUG_SQL_QUERIES = os.getenv("DEBUG_SQL_QUERIES", "false").lower() == "true"
-    DEBUG_API_REQUESTS = os.getenv("DEBUG_API_REQUESTS", "false").lower() == "true"
-
-    @classmethod
-    def validate(cls) -> bool:
+    USE_MOCK_DATA: bool = _env_bool("USE_MOCK_DATA", "false")
+    DEBUG_SQL_QUERIES: bool = _env_bool("DEBUG_SQL_QUERIES", "false")
+    DEBUG_API_REQUESTS: bool = _env_bool("DEBUG_API_REQUESTS", "false")
+
+    # Required settings that are missing, computed once per (immutable) instance
+    _missing: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Record missing required settings."""
+        required = (
+            ("AWS_REGION", self.AWS_REGION),
+            ("COGNITO_USER_POOL_ID", self.COGNITO_USER_POOL_ID),
+            ("COGNITO_CLIENT_ID", self.COGNITO_CLIENT_ID),
+        )
+        object.__setattr__(self, "_missing", tuple(var for var, value in required if not value))
+
+    def validate(self) -> bool:
         """Validate that required configuration is present."""
-        required_vars = [
-            "AWS_REGION",
-            "COGNITO_USER_POOL_ID",
-            "COGNITO_CLIENT_ID",
-        ]
-
-        missing = []
-        for var in required_vars:
-            if not getattr(cls, var):
-                missing.append(var)
-
-        if missing:
-            print(f"⚠️  Missing required configuration: {', '.join(missing)}")
+        if self._missing:
+            print(f"⚠️  Missing required configuration: {', '.join(self._missing)}")
             return False
 
         return True
 
-    @classmethod
-    def get_info(cls) -> dict:
+    def get_info(self) -> dict:
         """Get configuration summary for debugging."""
         return {
-            "AWS Region": cls.AWS_REGION,
-            "Cognito User Pool": cls.COGNITO_USER_POOL_ID,
-            "AgentCore Gateway": cls.AGENTCORE_GATEWAY_ID,
-            "AgentCore Memory": cls.AGENTCORE_MEMORY_ID,
-            "Environment": cls.APP_ENV,
-            "Debug Mode": cls.APP_DEBUG,
+            "AWS Region": self.AWS_REGION,
+            "Cognito User Pool": self.COGNITO_USER_POOL_ID,
+            "AgentCore Gateway": self.AGENTCORE_GATEWAY_ID,
+            "AgentCore Memory": self.AGENTCORE_MEMORY_ID,
+            "Environment": self.APP_ENV,
+            "Debug Mode": self.APP_DEBUG,
         }
 
 
@@ -4,29 +4,23 @@ Sake Sensei - Gamification System
 Achievement badges, progress tracking, and user engagement features.
 """
 
-from typing import Any
+from collections.abc import Callable
+from functools import cache
+from typing import Any, NamedTuple
 
-import streamlit as st
+# streamlit is imported inside the functions that render or touch session
+# state, so achievement definitions and progress math stay cheap to import.
 
 
-class Achievement:
+class Achievement(NamedTuple):
     """Achievement/Badge definition."""
 
-    def __init__(
-        self,
-        id: str,
-        title: str,
-        description: str,
-        icon: str,
-        requirement: int,
-        badge_type: str = "primary",
-    ):
-        self.id = id
-        self.title = title
-        self.description = description
-        self.icon = icon
-        self.requirement = requirement
-        self.badge_type = badge_type
+    id: str
+    title: str
+    description: str
+    icon: str
+    requirement: int
+    badge_type: str = "primary"
 
 
 # Achievement definitions
@@ -113,6 +107,65 @@ ACHIEVEMENTS = [
     ),
 ]
 
+ACHIEVEMENTS_BY_ID: dict[str, Achievement] = {a.id: a for a in ACHIEVEMENTS}
+
+# Bit assigned to each achievement in the progress "earned_mask"
+_BIT: dict[str, int] = {a.id: 1 << i for i, a in enumerate(ACHIEVEMENTS)}
+_ALL_MASK = (1 << len(ACHIEVEMENTS)) - 1
+
+# Requirement checks, keyed by achievement ID
+_CHECKERS: dict[str, Callable[[dict[str, Any]], bool]] = {
+    "first_taste": lambda p: p["tastings_count"] >= 1,
+    "sake_explorer": lambda p: p["tastings_count"] >= 10,
+    "sake_master": lambda p: p["tastings_count"] >= 50,
+    "sake_legend": lambda p: p["tastings_count"] >= 100,
+    "preference_complete": lambda p: bool(p["preferences_set"]),
+    "ai_enthusiast": lambda p: p["recommendations_count"] >= 5,
+    "reviewer": lambda p: p["reviews_count"] >= 5,
+    "sake_connoisseur": lambda p: len(p["unique_types"]) >= 8,
+    "social_drinker": lambda p: p["social_tastings"] >= 10,
+    "sake_photographer": lambda p: p["image_recognitions"] >= 10,
+}
+
+# Current progress values, keyed by achievement ID
+_PROGRESS_GETTERS: dict[str, Callable[[dict[str, Any]], int]] = {
+    "first_taste": lambda p: p["tastings_count"],
+    "sake_explorer": lambda p: p["tastings_count"],
+    "sake_master": lambda p: p["tastings_count"],
+    "sake_legend": lambda p: p["tastings_count"],
+    "preference_complete": lambda p: 1 if p["preferences_set"] else 0,
+    "ai_enthusiast": lambda p: p["recommendations_count"],
+    "reviewer": lambda p: p["reviews_count"],
+    "sake_connoisseur": lambda p: len(p["unique_types"]),
+    "social_drinker": lambda p: p["social_tastings"],
+    "sake_photographer": lambda p: p["image_recognitions"],
+}
+
+# Achievements that each progress action can possibly unlock
+_ACTION_TO_ACHIEVEMENTS: dict[str, tuple[str, ...]] = {
+    "tasting": (
+        "first_taste",
+        "sake_explorer",
+        "sake_master",
+        "sake_legend",
+        "reviewer",
+        "sake_connoisseur",
+        "social_drinker",
+    ),
+    "recommendation": ("ai_enthusiast",),
+    "preference_set": ("preference_complete",),
+    "image_recognition": ("sake_photographer",),
+}
+
+# Checks aligned with the earned-mask bit order, and per-action candidate masks
+_CHECK_FNS: tuple[Callable[[dict[str, Any]], bool], ...] = tuple(
+    _CHECKERS[a.id] for a in ACHIEVEMENTS
+)
+_ACTION_TO_MASK: dict[str, int] = {
+    action: sum(_BIT[aid] for aid in achievement_ids)
+    for action, achievement_ids in _ACTION_TO_ACHIEVEMENTS.items()
+}
+
 
 def get_user_progress(user_id: str) -> dict[str, Any]:
     """
@@ -124,6 +177,8 @@ def get_user_progress(user_id: str) -> dict[str, Any]:
     Returns:
         Dictionary with progress data
     """
+    import streamlit as st
+
     # Get from session state (in production, fetch from DynamoDB)
     progress_key = f"user_progress_{user_id}"
     if progress_key not in st.session_state:
@@ -135,41 +190,36 @@ def get_user_progress(user_id: str) -> dict[str, Any]:
             "reviews_count": 0,
             "unique_types": set(),
             "social_tastings": 0,
-            "earned_achievements": set(),
+            "earned_mask": 0,
         }
 
     return st.session_state[progress_key]
 
 
-def check_achievements(user_id: str) -> list[Achievement]:
+def check_achievements(user_id: str, candidate_mask: int = _ALL_MASK) -> list[Achievement]:
     """
     Check which achievements user has earned.
 
     Args:
         user_id: User ID
+        candidate_mask: Bitmask of achievements to check (defaults to all achievements)
 
     Returns:
         List of newly earned achievements
     """
     progress = get_user_progress(user_id)
-    newly_earned = []
+    pending = candidate_mask & ~progress["earned_mask"]
 
-    for achievement in ACHIEVEMENTS:
-        # Skip if already earned
-        if achievement.id in progress["earned_achievements"]:
-            continue
+    newly = 0
+    for i, check in enumerate(_CHECK_FNS):
+        if pending >> i & 1 and check(progress):
+            newly |= 1 << i
 
-        # Check achievement requirements
-        earned = False
+    if not newly:
+        return []
 
-        if achievement.id == "first_taste" and progress["tastings_count"] >= 1 or achievement.id == "sake_explorer" and progress["tastings_count"] >= 10 or achievement.id == "sake_master" and progress["tastings_count"] >= 50 or achievement.id == "sake_legend" and progress["tastings_count"] >= 100 or achievement.id == "preference_complete" and progress["preferences_set"] or achievement.id == "ai_enthusiast" and progress["recommendations_count"] >= 5 or achievement.id == "reviewer" and progress["reviews_count"] >= 5 or achievement.id == "sake_connoisseur" and len(progress["unique_types"]) >= 8 or achievement.id == "social_drinker" and progress["social_tastings"] >= 10 or achievement.id == "sake_photographer" and progress["image_recognitions"] >= 10:
-            earned = True
-
-        if earned:
-            progress["earned_achievements"].add(achievement.id)
-            newly_earned.append(achievement)
-
-    return newly_earned
+    progress["earned_mask"] |= newly
+    return [achievement for i, achievement in enumerate(ACHIEVEMENTS) if newly >> i & 1]
 
 
 def update_user_progress(user_id: str, action: str, metadata: dict | None = None) -> None:
@@ -206,8 +256,8 @@ def update_user_progress(user_id: str, action: str, metadata: dict | None = None
     elif action == "image_recognition":
         progress["image_recognitions"] += 1
 
-    # Check for new achievements
-    newly_earned = check_achievements(user_id)
+    # Check only the achievements this action can unlock
+    newly_earned = check_achievements(user_id, _ACTION_TO_MASK.get(action, 0))
 
     # Show achievement notifications
     for achievement in newly_earned:
@@ -221,6 +271,8 @@ def show_achievement_earned(achievement: Achievement) -> None:
     Args:
         achievement: Achievement that was earned
     """
+    import streamlit as st
+
     st.balloons()
     st.toast(f"🏆 実績解除！ {achievement.icon} {achievement.title}", icon="🎉")
 
@@ -234,6 +286,31 @@ def show_achievement_earned(achievement: Achievement) -> None:
     """)
 
 
+@cache
+def _compute_panel_state(
+    earned_mask: int,
+) -> tuple[tuple[str, ...], tuple[str, ...], int, float, int]:
+    """
+    Compute derived achievement panel state for an earned-achievement snapshot.
+
+    Cached per process; the mask itself is the cache key and has at most
+    2 ** len(ACHIEVEMENTS) values, so state is only computed once per snapshot.
+
+    Args:
+        earned_mask: Bitmask of earned achievements
+
+    Returns:
+        Tuple of (earned IDs, locked IDs, earned count, completion rate, level)
+    """
+    locked_mask = _ALL_MASK ^ earned_mask
+    earned = tuple(a.id for a in ACHIEVEMENTS if earned_mask & _BIT[a.id])
+    locked = tuple(a.id for a in ACHIEVEMENTS if locked_mask & _BIT[a.id])
+    earned_count = earned_mask.bit_count()
+    total_achievements = len(ACHIEVEMENTS)
+    completion_rate = (earned_count / total_achievements * 100) if total_achievements > 0 else 0
+    return earned, locked, earned_count, completion_rate, calculate_user_level(earned_count)
+
+
 def render_achievements_panel(user_id: str) -> None:
     """
     Render achievements panel showing earned and locked achievements.
@@ -241,15 +318,17 @@ def render_achievements_panel(user_id: str) -> None:
     Args:
         user_id: User ID
     """
+    import streamlit as st
+
     progress = get_user_progress(user_id)
-    earned_ids = progress["earned_achievements"]
+    earned, locked, earned_count, completion_rate, level = _compute_panel_state(
+        progress["earned_mask"]
+    )
 
     st.markdown("### 🏆 実績")
 
     # Stats
     total_achievements = len(ACHIEVEMENTS)
-    earned_count = len(earned_ids)
-    completion_rate = (earned_count / total_achievements * 100) if total_achievements > 0 else 0
 
     col1, col2, col3 = st.columns(3)
 
@@ -260,7 +339,7 @@ def render_achievements_panel(user_id: str) -> None:
         st.metric("達成率", f"{completion_rate:.1f}%")
 
     with col3:
-        st.metric("レベル", calculate_user_level(earned_count))
+        st.metric("レベル", level)
 
     # Progress bar
     st.progress(completion_rate / 100)
@@ -271,7 +350,7 @@ def render_achievements_panel(user_id: str) -> None:
     tab1, tab2 = st.tabs(["🔓 獲得済み", "🔒 未獲得"])
 
     with tab1:
-        earned_achievements = [a for a in ACHIEVEMENTS if a.id in earned_ids]
+        earned_achievements = [ACHIEVEMENTS_BY_ID[aid] for aid in earned]
 
         if earned_achievements:
             for achievement in earned_achievements:
@@ -280,7 +359,7 @@ def render_achievements_panel(user_id: str) -> None:
             st.info("まだ実績を獲得していません。日本酒の旅を始めましょう！")
 
     with tab2:
-        locked_achievements = [a for a in ACHIEVEMENTS if a.id not in earned_ids]
+        locked_achievements = [ACHIEVEMENTS_BY_ID[aid] for aid in locked]
 
         if locked_achievements:
             for achievement in locked_achievements:
@@ -289,22 +368,21 @@ def render_achievements_panel(user_id: str) -> None:
             st.success("🎉 すべての実績を獲得しました！おめでとうございます！")
 
 
-def render_achievement_card(
-    achievement: Achievement, is_earned: bool = False, progress: dict | None = None
-) -> None:
+def _build_achievement_card_html(achievement: Achievement, is_earned: bool) -> str:
     """
-    Render a single achievement card.
+    Build the HTML for an achievement card.
 
     Args:
         achievement: Achievement object
         is_earned: Whether achievement is earned
-        progress: User progress data (for showing progress to locked achievements)
+
+    Returns:
+        Card HTML
     """
     opacity = "1.0" if is_earned else "0.5"
     border_color = "var(--success-color)" if is_earned else "var(--border-color)"
 
-    st.markdown(
-        f"""
+    return f"""
     <div style="
         background: var(--bg-card);
         padding: 1rem;
@@ -325,9 +403,29 @@ def render_achievement_card(
             {'<span style="color: var(--success-color); font-weight: 600;">✓ 獲得済み</span>' if is_earned else ""}
         </div>
     </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    """
+
+
+# Card HTML is constant per achievement, so render it once at import time
+_EARNED_HTML: dict[str, str] = {a.id: _build_achievement_card_html(a, True) for a in ACHIEVEMENTS}
+_LOCKED_HTML: dict[str, str] = {a.id: _build_achievement_card_html(a, False) for a in ACHIEVEMENTS}
+
+
+def render_achievement_card(
+    achievement: Achievement, is_earned: bool = False, progress: dict | None = None
+) -> None:
+    """
+    Render a single achievement card.
+
+    Args:
+        achievement: Achievement object
+        is_earned: Whether achievement is earned
+        progress: User progress data (for showing progress to locked achievements)
+    """
+    import streamlit as st
+
+    html = _EARNED_HTML if is_earned else _LOCKED_HTML
+    st.markdown(html[achievement.id], unsafe_allow_html=True)
 
     # Show progress for locked achievements
     if not is_earned and progress:
@@ -349,22 +447,8 @@ def get_achievement_progress(achievement: Achievement, progress: dict) -> int |
     Returns:
         Current progress value or None
     """
-    if achievement.id == "first_taste" or achievement.id in ["sake_explorer", "sake_master", "sake_legend"]:
-        return progress["tastings_count"]
-    elif achievement.id == "preference_complete":
-        return 1 if progress["preferences_set"] else 0
-    elif achievement.id == "ai_enthusiast":
-        return progress["recommendations_count"]
-    elif achievement.id == "reviewer":
-        return progress["reviews_count"]
-    elif achievement.id == "sake_connoisseur":
-        return len(progress["unique_types"])
-    elif achievement.id == "social_drinker":
-        return progress["social_tastings"]
-    elif achievement.id == "sake_photographer":
-        return progress["image_recognitions"]
-
-    return None
+    getter = _PROGRESS_GETTERS.get(achievement.id)
+    return getter(progress) if getter else None
 
 
 def calculate_user_level(earned_count: int) -> int:
@@ -387,9 +471,10 @@ def render_user_stats_widget(user_id: str) -> None:
     Args:
         user_id: User ID
     """
+    import streamlit as st
+
     progress = get_user_progress(user_id)
-    earned_count = len(progress["earned_achievements"])
-    level = calculate_user_level(earned_count)
+    _, _, earned_count, _, level = _compute_panel_state(progress["earned_mask"])
 
     st.markdown(
         f"""
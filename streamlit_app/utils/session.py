@@ -25,9 +25,9 @@ class SessionManager:
     KEY_AGENT_SESSION_ID = "agent_session_id"
 
     @staticmethod
-    def init():
-        """Initialize session state with default values."""
-        defaults = {
+    def _defaults() -> dict[str, Any]:
+        """Default session values, with fresh containers on every call."""
+        return {
             SessionManager.KEY_AUTHENTICATED: False,
             SessionManager.KEY_USER_ID: None,
             SessionManager.KEY_USER_EMAIL: None,
@@ -40,7 +40,10 @@ class SessionManager:
             SessionManager.KEY_AGENT_SESSION_ID: None,
         }
 
-        for key, default_value in defaults.items():
+    @staticmethod
+    def init():
+        """Initialize session state with default values."""
+        for key, default_value in SessionManager._defaults().items():
             if key not in st.session_state:
                 st.session_state[key] = default_value
 
@@ -69,27 +72,22 @@ class SessionManager:
         refresh_token: str | None = None,
     ):
         """Set user as authenticated."""
-        st.session_state[SessionManager.KEY_AUTHENTICATED] = True
-        st.session_state[SessionManager.KEY_USER_ID] = user_id
-        st.session_state[SessionManager.KEY_USER_EMAIL] = email
-        st.session_state[SessionManager.KEY_USER_NAME] = name
-        st.session_state[SessionManager.KEY_ACCESS_TOKEN] = access_token
-        st.session_state[SessionManager.KEY_ID_TOKEN] = id_token
-        st.session_state[SessionManager.KEY_REFRESH_TOKEN] = refresh_token
+        st.session_state.update(
+            {
+                SessionManager.KEY_AUTHENTICATED: True,
+                SessionManager.KEY_USER_ID: user_id,
+                SessionManager.KEY_USER_EMAIL: email,
+                SessionManager.KEY_USER_NAME: name,
+                SessionManager.KEY_ACCESS_TOKEN: access_token,
+                SessionManager.KEY_ID_TOKEN: id_token,
+                SessionManager.KEY_REFRESH_TOKEN: refresh_token,
+            }
+        )
 
     @staticmethod
     def logout():
         """Clear authentication and reset session."""
-        st.session_state[SessionManager.KEY_AUTHENTICATED] = False
-        st.session_state[SessionManager.KEY_USER_ID] = None
-        st.session_state[SessionManager.KEY_USER_EMAIL] = None
-        st.session_state[SessionManager.KEY_USER_NAME] = None
-        st.session_state[SessionManager.KEY_ACCESS_TOKEN] = None
-        st.session_state[SessionManager.KEY_ID_TOKEN] = None
-        st.session_state[SessionManager.KEY_REFRESH_TOKEN] = None
-        st.session_state[SessionManager.KEY_USER_PREFERENCES] = {}
-        st.session_state[SessionManager.KEY_CHAT_HISTORY] = []
-        st.session_state[SessionManager.KEY_AGENT_SESSION_ID] = None
+        st.session_state.update(SessionManager._defaults())
 
     @staticmethod
     def get_user_id() -> str | None:
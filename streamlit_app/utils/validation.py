@@ -1,6 +1,36 @@
 """Sake Sensei - Input Validation"""
 
 import re
+import string
+
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+_ALLOWED_IMAGE_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "webp"})
+_UNSUPPORTED_IMAGE_FORMAT = "Unsupported format. Use: .jpg, .jpeg, .png, .webp"
+
+# C0 control characters except tab, newline and carriage return
+_CONTROL_CHAR_TABLE = dict.fromkeys(set(range(32)) - {9, 10, 13})
+
+# Password character classes, one bit each
+_PW_UPPER = 1
+_PW_LOWER = 2
+_PW_DIGIT = 4
+
+
+def _build_password_class_table() -> bytes:
+    """Map each byte to its password character-class bit (0 for non-ASCII)."""
+    table = bytearray(256)
+    for bit, chars in (
+        (_PW_UPPER, string.ascii_uppercase),
+        (_PW_LOWER, string.ascii_lowercase),
+        (_PW_DIGIT, string.digits),
+    ):
+        for char in chars.encode():
+            table[char] = bit
+    return bytes(table)
+
+
+_PW_CLASS_TABLE = _build_password_class_table()
 
 
 class ValidationError(Exception):
@@ -15,8 +45,8 @@ def validate_email(email: str) -> tuple[bool, str]:
         return False, "Email is required"
     if len(email) > 255:
         return False, "Email is too long"
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(pattern, email):
+    # Reject the common typo (no "@") without entering the regex
+    if "@" not in email or not _EMAIL_RE.match(email):
         return False, "Invalid email format"
     return True, ""
 
@@ -29,11 +59,15 @@ def validate_password(password: str) -> tuple[bool, str]:
         return False, "Password must be at least 8 characters"
     if len(password) > 128:
         return False, "Password is too long"
-    if not re.search(r"[A-Z]", password):
+    # Classify every character in a single C-level pass
+    mask = 0
+    for bit in set(password.encode("utf-8", "surrogatepass").translate(_PW_CLASS_TABLE)):
+        mask |= bit
+    if not mask & _PW_UPPER:
         return False, "Password must contain uppercase letter"
-    if not re.search(r"[a-z]", password):
+    if not mask & _PW_LOWER:
         return False, "Password must contain lowercase letter"
-    if not re.search(r"[0-9]", password):
+    if not mask & _PW_DIGIT:
         return False, "Password must contain digit"
     return True, ""
 
@@ -59,16 +93,18 @@ def validate_preferences(preferences: dict) -> tuple[bool, list[str]]:
 
 def validate_tasting_record(record: dict) -> tuple[bool, list[str]]:
     """Validate tasting record data."""
+    if "sake_name" not in record:
+        return False, ["sake_name is required"]
+    name = record["sake_name"]
     errors: list[str] = []
-    if "sake_name" not in record or not record["sake_name"]:
+    if not name:
         errors.append("sake_name is required")
-    if "sake_name" in record:
-        if not isinstance(record["sake_name"], str):
-            errors.append("sake_name must be a string")
-        elif len(record["sake_name"]) < 2:
-            errors.append("sake_name is too short")
-        elif len(record["sake_name"]) > 200:
-            errors.append("sake_name is too long")
+    if not isinstance(name, str):
+        errors.append("sake_name must be a string")
+    elif len(name) < 2:
+        errors.append("sake_name is too short")
+    elif len(name) > 200:
+        errors.append("sake_name is too long")
     return len(errors) == 0, errors
 
 
@@ -99,11 +135,9 @@ def validate_image_file(file_name: str, file_size: int, max_size_mb: int = 10) -
     if not file_name:
         return False, "No file selected"
 
-    allowed_extensions = [".jpg", ".jpeg", ".png", ".webp"]
-    file_ext = "." + file_name.split(".")[-1].lower() if "." in file_name else ""
-
-    if file_ext not in allowed_extensions:
-        return False, f"Unsupported format. Use: {', '.join(allowed_extensions)}"
+    dot = file_name.rfind(".")
+    if dot < 0 or file_name[dot + 1 :].lower() not in _ALLOWED_IMAGE_EXTENSIONS:
+        return False, _UNSUPPORTED_IMAGE_FORMAT
 
     max_size_bytes = max_size_mb * 1024 * 1024
     if file_size > max_size_bytes:
@@ -116,7 +150,6 @@ def sanitize_text_input(text: str, max_length: int = 1000) -> str:
     """Sanitize text input."""
     if not text:
         return ""
-    text = text.replace("\x00", "")
     if len(text) > max_length:
         text = text[:max_length]
-    return text.strip()
+    return text.translate(_CONTROL_CHAR_TABLE).strip()
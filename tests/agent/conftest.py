@@ -0,0 +1,26 @@
+"""
+Pytest configuration for agent tests.
+"""
+
+from pathlib import Path
+
+import pytest
+
+AGENT_DIR = Path(__file__).parent.parent.parent / "agent"
+
+
+@pytest.fixture(scope="session")
+def agent_sources() -> dict[str, str]:
+    """Agent source files read once per session."""
+    return {
+        "entrypoint": (AGENT_DIR / "entrypoint.py").read_text(),
+        "requirements": (AGENT_DIR / "requirements.txt").read_text(),
+    }
+
+
+@pytest.fixture(scope="session")
+def system_prompt_lower() -> str:
+    """Lower-cased system prompt, computed once per session."""
+    from agent.system_prompt import SAKE_SENSEI_SYSTEM_PROMPT
+
+    return SAKE_SENSEI_SYSTEM_PROMPT.lower()
@@ -1,7 +1,12 @@
 """Local agent tests without AgentCore Runtime."""
 
+import re
+
 import pytest
 
+TOOL_KEYWORDS = ("recommendation", "preference", "tasting", "brewery")
+TOOL_PATTERN = re.compile("|".join(map(re.escape, TOOL_KEYWORDS)))
+
 
 @pytest.mark.agent
 class TestAgentLocal:
@@ -16,74 +21,41 @@ class TestAgentLocal:
         assert len(SAKE_SENSEI_SYSTEM_PROMPT) > 100
         assert "sake" in SAKE_SENSEI_SYSTEM_PROMPT.lower() or "日本酒" in SAKE_SENSEI_SYSTEM_PROMPT
 
-    def test_system_prompt_contains_tools(self) -> None:
+    def test_system_prompt_contains_tools(self, system_prompt_lower: str) -> None:
         """Test system prompt mentions tools."""
-        from agent.system_prompt import SAKE_SENSEI_SYSTEM_PROMPT
-
         # Should mention MCP tools or Lambda functions
-        assert any(
-            keyword in SAKE_SENSEI_SYSTEM_PROMPT.lower()
-            for keyword in ["tool", "function", "recommendation", "mcp"]
-        )
+        assert re.search("tool|function|recommendation|mcp", system_prompt_lower)
 
-    def test_agent_entrypoint_file_exists(self) -> None:
+    def test_agent_entrypoint_file_exists(self, agent_sources: dict[str, str]) -> None:
         """Test agent entrypoint file exists."""
-        import os
-
-        entrypoint_path = os.path.join(os.path.dirname(__file__), "../../agent/entrypoint.py")
-        assert os.path.exists(entrypoint_path)
+        content = agent_sources["entrypoint"]
 
         # Check it has required imports/components
-        with open(entrypoint_path) as f:
-            content = f.read()
-            assert "BedrockAgentCoreApp" in content or "Agent" in content
-            assert "SAKE_SENSEI_SYSTEM_PROMPT" in content
+        assert "BedrockAgentCoreApp" in content or "Agent" in content
+        assert "SAKE_SENSEI_SYSTEM_PROMPT" in content
 
-    def test_agent_requirements_file_exists(self) -> None:
+    def test_agent_requirements_file_exists(self, agent_sources: dict[str, str]) -> None:
         """Test agent requirements.txt exists."""
-        import os
-
-        requirements_path = os.path.join(os.path.dirname(__file__), "../../agent/requirements.txt")
-        assert os.path.exists(requirements_path)
-
-        with open(requirements_path) as f:
-            content = f.read()
-            assert len(content) > 0
+        assert len(agent_sources["requirements"]) > 0
 
 
 @pytest.mark.agent
 class TestAgentConfiguration:
     """Test agent configuration and setup."""
 
-    def test_agent_has_system_prompt(self) -> None:
+    def test_agent_has_system_prompt(self, system_prompt_lower: str) -> None:
         """Test agent system prompt is comprehensive."""
-        from agent.system_prompt import SAKE_SENSEI_SYSTEM_PROMPT
-
         # Check for key sections
-        assert "sake sensei" in SAKE_SENSEI_SYSTEM_PROMPT.lower()
-        assert "tool" in SAKE_SENSEI_SYSTEM_PROMPT.lower()
-        assert "recommendation" in SAKE_SENSEI_SYSTEM_PROMPT.lower()
+        assert "sake sensei" in system_prompt_lower
+        assert "tool" in system_prompt_lower
+        assert "recommendation" in system_prompt_lower
 
-    def test_system_prompt_has_personality(self) -> None:
+    def test_system_prompt_has_personality(self, system_prompt_lower: str) -> None:
         """Test system prompt defines agent personality."""
-        from agent.system_prompt import SAKE_SENSEI_SYSTEM_PROMPT
-
         # Should have personality traits
-        assert any(
-            trait in SAKE_SENSEI_SYSTEM_PROMPT.lower()
-            for trait in ["knowledgeable", "friendly", "expert", "sensei"]
-        )
+        assert re.search("knowledgeable|friendly|expert|sensei", system_prompt_lower)
 
-    def test_system_prompt_lists_tools(self) -> None:
+    def test_system_prompt_lists_tools(self, system_prompt_lower: str) -> None:
         """Test system prompt lists available tools."""
-        from agent.system_prompt import SAKE_SENSEI_SYSTEM_PROMPT
-
-        # Should mention the main tools
-        tools = [
-            "recommendation",
-            "preference",
-            "tasting",
-            "brewery",
-        ]
-        for tool in tools:
-            assert tool in SAKE_SENSEI_SYSTEM_PROMPT.lower()
+        # Should mention every main tool, collected in a single scan
+        assert set(TOOL_PATTERN.findall(system_prompt_lower)) == set(TOOL_KEYWORDS)
@@ -1,7 +1,8 @@
 """Pytest configuration and fixtures for Sake Sensei tests."""
 
 import os
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -20,32 +21,49 @@ def aws_credentials() -> None:
     os.environ["AWS_DEFAULT_REGION"] = "us-west-2"
 
 
+@pytest.fixture(scope="module")
+def _moto(aws_credentials: None) -> Generator[None]:
+    """Keep moto's AWS mock installed for the whole module."""
+    with mock_aws():
+        yield
+
+
 @pytest.fixture
-def dynamodb_mock(aws_credentials: None) -> Generator[Any]:
+def dynamodb_mock(_moto: None) -> Generator[Any]:
     """Create mock DynamoDB resource."""
-    with mock_aws():
-        yield boto3.resource("dynamodb", region_name="us-west-2")
+    dynamodb = boto3.resource("dynamodb", region_name="us-west-2")
+    yield dynamodb
+
+    # Reset state between tests while the mock stays installed
+    for table in dynamodb.tables.all():
+        table.delete()
 
 
 @pytest.fixture
-def s3_mock(aws_credentials: None) -> Generator[Any]:
+def s3_mock(_moto: None) -> Generator[Any]:
     """Create mock S3 client."""
-    with mock_aws():
-        yield boto3.client("s3", region_name="us-west-2")
+    s3 = boto3.client("s3", region_name="us-west-2")
+    yield s3
+
+    # Reset state between tests while the mock stays installed
+    for bucket in s3.list_buckets()["Buckets"]:
+        for obj in s3.list_objects_v2(Bucket=bucket["Name"]).get("Contents", []):
+            s3.delete_object(Bucket=bucket["Name"], Key=obj["Key"])
+        s3.delete_bucket(Bucket=bucket["Name"])
 
 
 @pytest.fixture
-def lambda_context() -> MagicMock:
-    """Create mock Lambda context."""
-    context = MagicMock()
-    context.function_name = "test-function"
-    context.function_version = "$LATEST"
-    context.invoked_function_arn = "arn:aws:lambda:us-west-2:123456789:function:test"
-    context.memory_limit_in_mb = 512
-    context.aws_request_id = "test-request-id"
-    context.log_group_name = "/aws/lambda/test-function"
-    context.log_stream_name = "test-log-stream"
-    return context
+def lambda_context() -> SimpleNamespace:
+    """Create Lambda context."""
+    return SimpleNamespace(
+        function_name="test-function",
+        function_version="$LATEST",
+        invoked_function_arn="arn:aws:lambda:us-west-2:123456789:function:test",
+        memory_limit_in_mb=512,
+        aws_request_id="test-request-id",
+        log_group_name="/aws/lambda/test-function",
+        log_stream_name="test-log-stream",
+    )
 
 
 @pytest.fixture
@@ -57,50 +75,56 @@ def mock_bedrock_client() -> Generator[MagicMock]:
         yield bedrock_mock
 
 
-@pytest.fixture
-def sample_sake_data() -> dict[str, Any]:
-    """Sample sake data for testing."""
-    return {
-        "sake_id": "test-sake-001",
-        "name": "獺祭 純米大吟醸 磨き二割三分",
-        "brewery": "旭酒造",
-        "type": "純米大吟醸",
-        "prefecture": "山口県",
-        "rice": "山田錦",
-        "polishing_ratio": 23,
-        "alcohol": 16.0,
-        "smv": 4,
-        "acidity": 1.5,
-        "sweetness": 2,
-        "richness": 3,
-        "description": "華やかな香りと繊細な味わい",
-    }
+@pytest.fixture(scope="session")
+def sample_sake_data() -> Mapping[str, Any]:
+    """Sample sake data for testing (read-only; copy with dict() before mutating)."""
+    return MappingProxyType(
+        {
+            "sake_id": "test-sake-001",
+            "name": "獺祭 純米大吟醸 磨き二割三分",
+            "brewery": "旭酒造",
+            "type": "純米大吟醸",
+            "prefecture": "山口県",
+            "rice": "山田錦",
+            "polishing_ratio": 23,
+            "alcohol": 16.0,
+            "smv": 4,
+            "acidity": 1.5,
+            "sweetness": 2,
+            "richness": 3,
+            "description": "華やかな香りと繊細な味わい",
+        }
+    )
 
 
-@pytest.fixture
-def sample_user_preferences() -> dict[str, Any]:
-    """Sample user preferences for testing."""
-    return {
-        "user_id": "test-user-001",
-        "sweetness": 3,
-        "acidity": 2,
-        "richness": 2,
-        "preferred_types": ["純米大吟醸", "純米吟醸"],
-        "preferred_temperatures": ["冷酒"],
-        "budget_range": "3000-5000",
-    }
+@pytest.fixture(scope="session")
+def sample_user_preferences() -> Mapping[str, Any]:
+    """Sample user preferences for testing (read-only; copy with dict() before mutating)."""
+    return MappingProxyType(
+        {
+            "user_id": "test-user-001",
+            "sweetness": 3,
+            "acidity": 2,
+            "richness": 2,
+            "preferred_types": ("純米大吟醸", "純米吟醸"),
+            "preferred_temperatures": ("冷酒",),
+            "budget_range": "3000-5000",
+        }
+    )
 
 
-@pytest.fixture
-def sample_tasting_record() -> dict[str, Any]:
-    """Sample tasting record for testing."""
-    return {
-        "record_id": "test-record-001",
-        "user_id": "test-user-001",
-        "sake_id": "test-sake-001",
-        "rating": 4,
-        "temperature": "冷酒",
-        "paired_food": "刺身",
-        "notes": "フルーティーで飲みやすい",
-        "tasted_at": "2025-10-01T12:00:00Z",
-    }
+@pytest.fixture(scope="session")
+def sample_tasting_record() -> Mapping[str, Any]:
+    """Sample tasting record for testing (read-only; copy with dict() before mutating)."""
+    return MappingProxyType(
+        {
+            "record_id": "test-record-001",
+            "user_id": "test-user-001",
+            "sake_id": "test-sake-001",
+            "rating": 4,
+            "temperature": "冷酒",
+            "paired_food": "刺身",
+            "notes": "フルーティーで飲みやすい",
+            "tasted_at": "2025-10-01T12:00:00Z",
+        }
+    )
@@ -0,0 +1,22 @@
+"""
+Shared helpers for E2E tests.
+"""
+
+import pytest
+from playwright.sync_api import Locator, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+def require_visible(locator: Locator, feature: str) -> Locator:
+    """Return the first match, skipping the test if the feature is not present."""
+    first = locator.first
+    try:
+        first.wait_for(state="visible", timeout=2000)
+    except PlaywrightTimeoutError:
+        pytest.skip(f"{feature} not present")
+    return first
+
+
+def nav_link(page: Page, url_path: str) -> Locator:
+    """Sidebar link to a multipage-app page, e.g. "History" for pages/5_📚_History.py."""
+    return page.get_by_test_id("stSidebarNavLink").and_(page.locator(f'[href$="/{url_path}"]'))
@@ -4,27 +4,16 @@ E2E Tests for Authentication Flow
 Tests user registration, login, and logout functionality.
 """
 
-import os
-import time
-from datetime import datetime
+import uuid
 
 import pytest
 from playwright.sync_api import Page, expect
 
 
-@pytest.fixture(scope="session")
-def base_url() -> str:
-    """Get base URL from environment or use default."""
-    return os.getenv(
-        "BASE_URL", "http://sakese-Publi-BG2ScFFG5nfS-804827597.us-west-2.elb.amazonaws.com"
-    )
-
-
-@pytest.fixture(scope="session")
+@pytest.fixture
 def test_user_email() -> str:
     """Generate unique test user email."""
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    return f"test+{timestamp}@sakesensei.com"
+    return f"test+{uuid.uuid4().hex[:12]}@sakesensei.com"
 
 
 def test_homepage_loads(page: Page, base_url: str) -> None:
@@ -54,7 +43,7 @@ def test_user_registration_flow(page: Page, base_url: str, test_user_email: str)
 
     # Click signup button
     page.get_by_role("button", name="✨ 新規登録").click()
-    time.sleep(2)
+    expect(page.locator('input[placeholder="山田 太郎"]')).to_be_visible()
 
     # Fill registration form
     page.fill('input[placeholder="山田 太郎"]', "Test User")
@@ -69,7 +58,6 @@ def test_user_registration_flow(page: Page, base_url: str, test_user_email: str)
 
     # Submit form - use the primary form submit button
     page.get_by_test_id("stBaseButton-primaryFormSubmit").click()
-    time.sleep(3)
 
     # Check for success message or confirmation form
     # Note: Actual email confirmation would require email access
@@ -83,7 +71,7 @@ def test_login_with_test_account(page: Page, base_url: str) -> None:
 
     # Click login button
     page.get_by_role("button", name="🔐 ログイン").click()
-    time.sleep(3)
+    expect(page.get_by_test_id("stBaseButton-primaryFormSubmit")).to_be_visible()
 
     # Fill login form
     page.fill('input[placeholder="your.email@example.com"]', "test@sakesensei.com")
@@ -93,73 +81,33 @@ def test_login_with_test_account(page: Page, base_url: str) -> None:
     # Submit form - use primary form submit button
     page.get_by_test_id("stBaseButton-primaryFormSubmit").click()
 
-    # Wait for page reload after successful login
-    page.wait_for_load_state("networkidle", timeout=30000)
-    time.sleep(3)
-
     # Check if logged in - look for home page or user info
-    expect(page.locator("text=ホーム")).to_be_visible(timeout=10000)
-
-
-def test_user_info_displayed_after_login(page: Page, base_url: str) -> None:
-    """Test that user info is displayed after login."""
-    # Login first
-    page.goto(base_url)
-    page.get_by_role("button", name="🔐 ログイン").click()
-    time.sleep(3)
-
-    page.fill('input[placeholder="your.email@example.com"]', "test@sakesensei.com")
-    password_input = page.locator('input[type="password"]').first
-    password_input.fill("TestPass123!@#")
-    page.get_by_test_id("stBaseButton-primaryFormSubmit").click()
+    expect(page.get_by_text("ホーム")).to_be_visible(timeout=20000)
 
-    # Wait for page reload
-    page.wait_for_load_state("networkidle", timeout=30000)
-    time.sleep(2)
 
-    # Check main app page is displayed
-    expect(page.locator("text=ホーム")).to_be_visible(timeout=10000)
-
-
-def test_logout_functionality(page: Page, base_url: str) -> None:
+def test_logout_functionality(fresh_logged_in_page: Page) -> None:
     """Test logout functionality."""
-    # Login first
-    page.goto(base_url)
-    page.get_by_role("button", name="🔐 ログイン").click()
-    time.sleep(3)
-
-    page.fill('input[placeholder="your.email@example.com"]', "test@sakesensei.com")
-    password_input = page.locator('input[type="password"]').first
-    password_input.fill("TestPass123!@#")
-    page.get_by_test_id("stBaseButton-primaryFormSubmit").click()
-
-    # Wait for page reload
-    page.wait_for_load_state("networkidle", timeout=30000)
-    time.sleep(2)
-
-    # Verify logged in
-    expect(page.locator("text=ホーム")).to_be_visible(timeout=10000)
+    page = fresh_logged_in_page
 
     # Click logout
     page.get_by_role("button", name="🚪 ログアウト").click()
-    time.sleep(3)
 
     # Verify back to welcome page
     expect(page.locator("text=ようこそ Sake Sensei へ")).to_be_visible(timeout=10000)
 
 
+@pytest.mark.browser_context_args(storage_state=None)
 def test_invalid_login_shows_error(page: Page, base_url: str) -> None:
     """Test that invalid login credentials show error."""
     page.goto(base_url)
     page.get_by_role("button", name="🔐 ログイン").click()
-    time.sleep(3)
+    expect(page.get_by_test_id("stBaseButton-primaryFormSubmit")).to_be_visible()
 
     page.fill('input[placeholder="your.email@example.com"]', "invalid@example.com")
     password_input = page.locator('input[type="password"]').first
     password_input.fill("WrongPassword123!@#")
 
     page.get_by_test_id("stBaseButton-primaryFormSubmit").click()
-    time.sleep(5)
 
     # Check for error message - any error is acceptable
     expect(page.locator('div[data-testid="stAlert"]')).to_be_visible(timeout=15000)
@@ -4,41 +4,23 @@ E2E Tests for Error Handling and Edge Cases
 Tests application behavior under error conditions.
 """
 
-import os
-import time
+import re
 
 import pytest
 from playwright.sync_api import Page, expect
 
+from tests.e2e.helpers import nav_link, require_visible
 
-@pytest.fixture(scope="session")
-def base_url() -> str:
-    """Get base URL from environment or use default."""
-    return os.getenv(
-        "BASE_URL", "http://sakese-Publi-BG2ScFFG5nfS-804827597.us-west-2.elb.amazonaws.com"
-    )
-
-
-def login_helper(page: Page, base_url: str) -> None:
-    """Helper function to login."""
-    page.goto(base_url)
-    page.get_by_role("button", name="🔐 ログイン").click()
-    time.sleep(2)
-
-    page.fill('input[placeholder="your.email@example.com"]', "test@sakesensei.com")
-    password_input = page.locator('input[type="password"]').first
-    password_input.fill("TestPass123!@#")
-    page.get_by_test_id("stBaseButton-primaryFormSubmit").click()
-
-    page.wait_for_load_state("networkidle", timeout=30000)
-    time.sleep(3)
+# Upper bound for an agent round trip; web-first waits return as soon as it lands
+AI_RESPONSE_TIMEOUT = 30000
 
 
+@pytest.mark.browser_context_args(storage_state=None)
 def test_invalid_login_credentials(page: Page, base_url: str) -> None:
     """Test login with invalid credentials."""
     page.goto(base_url)
     page.get_by_role("button", name="🔐 ログイン").click()
-    time.sleep(2)
+    expect(page.get_by_test_id("stBaseButton-primaryFormSubmit")).to_be_visible()
 
     # Enter invalid credentials
     page.fill('input[placeholder="your.email@example.com"]', "invalid@example.com")
@@ -46,277 +28,205 @@ def test_invalid_login_credentials(page: Page, base_url: str) -> None:
     password_input.fill("WrongPassword123")
 
     page.get_by_test_id("stBaseButton-primaryFormSubmit").click()
-    time.sleep(3)
 
     # Should show error message
     error_message = page.locator('div[data-testid="stAlert"]').or_(page.locator("text=エラー"))
-    if error_message.count() > 0:
-        expect(error_message.first).to_be_visible()
+    expect(error_message.first).to_be_visible(timeout=15000)
 
 
+@pytest.mark.browser_context_args(storage_state=None)
 def test_empty_login_form(page: Page, base_url: str) -> None:
     """Test submitting empty login form."""
     page.goto(base_url)
     page.get_by_role("button", name="🔐 ログイン").click()
-    time.sleep(2)
+    expect(page.get_by_test_id("stBaseButton-primaryFormSubmit")).to_be_visible()
 
     # Try to submit without filling fields
     page.get_by_test_id("stBaseButton-primaryFormSubmit").click()
-    time.sleep(2)
 
     # Should show validation error or prevent submission
-    assert page.url is not None
+    expect(page.locator("text=メールアドレスとパスワードを入力してください")).to_be_visible()
 
 
-def test_network_timeout_handling(page: Page, base_url: str) -> None:
+def test_network_timeout_handling(logged_in_page: Page) -> None:
     """Test application behavior under network timeout."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Try AI chat (might timeout if backend is slow)
-    chat_input = page.locator('textarea[placeholder*="質問"]').first
-    if chat_input.is_visible():
-        chat_input.fill("これは長いリクエストです" * 100)  # Very long input
-
-        submit_button = page.get_by_role("button", name="送信")
-        submit_button.click()
+    chat_input = require_visible(page.locator('textarea[placeholder*="質問"]'), "AI chat")
+    chat_input.fill("これは長いリクエストです" * 20)  # Long input, filled in one insertText
 
-        # Wait for response or timeout
-        time.sleep(10)
+    submit_button = page.get_by_role("button", name="送信")
+    submit_button.click()
 
-        # Should handle gracefully (either response or error message)
-        assert page.url is not None
+    # Wait for response or timeout
+    expect(page.locator("text=あなた: これは長いリクエストです").first).to_be_visible(
+        timeout=AI_RESPONSE_TIMEOUT
+    )
 
 
-def test_invalid_character_input(page: Page, base_url: str) -> None:
+def test_invalid_character_input(logged_in_page: Page) -> None:
     """Test handling of special characters and SQL injection attempts."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to rating page
-    rating_link = page.locator("text=⭐").or_(page.locator("text=評価"))
-    if rating_link.count() > 0:
-        rating_link.first.click()
-        time.sleep(2)
-
-        # Try SQL injection-like input
-        sake_input = page.locator('input[placeholder*="日本酒"]').or_(
-            page.locator('input[placeholder*="銘柄"]')
-        )
-        if sake_input.count() > 0:
-            sake_input.first.fill("'; DROP TABLE users; --")
-            time.sleep(1)
-
-            submit_button = page.get_by_role("button", name="保存").or_(
-                page.get_by_role("button", name="送信")
-            )
-            if submit_button.count() > 0:
-                submit_button.first.click()
-                time.sleep(3)
-
-                # Should handle safely (sanitize input)
-                assert page.url is not None
-
+    require_visible(nav_link(page, "Rating"), "Rating page").click()
+    expect(page).to_have_url(re.compile("Rating"))
 
-def test_xss_attempt_prevention(page: Page, base_url: str) -> None:
-    """Test XSS attack prevention."""
-    login_helper(page, base_url)
-
-    # Try XSS in chat
-    chat_input = page.locator('textarea[placeholder*="質問"]').first
-    if chat_input.is_visible():
-        chat_input.fill("<script>alert('XSS')</script>")
-
-        submit_button = page.get_by_role("button", name="送信")
-        submit_button.click()
-        time.sleep(3)
+    # Try SQL injection-like input
+    sake_input = require_visible(
+        page.locator('input[placeholder*="日本酒"], input[placeholder*="銘柄"]'),
+        "Sake name input",
+    )
+    sake_input.fill("'; DROP TABLE users; --")
 
-        # Should not execute script
-        # Check that no alert appeared (page should still be functional)
-        assert page.url is not None
+    submit_button = require_visible(
+        page.get_by_role("button", name="保存").or_(page.get_by_role("button", name="送信")),
+        "Rating submit button",
+    )
+    submit_button.click()
+    expect(page.locator('div[data-testid="stAlert"]').first).to_be_visible(timeout=15000)
 
 
 def test_session_expiration_handling(page: Page, base_url: str) -> None:
     """Test behavior when session expires."""
-    login_helper(page, base_url)
-
-    # Clear cookies to simulate session expiration
-    page.context.clear_cookies()
-    time.sleep(1)
-
-    # Try to access protected feature
-    chat_input = page.locator('textarea[placeholder*="質問"]').first
-    if chat_input.is_visible():
-        chat_input.fill("テスト")
-
-        submit_button = page.get_by_role("button", name="送信")
-        submit_button.click()
-        time.sleep(3)
+    # A fresh browser context carries no session state, which is what the
+    # app sees once a session has expired
+    page.goto(base_url)
 
-        # Should redirect to login or show error
-        assert page.url is not None
+    # Protected features should not be reachable; login is offered instead
+    expect(page.get_by_role("button", name="🔐 ログイン")).to_be_visible()
+    expect(page.locator('textarea[placeholder*="質問"]')).to_have_count(0)
 
 
-def test_concurrent_request_handling(page: Page, base_url: str) -> None:
+def test_concurrent_request_handling(logged_in_page: Page) -> None:
     """Test handling of concurrent requests."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Try to submit multiple requests quickly
-    chat_input = page.locator('textarea[placeholder*="質問"]').first
-    if chat_input.is_visible():
-        submit_button = page.get_by_role("button", name="送信")
-
-        for i in range(3):
-            chat_input.fill(f"質問 {i + 1}")
-            submit_button.click()
-            time.sleep(0.5)  # Quick succession
+    chat_input = require_visible(page.locator('textarea[placeholder*="質問"]'), "AI chat")
+    submit_button = page.get_by_role("button", name="送信")
 
-        time.sleep(5)
+    for i in range(3):
+        chat_input.fill(f"質問 {i + 1}")
+        submit_button.click(no_wait_after=True, force=True)
 
-        # Should handle all requests gracefully
-        assert page.url is not None
+    expect(page.locator("text=あなた: 質問 3")).to_be_visible(timeout=AI_RESPONSE_TIMEOUT)
 
 
-def test_invalid_file_upload(page: Page, base_url: str) -> None:
+def test_invalid_file_upload(logged_in_page: Page) -> None:
     """Test uploading invalid file type."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to image recognition page
-    image_link = page.locator("text=📸").or_(page.locator("text=画像"))
-    if image_link.count() > 0:
-        image_link.first.click()
-        time.sleep(2)
+    require_visible(
+        page.locator("text=📸").or_(page.locator("text=画像")), "Image recognition page"
+    ).click()
+    expect(page).to_have_url(re.compile("Image_Recognition"))
 
-        # Look for file upload
-        file_input = page.locator('input[type="file"]')
-        if file_input.count() > 0:
-            # Try to upload invalid file (would need actual test file)
-            # For now, just verify upload exists
-            expect(file_input.first).to_be_visible()
+    # Look for file upload
+    # Try to upload invalid file (would need actual test file)
+    # For now, just verify upload exists
+    require_visible(page.locator('input[type="file"]'), "File uploader")
 
 
-def test_oversized_file_upload(page: Page, base_url: str) -> None:
+def test_oversized_file_upload(logged_in_page: Page) -> None:
     """Test uploading file that exceeds size limit."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to image recognition page
-    image_link = page.locator("text=📸").or_(page.locator("text=画像"))
-    if image_link.count() > 0:
-        image_link.first.click()
-        time.sleep(2)
+    require_visible(
+        page.locator("text=📸").or_(page.locator("text=画像")), "Image recognition page"
+    ).click()
+    expect(page).to_have_url(re.compile("Image_Recognition"))
 
-        # Check for file size warnings
-        size_warning = page.locator("text=MB").or_(page.locator("text=サイズ"))
-        # Size limit should be documented
-        assert page.url is not None
+    # Check for file size warnings
+    size_warning = page.locator("text=MB").or_(page.locator("text=サイズ"))
+    # Size limit should be documented
+    require_visible(size_warning, "File size limit")
 
 
-def test_browser_back_button(page: Page, base_url: str) -> None:
+def test_browser_back_button(fresh_logged_in_page: Page) -> None:
     """Test application behavior with browser back button."""
-    login_helper(page, base_url)
+    page = fresh_logged_in_page
 
     # Navigate through pages
-    rating_link = page.locator("text=⭐")
-    if rating_link.count() > 0:
-        rating_link.first.click()
-        time.sleep(2)
+    require_visible(nav_link(page, "Rating"), "Rating page").click()
+    expect(page).to_have_url(re.compile("Rating"))
 
-        # Go back
-        page.go_back()
-        time.sleep(2)
+    # Go back
+    page.go_back()
+    expect(page).not_to_have_url(re.compile("Rating"))
 
-        # Should return to previous page gracefully
-        assert page.url is not None
 
-
-def test_browser_refresh(page: Page, base_url: str) -> None:
+def test_browser_refresh(fresh_logged_in_page: Page) -> None:
     """Test application behavior on page refresh."""
-    login_helper(page, base_url)
+    page = fresh_logged_in_page
 
     # Navigate to a page
-    rating_link = page.locator("text=⭐")
-    if rating_link.count() > 0:
-        rating_link.first.click()
-        time.sleep(2)
-
-        # Refresh page
-        page.reload()
-        time.sleep(3)
-
-        # Should maintain state or redirect properly
-        assert page.url is not None
-
-
-def test_api_error_display(page: Page, base_url: str) -> None:
-    """Test that API errors are displayed user-friendly."""
-    login_helper(page, base_url)
-
-    # Try action that might cause API error
-    chat_input = page.locator('textarea[placeholder*="質問"]').first
-    if chat_input.is_visible():
-        # Send request that might fail
-        chat_input.fill("テストエラー")
-        submit_button = page.get_by_role("button", name="送信")
-        submit_button.click()
-        time.sleep(5)
-
-        # If error occurs, should be user-friendly
-        error_alerts = page.locator('div[data-testid="stAlert"]').all()
-        for alert in error_alerts:
-            if alert.is_visible():
-                error_text = alert.text_content() or ""
-                # Should not show raw stack traces or technical jargon
-                assert "Traceback" not in error_text, "Raw error exposed to user"
-                assert "Exception" not in error_text or "エラー" in error_text
-
-
-def test_empty_search_query(page: Page, base_url: str) -> None:
+    require_visible(nav_link(page, "Rating"), "Rating page").click()
+    expect(page).to_have_url(re.compile("Rating"))
+
+    # Refresh page
+    page.reload()
+    expect(page.locator('[data-testid="stApp"]')).to_be_visible()
+
+
+def test_empty_search_query(logged_in_page: Page) -> None:
     """Test handling of empty search queries."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Try empty AI chat
-    chat_input = page.locator('textarea[placeholder*="質問"]').first
-    if chat_input.is_visible():
-        # Submit empty query
-        submit_button = page.get_by_role("button", name="送信")
-        submit_button.click()
-        time.sleep(2)
+    chat_input = require_visible(page.locator('textarea[placeholder*="質問"]'), "AI chat")
+
+    # Submit empty query
+    submit_button = page.get_by_role("button", name="送信")
+    submit_button.click()
 
-        # Should show validation message or prevent submission
-        assert page.url is not None
+    # Should show validation message or prevent submission
+    expect(chat_input).to_be_visible()
 
 
-def test_rapid_button_clicking(page: Page, base_url: str) -> None:
+def test_rapid_button_clicking(logged_in_page: Page) -> None:
     """Test application doesn't break with rapid button clicks."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Rapidly click submit button
-    chat_input = page.locator('textarea[placeholder*="質問"]').first
-    if chat_input.is_visible():
-        chat_input.fill("テスト")
+    chat_input = require_visible(page.locator('textarea[placeholder*="質問"]'), "AI chat")
+    chat_input.fill("テスト")
 
-        submit_button = page.get_by_role("button", name="送信")
+    submit_button = page.get_by_role("button", name="送信")
 
-        # Click multiple times rapidly
-        for _ in range(5):
-            submit_button.click()
+    # Click multiple times rapidly
+    for _ in range(5):
+        submit_button.click(no_wait_after=True, force=True)
 
-        time.sleep(3)
+    expect(page.locator("text=あなた: テスト").first).to_be_visible(timeout=AI_RESPONSE_TIMEOUT)
 
-        # Should handle gracefully (debounce or queue)
-        assert page.url is not None
 
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param("<script>alert('XSS')</script>", id="xss"),
+        pytest.param("🍶🌸日本酒について教えて😊", id="unicode"),
+        pytest.param("テストエラー", id="api-error"),
+    ],
+)
+def test_chat_payload_handling(logged_in_page: Page, payload: str) -> None:
+    """Test that unusual chat input is handled safely and errors stay user-friendly."""
+    page = logged_in_page
 
-def test_unicode_input_handling(page: Page, base_url: str) -> None:
-    """Test handling of various Unicode characters."""
-    login_helper(page, base_url)
+    chat_input = require_visible(page.locator('textarea[placeholder*="質問"]'), "AI chat")
+    chat_input.fill(payload)
 
-    # Test emoji and special Unicode
-    chat_input = page.locator('textarea[placeholder*="質問"]').first
-    if chat_input.is_visible():
-        chat_input.fill("🍶🌸日本酒について教えて😊")
+    submit_button = page.get_by_role("button", name="送信")
+    submit_button.click()
 
-        submit_button = page.get_by_role("button", name="送信")
-        submit_button.click()
-        time.sleep(5)
+    # Markup is shown as text rather than executed, and Unicode survives the round trip
+    expect(page.get_by_text(f"あなた: {payload}").first).to_be_visible(timeout=AI_RESPONSE_TIMEOUT)
 
-        # Should handle Unicode properly
-        assert page.url is not None
+    # If error occurs, should be user-friendly
+    alerts = page.locator('div[data-testid="stAlert"]')
+    # Should not show raw stack traces or technical jargon
+    expect(alerts.filter(has_text="Traceback")).to_have_count(0)
+    expect(alerts.filter(has_text="Exception").filter(has_not_text="エラー")).to_have_count(0)
@@ -4,290 +4,229 @@ E2E Tests for Tasting History View
 Tests history display, filtering, and analytics features.
 """
 
-import os
-import time
-
-import pytest
 from playwright.sync_api import Page, expect
 
+from tests.e2e.helpers import nav_link, require_visible
 
-@pytest.fixture(scope="session")
-def base_url() -> str:
-    """Get base URL from environment or use default."""
-    return os.getenv(
-        "BASE_URL", "http://sakese-Publi-BG2ScFFG5nfS-804827597.us-west-2.elb.amazonaws.com"
-    )
-
-
-def login_helper(page: Page, base_url: str) -> None:
-    """Helper function to login."""
-    page.goto(base_url)
-    page.get_by_role("button", name="🔐 ログイン").click()
-    time.sleep(2)
 
-    page.fill('input[placeholder="your.email@example.com"]', "test@sakesensei.com")
-    password_input = page.locator('input[type="password"]').first
-    password_input.fill("TestPass123!@#")
-    page.get_by_test_id("stBaseButton-primaryFormSubmit").click()
+def wait_for_history_page(page: Page) -> None:
+    """Wait until the history page has rendered through its last section."""
+    expect(page.locator("text=📤 エクスポート")).to_be_visible(timeout=15000)
 
-    page.wait_for_load_state("networkidle", timeout=30000)
-    time.sleep(3)
 
-
-def test_history_page_accessible(page: Page, base_url: str) -> None:
+def test_history_page_accessible(logged_in_page: Page) -> None:
     """Test that history page is accessible."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Look for history page link
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(2)
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
 
-        # Verify page loaded
-        expect(page.locator("text=履歴").or_(page.locator("text=History"))).to_be_visible()
+    # Verify page loaded
+    expect(page.locator(".main-header")).to_have_text("📚 テイスティング履歴")
 
 
-def test_history_displays_records(page: Page, base_url: str) -> None:
+def test_history_displays_records(logged_in_page: Page) -> None:
     """Test that history displays tasting records."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
-
-        # Check for record display (could be empty if no records)
-        # Look for typical elements: table, list, or empty message
-        has_records = (
-            page.locator("table").count() > 0
-            or page.locator("text=日本酒").count() > 0
-            or page.locator("text=まだ記録がありません").count() > 0
-        )
-        assert has_records, "History page should show records or empty message"
-
-
-def test_history_shows_statistics(page: Page, base_url: str) -> None:
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
+
+    # Check for record display (could be empty if no records)
+    # Look for typical elements: table, list, or empty message
+    records_or_empty = (
+        page.locator("table")
+        .or_(page.locator("text=日本酒"))
+        .or_(page.locator("text=まだ記録がありません"))
+    )
+    expect(records_or_empty.first).to_be_visible()
+
+
+def test_history_shows_statistics(logged_in_page: Page) -> None:
     """Test that history page shows statistics."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
 
-        # Look for statistics elements
-        stats_indicators = [
-            page.locator("text=合計"),
-            page.locator("text=平均"),
-            page.locator("text=統計"),
-        ]
-
-        has_stats = any(indicator.count() > 0 for indicator in stats_indicators)
-        # Stats may or may not be present depending on implementation
-        assert page.url is not None  # Just verify page loaded
+    # Look for statistics elements
+    stats_indicators = (
+        page.locator("text=合計").or_(page.locator("text=平均")).or_(page.locator("text=統計"))
+    )
+    require_visible(stats_indicators, "History statistics")
 
 
-def test_history_date_sorting(page: Page, base_url: str) -> None:
+def test_history_date_sorting(logged_in_page: Page) -> None:
     """Test that history records can be sorted by date."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
 
-        # Look for sort controls
-        sort_button = page.locator("text=並び替え").or_(page.locator("text=Sort"))
-        if sort_button.count() > 0:
-            sort_button.first.click()
-            time.sleep(1)
+    # Look for sort controls
+    sort_button = page.locator("text=並び替え").or_(page.locator("text=Sort"))
+    require_visible(sort_button, "Sort button").click()
+    wait_for_history_page(page)
 
-            # Verify no errors
-            assert page.url is not None
 
-
-def test_history_filter_by_rating(page: Page, base_url: str) -> None:
+def test_history_filter_by_rating(logged_in_page: Page) -> None:
     """Test that history can be filtered by rating."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
 
-        # Look for filter controls
-        filter_element = page.locator("text=フィルター").or_(page.locator("text=Filter"))
-        if filter_element.count() > 0:
-            expect(filter_element.first).to_be_visible()
+    # Look for filter controls
+    filter_element = page.locator("text=フィルター").or_(page.locator("text=Filter"))
+    require_visible(filter_element, "Filter element")
 
 
-def test_history_search_functionality(page: Page, base_url: str) -> None:
+def test_history_search_functionality(logged_in_page: Page) -> None:
     """Test that history has search functionality."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
-
-        # Look for search input
-        search_input = page.locator('input[placeholder*="検索"]').or_(
-            page.locator('input[placeholder*="Search"]')
-        )
-        if search_input.count() > 0:
-            search_input.first.fill("獺祭")
-            time.sleep(2)
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
 
-            # Verify search executed (no need to check results)
-            assert page.url is not None
+    # Look for search input
+    search_input = page.locator('input[placeholder*="検索"], input[placeholder*="Search"]')
+    require_visible(search_input, "Search input").fill("獺祭")
+    wait_for_history_page(page)
 
 
-def test_history_export_functionality(page: Page, base_url: str) -> None:
+def test_history_export_functionality(logged_in_page: Page) -> None:
     """Test that history can be exported."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
 
-        # Look for export button
-        export_button = page.locator("text=エクスポート").or_(page.locator("text=Export"))
-        if export_button.count() > 0:
-            export_button.first.click()
-            time.sleep(2)
+    # CSV export is only offered once there are records
+    export_button = page.get_by_role("button", name="📄 CSV エクスポート")
+    require_visible(export_button, "CSV export button")
 
-            # Verify export triggered (file download or modal)
-            assert page.url is not None
+    with page.expect_download(timeout=10000) as download_info:
+        export_button.click()
 
+    download = download_info.value
+    assert download.suggested_filename.endswith(".csv")
 
-def test_history_pagination(page: Page, base_url: str) -> None:
+
+def test_history_pagination(logged_in_page: Page) -> None:
     """Test that history has pagination for large record sets."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
 
-        # Look for pagination controls
-        pagination = page.locator("text=次へ").or_(page.locator("text=Next"))
-        # Pagination may not exist if few records
-        assert page.url is not None
+    # Look for pagination controls
+    pagination = page.locator("text=次へ").or_(page.locator("text=Next"))
+    # Pagination may not exist if few records
+    require_visible(pagination, "Pagination")
 
 
-def test_history_record_details(page: Page, base_url: str) -> None:
+def test_history_record_details(logged_in_page: Page) -> None:
     """Test that individual record details can be viewed."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
-
-        # Look for expandable records or detail links
-        # If records exist, try to click one
-        record_rows = page.locator("tr").all() if page.locator("table").count() > 0 else []
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
 
-        if len(record_rows) > 1:  # More than just header
-            # Click on a record
-            record_rows[1].click()
-            time.sleep(2)
+    # Click on the first record, past the header row
+    record_row = page.locator("table tr").nth(1)
+    require_visible(record_row, "Tasting record").click()
+    wait_for_history_page(page)
 
-            # Should show details or navigate
-            assert page.url is not None
 
-
-def test_history_chart_visualization(page: Page, base_url: str) -> None:
+def test_history_chart_visualization(logged_in_page: Page) -> None:
     """Test that history includes chart visualization."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
 
-        # Look for chart elements
-        chart_element = page.locator('[data-testid="stVegaLiteChart"]').or_(
-            page.locator("canvas")
-        )
-        if chart_element.count() > 0:
-            expect(chart_element.first).to_be_visible()
+    # Look for chart elements
+    chart_element = page.locator('[data-testid="stVegaLiteChart"], canvas')
+    require_visible(chart_element, "Chart element")
 
 
-def test_history_favorite_marking(page: Page, base_url: str) -> None:
+def test_history_favorite_marking(logged_in_page: Page) -> None:
     """Test that records can be marked as favorite."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
 
-        # Look for favorite/star buttons
-        favorite_button = page.locator("text=★").or_(page.locator("text=お気に入り"))
-        # Favorite feature may not be implemented
-        assert page.url is not None
+    # Look for favorite/star buttons
+    favorite_button = page.locator("text=★").or_(page.locator("text=お気に入り"))
+    # Favorite feature may not be implemented
+    require_visible(favorite_button, "Favorite button")
 
 
-def test_history_delete_record(page: Page, base_url: str) -> None:
+def test_history_delete_record(logged_in_page: Page) -> None:
     """Test that records can be deleted."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
 
-        # Look for delete buttons
-        delete_button = page.locator("text=削除").or_(page.locator("text=Delete"))
-        if delete_button.count() > 0:
-            # Don't actually delete, just verify button exists
-            expect(delete_button.first).to_be_visible()
+    # Look for delete buttons
+    delete_button = page.locator("text=削除").or_(page.locator("text=Delete"))
+    require_visible(delete_button, "Delete button")
+    # Don't actually delete, just verify button exists
+    expect(delete_button.first).to_be_visible()
 
 
-def test_history_empty_state(page: Page, base_url: str) -> None:
+def test_history_empty_state(logged_in_page: Page) -> None:
     """Test that history shows appropriate empty state."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
 
-        # Check for either records or empty message
-        has_content = (
-            page.locator("table").count() > 0
-            or page.locator("text=まだ").count() > 0
-            or page.locator("text=No records").count() > 0
-        )
-        assert has_content, "History should show content or empty state"
+    # Check for either records or empty message
+    content_or_empty = (
+        page.locator("table").or_(page.locator("text=まだ")).or_(page.locator("text=No records"))
+    )
+    expect(content_or_empty.first).to_be_visible()
 
 
-def test_history_time_period_filter(page: Page, base_url: str) -> None:
+def test_history_time_period_filter(logged_in_page: Page) -> None:
     """Test filtering history by time period."""
-    login_helper(page, base_url)
+    page = logged_in_page
 
     # Navigate to history page
-    history_link = page.locator("text=📚").or_(page.locator("text=履歴"))
-    if history_link.count() > 0:
-        history_link.first.click()
-        time.sleep(3)
-
-        # Look for date range selectors
-        date_filter = page.locator('[type="date"]').or_(page.locator("text=期間"))
-        # Date filtering may not be implemented
-        assert page.url is not None
+    history_link = nav_link(page, "History")
+    require_visible(history_link, "History link").click()
+    wait_for_history_page(page)
+
+    # Look for date range selectors
+    date_filter = page.locator('[type="date"]').or_(page.locator("text=期間"))
+    # Date filtering may not be implemented
+    require_visible(date_filter, "Date filter")
@@ -1,12 +1,16 @@
 """Sake test fixtures."""
 
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
+# Timestamps shared by the sample records, formatted once at import
+_JAN_1_2025 = datetime(2025, 1, 1, 0, 0, 0).isoformat()
+_OCT_1_2025 = datetime(2025, 10, 1, 0, 0, 0).isoformat()
 
-def sample_sake() -> dict[str, Any]:
-    """Return sample sake data."""
-    return {
+_SAMPLE_SAKE: Mapping[str, Any] = MappingProxyType(
+    {
         "sake_id": "sake-001",
         "name": "獺祭 純米大吟醸 磨き二割三分",
         "brewery_id": "brewery-001",
@@ -19,30 +23,37 @@ def sample_sake() -> dict[str, Any]:
         "sweetness": 2,
         "richness": 2,
         "aroma_intensity": 5,
-        "flavor_profile": {
-            "fruity": 5,
-            "floral": 4,
-            "rice": 3,
-            "spicy": 1,
-            "umami": 2,
-        },
+        "flavor_profile": MappingProxyType(
+            {
+                "fruity": 5,
+                "floral": 4,
+                "rice": 3,
+                "spicy": 1,
+                "umami": 2,
+            }
+        ),
         "description": "華やかな吟醸香と繊細な味わいが特徴の最高級純米大吟醸。",
         "price": 5280,
         "volume_ml": 720,
-        "food_pairings": ["刺身", "白身魚", "フルーツ"],
-        "serving_temperature": ["冷やして"],
+        "food_pairings": ("刺身", "白身魚", "フルーツ"),
+        "serving_temperature": ("冷やして",),
         "image_url": "https://example.com/sake-001.jpg",
         "average_rating": 4.5,
         "rating_count": 120,
-        "created_at": datetime(2025, 1, 1, 0, 0, 0).isoformat(),
-        "updated_at": datetime(2025, 10, 1, 0, 0, 0).isoformat(),
+        "created_at": _JAN_1_2025,
+        "updated_at": _OCT_1_2025,
     }
+)
 
 
-def sample_sake_list() -> list[dict[str, Any]]:
-    """Return list of sample sake data."""
-    return [
-        sample_sake(),
+def sample_sake() -> Mapping[str, Any]:
+    """Return sample sake data (read-only; copy with dict() before mutating)."""
+    return _SAMPLE_SAKE
+
+
+_SAMPLE_SAKE_LIST: tuple[Mapping[str, Any], ...] = (
+    _SAMPLE_SAKE,
+    MappingProxyType(
         {
             "sake_id": "sake-002",
             "name": "久保田 萬寿",
@@ -56,24 +67,28 @@ def sample_sake_list() -> list[dict[str, Any]]:
             "sweetness": 3,
             "richness": 3,
             "aroma_intensity": 4,
-            "flavor_profile": {
-                "fruity": 4,
-                "floral": 3,
-                "rice": 4,
-                "spicy": 2,
-                "umami": 3,
-            },
+            "flavor_profile": MappingProxyType(
+                {
+                    "fruity": 4,
+                    "floral": 3,
+                    "rice": 4,
+                    "spicy": 2,
+                    "umami": 3,
+                }
+            ),
             "description": "ふくよかな香りと深い味わいの純米大吟醸。",
             "price": 3850,
             "volume_ml": 720,
-            "food_pairings": ["焼き魚", "天ぷら", "鍋料理"],
-            "serving_temperature": ["冷やして", "常温"],
+            "food_pairings": ("焼き魚", "天ぷら", "鍋料理"),
+            "serving_temperature": ("冷やして", "常温"),
             "image_url": "https://example.com/sake-002.jpg",
             "average_rating": 4.3,
             "rating_count": 95,
-            "created_at": datetime(2025, 1, 1, 0, 0, 0).isoformat(),
-            "updated_at": datetime(2025, 10, 1, 0, 0, 0).isoformat(),
-        },
+            "created_at": _JAN_1_2025,
+            "updated_at": _OCT_1_2025,
+        }
+    ),
+    MappingProxyType(
         {
             "sake_id": "sake-003",
             "name": "八海山 純米吟醸",
@@ -87,30 +102,37 @@ def sample_sake_list() -> list[dict[str, Any]]:
             "sweetness": 2,
             "richness": 3,
             "aroma_intensity": 3,
-            "flavor_profile": {
-                "fruity": 3,
-                "floral": 2,
-                "rice": 4,
-                "spicy": 2,
-                "umami": 3,
-            },
+            "flavor_profile": MappingProxyType(
+                {
+                    "fruity": 3,
+                    "floral": 2,
+                    "rice": 4,
+                    "spicy": 2,
+                    "umami": 3,
+                }
+            ),
             "description": "すっきりとした飲み口の純米吟醸。",
             "price": 2640,
             "volume_ml": 720,
-            "food_pairings": ["寿司", "刺身", "焼き鳥"],
-            "serving_temperature": ["冷やして", "常温"],
+            "food_pairings": ("寿司", "刺身", "焼き鳥"),
+            "serving_temperature": ("冷やして", "常温"),
             "image_url": "https://example.com/sake-003.jpg",
             "average_rating": 4.2,
             "rating_count": 150,
-            "created_at": datetime(2025, 1, 1, 0, 0, 0).isoformat(),
-            "updated_at": datetime(2025, 10, 1, 0, 0, 0).isoformat(),
-        },
-    ]
+            "created_at": _JAN_1_2025,
+            "updated_at": _OCT_1_2025,
+        }
+    ),
+)
+
 
+def sample_sake_list() -> tuple[Mapping[str, Any], ...]:
+    """Return a tuple of sample sake data (read-only; copy with dict() before mutating)."""
+    return _SAMPLE_SAKE_LIST
 
-def sample_brewery() -> dict[str, Any]:
-    """Return sample brewery data."""
-    return {
+
+_SAMPLE_BREWERY: Mapping[str, Any] = MappingProxyType(
+    {
         "brewery_id": "brewery-001",
         "name": "旭酒造",
         "prefecture": "山口県",
@@ -120,14 +142,19 @@ def sample_brewery() -> dict[str, Any]:
         "website": "https://www.asahishuzo.ne.jp",
         "sake_count": 5,
         "average_rating": 4.4,
-        "created_at": datetime(2025, 1, 1, 0, 0, 0).isoformat(),
-        "updated_at": datetime(2025, 10, 1, 0, 0, 0).isoformat(),
+        "created_at": _JAN_1_2025,
+        "updated_at": _OCT_1_2025,
     }
+)
+
 
+def sample_brewery() -> Mapping[str, Any]:
+    """Return sample brewery data (read-only; copy with dict() before mutating)."""
+    return _SAMPLE_BREWERY
 
-def sample_tasting_record() -> dict[str, Any]:
-    """Return sample tasting record data."""
-    return {
+
+_SAMPLE_TASTING_RECORD: Mapping[str, Any] = MappingProxyType(
+    {
         "record_id": "record-001",
         "user_id": "test-user-123",
         "sake_id": "sake-001",
@@ -140,17 +167,28 @@ def sample_tasting_record() -> dict[str, Any]:
         "occasion": "celebration",
         "serving_temperature": "冷やして",
         "food_pairing": "刺身",
-        "image_urls": [],
-        "created_at": datetime(2025, 10, 1, 0, 0, 0).isoformat(),
-        "updated_at": datetime(2025, 10, 1, 0, 0, 0).isoformat(),
+        "image_urls": (),
+        "created_at": _OCT_1_2025,
+        "updated_at": _OCT_1_2025,
     }
+)
+
+
+def sample_tasting_record() -> Mapping[str, Any]:
+    """Return sample tasting record data (read-only; copy with dict() before mutating)."""
+    return _SAMPLE_TASTING_RECORD
 
 
-def sample_recommendation() -> dict[str, Any]:
-    """Return sample recommendation data."""
-    return {
+_SAMPLE_RECOMMENDATION: Mapping[str, Any] = MappingProxyType(
+    {
         "sake_id": "sake-001",
         "score": 0.92,
         "reasoning": "お好みの甘さ控えめで華やかな香りの日本酒です。",
-        "matching_factors": ["aroma_intensity", "sweetness", "type"],
+        "matching_factors": ("aroma_intensity", "sweetness", "type"),
     }
+)
+
+
+def sample_recommendation() -> Mapping[str, Any]:
+    """Return sample recommendation data (read-only; copy with dict() before mutating)."""
+    return _SAMPLE_RECOMMENDATION
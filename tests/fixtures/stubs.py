@@ -0,0 +1,46 @@
+"""Lightweight AWS resource stubs for tests."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def _empty_page() -> dict[str, Any]:
+    return {"Items": [], "Count": 0}
+
+
+@dataclass
+class FakeTable:
+    """DynamoDB Table stub that returns preset responses and records writes."""
+
+    get_item_response: dict[str, Any] = field(default_factory=dict)
+    query_response: dict[str, Any] = field(default_factory=_empty_page)
+    scan_response: dict[str, Any] = field(default_factory=_empty_page)
+    put_item_calls: list[dict[str, Any]] = field(default_factory=list)
+
+    def get_item(self, **kwargs: Any) -> dict[str, Any]:
+        """Return the preset get_item response."""
+        return self.get_item_response
+
+    def query(self, **kwargs: Any) -> dict[str, Any]:
+        """Return the preset query response."""
+        return self.query_response
+
+    def scan(self, **kwargs: Any) -> dict[str, Any]:
+        """Return the preset scan response."""
+        return self.scan_response
+
+    def put_item(self, *, Item: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+        """Record the written item."""
+        self.put_item_calls.append(Item)
+        return {}
+
+
+@dataclass
+class FakeDynamoDB:
+    """DynamoDB service resource stub serving one FakeTable for every table name."""
+
+    table: FakeTable = field(default_factory=FakeTable)
+
+    def Table(self, name: str) -> FakeTable:
+        """Return the shared table, mirroring boto3's ``resource.Table(name)``."""
+        return self.table
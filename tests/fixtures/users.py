@@ -1,43 +1,63 @@
 """User test fixtures."""
 
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
+# Timestamps shared by the sample records, formatted once at import
+_JAN_1_2025 = datetime(2025, 1, 1, 0, 0, 0).isoformat()
+_OCT_1_2025 = datetime(2025, 10, 1, 0, 0, 0).isoformat()
 
-def sample_user() -> dict[str, Any]:
-    """Return sample user data."""
-    return {
+_SAMPLE_USER: Mapping[str, Any] = MappingProxyType(
+    {
         "user_id": "test-user-123",
         "email": "test@example.com",
         "username": "testuser",
-        "created_at": datetime(2025, 1, 1, 0, 0, 0).isoformat(),
-        "last_login": datetime(2025, 10, 1, 0, 0, 0).isoformat(),
+        "created_at": _JAN_1_2025,
+        "last_login": _OCT_1_2025,
     }
+)
 
 
-def sample_user_preference() -> dict[str, Any]:
-    """Return sample user preference data."""
-    return {
+def sample_user() -> Mapping[str, Any]:
+    """Return sample user data (read-only; copy with dict() before mutating)."""
+    return _SAMPLE_USER
+
+
+_SAMPLE_USER_PREFERENCE: Mapping[str, Any] = MappingProxyType(
+    {
         "user_id": "test-user-123",
         "sweetness": 3,
         "acidity": 4,
         "richness": 3,
         "aroma_intensity": 4,
-        "preferred_types": ["junmai_daiginjo", "daiginjo"],
-        "disliked_ingredients": [],
+        "preferred_types": ("junmai_daiginjo", "daiginjo"),
+        "disliked_ingredients": (),
         "price_range_min": 1000,
         "price_range_max": 5000,
         "occasion": "dinner",
         "experience_level": "intermediate",
-        "updated_at": datetime(2025, 10, 1, 0, 0, 0).isoformat(),
+        "updated_at": _OCT_1_2025,
     }
+)
+
 
+def sample_user_preference() -> Mapping[str, Any]:
+    """Return sample user preference data (read-only; copy with dict() before mutating)."""
+    return _SAMPLE_USER_PREFERENCE
 
-def sample_cognito_user() -> dict[str, Any]:
-    """Return sample Cognito user attributes."""
-    return {
+
+_SAMPLE_COGNITO_USER: Mapping[str, Any] = MappingProxyType(
+    {
         "sub": "test-user-123",
         "email": "test@example.com",
         "email_verified": "true",
         "cognito:username": "testuser",
     }
+)
+
+
+def sample_cognito_user() -> Mapping[str, Any]:
+    """Return sample Cognito user attributes (read-only; copy with dict() before mutating)."""
+    return _SAMPLE_COGNITO_USER
@@ -1,174 +1,121 @@
 """Integration tests for Lambda-DynamoDB integration patterns (mocked)."""
 
 import json
-from unittest.mock import MagicMock, patch
+from collections.abc import Mapping
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
-from tests.fixtures.sake import sample_sake, sample_tasting_record
+from tests.fixtures.sake import sample_brewery, sample_sake, sample_tasting_record
+from tests.fixtures.stubs import FakeDynamoDB
 from tests.fixtures.users import sample_user_preference
 
 
 @pytest.mark.integration
 @pytest.mark.aws
 class TestLambdaDynamoDBIntegration:
-    """Test Lambda-DynamoDB integration patterns with mocks."""
+    """Test Lambda-DynamoDB integration patterns with stubs."""
 
     @pytest.fixture
-    def dynamodb_mock(self) -> MagicMock:
-        """Create DynamoDB mock."""
-        mock = MagicMock()
-        mock.Table.return_value = MagicMock()
-        return mock
+    def dynamodb(self) -> FakeDynamoDB:
+        """Create a DynamoDB resource stub."""
+        return FakeDynamoDB()
 
-    @patch("boto3.resource")
     def test_recommendation_lambda_with_dynamodb(
         self,
-        mock_boto: MagicMock,
-        dynamodb_mock: MagicMock,
-        lambda_context: MagicMock,
+        dynamodb: FakeDynamoDB,
+        lambda_context: SimpleNamespace,
     ) -> None:
         """Test recommendation Lambda integration pattern with DynamoDB."""
-        mock_boto.return_value = dynamodb_mock
-
-        # Mock DynamoDB responses for recommendation flow
-        dynamodb_mock.Table.return_value.query.return_value = {
+        # Stub DynamoDB responses for recommendation flow
+        dynamodb.table.query_response = {
             "Items": [],  # No tasting history
             "Count": 0,
         }
 
-        dynamodb_mock.Table.return_value.scan.return_value = {
+        dynamodb.table.scan_response = {
             "Items": [sample_sake()],  # Sake master data
             "Count": 1,
         }
 
-        # Simulate Lambda handler pattern
-        event = {
-            "body": json.dumps(
-                {
-                    "user_id": "test-user",
-                    "preferences": {"sweetness": 3, "acidity": 4},
-                    "limit": 5,
-                }
-            )
+        # Simulate Lambda request body
+        body = {
+            "user_id": "test-user",
+            "preferences": {"sweetness": 3, "acidity": 4},
+            "limit": 5,
         }
 
-        # Validate event structure
-        assert "body" in event
-        body = json.loads(event["body"])
+        # Validate request structure
         assert "user_id" in body
         assert "preferences" in body
 
         # Simulate successful response pattern
         response = {
             "statusCode": 200,
-            "body": json.dumps(
-                {"recommendations": [{"sake_id": "sake-001", "name": "獺祭", "score": 0.95}]}
-            ),
+            "body": {"recommendations": [{"sake_id": "sake-001", "name": "獺祭", "score": 0.95}]},
         }
 
         assert response["statusCode"] == 200
         assert "body" in response
 
-    @patch("boto3.resource")
-    def test_preference_lambda_get(
-        self, mock_boto: MagicMock, dynamodb_mock: MagicMock, lambda_context: MagicMock
-    ) -> None:
-        """Test preference Lambda GET integration pattern."""
-        mock_boto.return_value = dynamodb_mock
-
-        # Mock DynamoDB get_item response
-        dynamodb_mock.Table.return_value.get_item.return_value = {"Item": sample_user_preference()}
-
-        # Simulate Lambda event
-
-        # Validate DynamoDB interaction
-        table_mock = dynamodb_mock.Table.return_value
-        result = table_mock.get_item(Key={"user_id": "test-user"})
-
-        assert "Item" in result
-        assert result["Item"]["user_id"] == "test-user-123"
-
-    @patch("boto3.resource")
-    def test_preference_lambda_put(
-        self, mock_boto: MagicMock, dynamodb_mock: MagicMock, lambda_context: MagicMock
-    ) -> None:
-        """Test preference Lambda PUT integration pattern."""
-        mock_boto.return_value = dynamodb_mock
-
-        # Simulate Lambda event
-        event = {
-            "httpMethod": "PUT",
-            "pathParameters": {"user_id": "test-user"},
-            "body": json.dumps(
+    @pytest.mark.parametrize(
+        ("table_name", "body", "item_key"),
+        [
+            pytest.param(
+                "SakeSensei-Users",
+                {"sweetness": 3, "acidity": 4, "richness": 3, "aroma_intensity": 4},
+                None,
+                id="preference-put",
+            ),
+            pytest.param(
+                "SakeSensei-TastingRecords",
                 {
-                    "sweetness": 3,
-                    "acidity": 4,
-                    "richness": 3,
-                    "aroma_intensity": 4,
-                }
+                    "action": "create",
+                    "tasting_data": {
+                        "user_id": "test-user",
+                        "sake_id": "sake-001",
+                        "rating": 5,
+                        "notes": "Excellent!",
+                    },
+                },
+                "tasting_data",
+                id="tasting-create",
             ),
-        }
-
-        # Validate event structure
-        assert event["httpMethod"] == "PUT"
-        body = json.loads(event["body"])
-        assert "sweetness" in body
-
-        # Simulate DynamoDB put_item
-        table_mock = dynamodb_mock.Table.return_value
-        table_mock.put_item(Item=body)
-
-        # Verify put_item was called
-        assert table_mock.put_item.called
-
-    @patch("boto3.resource")
-    def test_tasting_lambda_create(
-        self, mock_boto: MagicMock, dynamodb_mock: MagicMock, lambda_context: MagicMock
+        ],
+    )
+    def test_lambda_put_item(
+        self,
+        table_name: str,
+        body: dict[str, Any],
+        item_key: str | None,
+        dynamodb: FakeDynamoDB,
+        lambda_context: SimpleNamespace,
     ) -> None:
-        """Test tasting Lambda CREATE integration pattern."""
-        mock_boto.return_value = dynamodb_mock
-
-        tasting_data = {
-            "user_id": "test-user",
-            "sake_id": "sake-001",
-            "rating": 5,
-            "notes": "Excellent!",
-        }
-
-        event = {
-            "httpMethod": "POST",
-            "body": json.dumps({"action": "create", "tasting_data": tasting_data}),
-        }
-
-        # Validate event
-        body = json.loads(event["body"])
-        assert body["action"] == "create"
-        assert "tasting_data" in body
+        """Test preference PUT and tasting CREATE Lambda integration patterns."""
+        # Validate request structure
+        item = body[item_key] if item_key else body
+        assert item
 
         # Simulate DynamoDB put_item
-        table_mock = dynamodb_mock.Table.return_value
-        table_mock.put_item(Item=tasting_data)
+        table = dynamodb.Table(table_name)
+        table.put_item(Item=item)
 
-        assert table_mock.put_item.called
+        assert table.put_item_calls == [item]
 
-    @patch("boto3.resource")
     def test_tasting_lambda_list(
-        self, mock_boto: MagicMock, dynamodb_mock: MagicMock, lambda_context: MagicMock
+        self, dynamodb: FakeDynamoDB, lambda_context: SimpleNamespace
     ) -> None:
         """Test tasting Lambda LIST integration pattern."""
-        mock_boto.return_value = dynamodb_mock
-
-        # Mock DynamoDB query response
-        dynamodb_mock.Table.return_value.query.return_value = {
+        # Stub DynamoDB query response
+        dynamodb.table.query_response = {
             "Items": [sample_tasting_record()],
             "Count": 1,
         }
 
-
         # Simulate DynamoDB query
-        table_mock = dynamodb_mock.Table.return_value
-        result = table_mock.query(
+        table = dynamodb.Table("SakeSensei-TastingRecords")
+        result = table.query(
             KeyConditionExpression="user_id = :uid",
             ExpressionAttributeValues={":uid": "test-user"},
         )
@@ -176,25 +123,40 @@ class TestLambdaDynamoDBIntegration:
         assert result["Count"] == 1
         assert len(result["Items"]) == 1
 
-    @patch("boto3.resource")
-    def test_brewery_lambda_get(
-        self, mock_boto: MagicMock, dynamodb_mock: MagicMock, lambda_context: MagicMock
+    @pytest.mark.parametrize(
+        ("table_name", "key", "item"),
+        [
+            pytest.param(
+                "SakeSensei-Users",
+                {"user_id": "test-user-123"},
+                sample_user_preference(),
+                id="preference",
+            ),
+            pytest.param(
+                "SakeSensei-BreweryMaster",
+                {"brewery_id": "brewery-001"},
+                sample_brewery(),
+                id="brewery",
+            ),
+        ],
+    )
+    def test_lambda_get_item(
+        self,
+        table_name: str,
+        key: dict[str, str],
+        item: Mapping[str, Any],
+        dynamodb: FakeDynamoDB,
+        lambda_context: SimpleNamespace,
     ) -> None:
-        """Test brewery Lambda GET integration pattern."""
-        mock_boto.return_value = dynamodb_mock
-
-        from tests.fixtures.sake import sample_brewery
-
-        # Mock DynamoDB get_item response
-        dynamodb_mock.Table.return_value.get_item.return_value = {"Item": sample_brewery()}
-
+        """Test preference and brewery Lambda GET integration patterns."""
+        # Stub DynamoDB get_item response
+        dynamodb.table.get_item_response = {"Item": item}
 
         # Simulate DynamoDB get_item
-        table_mock = dynamodb_mock.Table.return_value
-        result = table_mock.get_item(Key={"brewery_id": "brewery-001"})
+        result = dynamodb.Table(table_name).get_item(Key=key)
 
         assert "Item" in result
-        assert result["Item"]["brewery_id"] == "brewery-001"
+        assert result["Item"].items() >= key.items()
 
 
 @pytest.mark.integration
@@ -229,11 +191,7 @@ class TestLambdaErrorHandling:
         missing_params = [p for p in required_params if p not in body]
 
         if missing_params:
-            response = {
-                "statusCode": 400,
-                "body": json.dumps(
-                    {"error": f"Missing required parameters: {', '.join(missing_params)}"}
-                ),
-            }
+            error_body = {"error": f"Missing required parameters: {', '.join(missing_params)}"}
+            response = {"statusCode": 400, "body": error_body}
             assert response["statusCode"] == 400
-            assert "error" in json.loads(response["body"])
+            assert "error" in error_body
@@ -1,12 +1,10 @@
 """Integration tests for Lambda functions with DynamoDB patterns."""
 
-import json
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock
 
 import boto3
 import pytest
-from moto import mock_aws
 
 
 @pytest.mark.integration
@@ -14,39 +12,38 @@ from moto import mock_aws
 class TestLambdaDynamoDBIntegration:
     """Test Lambda-DynamoDB integration patterns with moto."""
 
-    @pytest.fixture
-    def dynamodb_table(self, aws_credentials: None) -> Any:
-        """Create DynamoDB test table."""
-        with mock_aws():
-            dynamodb = boto3.resource("dynamodb", region_name="us-west-2")
-
-            # Create test table
-            table = dynamodb.create_table(
-                TableName="SakeSensei-Sakes",
-                KeySchema=[{"AttributeName": "sake_id", "KeyType": "HASH"}],
-                AttributeDefinitions=[{"AttributeName": "sake_id", "AttributeType": "S"}],
-                BillingMode="PAY_PER_REQUEST",
-            )
-
-            # Add test data
-            table.put_item(
-                Item={
-                    "sake_id": "test-sake-001",
-                    "name": "Test Sake",
-                    "brewery": "Test Brewery",
-                    "type": "純米大吟醸",
-                    "sweetness": 3,
-                    "acidity": 2,
-                    "richness": 2,
-                }
-            )
-
-            yield table
+    @pytest.fixture(scope="class")
+    def dynamodb_table(self, _moto: None) -> Any:
+        """Create the DynamoDB test table once for the class; tests only read it."""
+        dynamodb = boto3.resource("dynamodb", region_name="us-west-2")
+
+        # Create test table
+        table = dynamodb.create_table(
+            TableName="SakeSensei-Sakes",
+            KeySchema=[{"AttributeName": "sake_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "sake_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+
+        # Add test data
+        table.put_item(
+            Item={
+                "sake_id": "test-sake-001",
+                "name": "Test Sake",
+                "brewery": "Test Brewery",
+                "type": "純米大吟醸",
+                "sweetness": 3,
+                "acidity": 2,
+                "richness": 2,
+            }
+        )
+
+        return table
 
     def test_recommendation_with_dynamodb(
         self,
         dynamodb_table: Any,
-        lambda_context: MagicMock,
+        lambda_context: SimpleNamespace,
     ) -> None:
         """Test recommendation Lambda pattern with DynamoDB table."""
         # Query the table to get sake data
@@ -61,40 +58,30 @@ class TestLambdaDynamoDBIntegration:
         assert "name" in sake_item
         assert "sweetness" in sake_item
 
-        # Simulate Lambda handler pattern
-        event = {
-            "body": json.dumps(
-                {
-                    "user_id": "test-user",
-                    "preferences": {"sweetness": 3, "acidity": 2, "richness": 2},
-                    "limit": 5,
-                }
-            )
+        # Simulate Lambda request body
+        body = {
+            "user_id": "test-user",
+            "preferences": {"sweetness": 3, "acidity": 2, "richness": 2},
+            "limit": 5,
         }
 
-        # Validate event structure
-        body = json.loads(event["body"])
+        # Validate request structure
         assert "user_id" in body
         assert "preferences" in body
 
         # Simulate response pattern
-        lambda_response = {
-            "statusCode": 200,
-            "body": json.dumps(
+        response_body = {
+            "recommendations": [
                 {
-                    "recommendations": [
-                        {
-                            "sake_id": sake_item["sake_id"],
-                            "name": sake_item["name"],
-                            "score": 0.95,
-                        }
-                    ]
+                    "sake_id": sake_item["sake_id"],
+                    "name": sake_item["name"],
+                    "score": 0.95,
                 }
-            ),
+            ]
         }
+        lambda_response = {"statusCode": 200, "body": response_body}
 
         assert lambda_response["statusCode"] == 200
-        response_body = json.loads(lambda_response["body"])
         assert "recommendations" in response_body
         assert isinstance(response_body["recommendations"], list)
 
@@ -105,7 +92,7 @@ class TestLambdaChaining:
 
     def test_preference_to_recommendation_flow(
         self,
-        lambda_context: MagicMock,
+        lambda_context: SimpleNamespace,
     ) -> None:
         """Test flow pattern from preference storage to recommendation."""
         # Document the expected flow:
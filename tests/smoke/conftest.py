@@ -0,0 +1,128 @@
+"""Shared fixtures for smoke tests."""
+
+import os
+import socket
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from typing import Final
+from urllib.parse import urlparse
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_BASE_URL = "http://sakese-Publi-5SDe3QrKne55-1360562030.us-west-2.elb.amazonaws.com"
+
+# (connect, read) seconds, well above the expected p95 so an outage fails fast
+REQUEST_TIMEOUT: Final = (2.0, 5.0)
+# Timed checks assert < 5s, so their read timeout must not cut a slow response short
+TIMED_REQUEST_TIMEOUT: Final = (2.0, 6.0)
+
+
+def _resolve_base_url() -> str:
+    url = os.getenv("SMOKE_TEST_URL") or os.getenv("APP_URL") or DEFAULT_BASE_URL
+    parsed = urlparse(url)
+    assert parsed.scheme in ("http", "https") and parsed.netloc, f"Invalid base URL: {url!r}"
+    return url.rstrip("/")
+
+
+def _is_reachable(url: str) -> bool:
+    parsed = urlparse(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        with socket.create_connection((parsed.hostname, port), timeout=2):
+            return True
+    except OSError:
+        return False
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Skip network smoke tests at once when the deployment cannot be reached.
+
+    Only applied outside CI: a deploy job must still fail on an unreachable
+    deployment. The offline ``docs`` checks are unaffected.
+    """
+    smoke_dir = os.path.dirname(__file__)
+    network_items = [
+        item
+        for item in items
+        if str(item.path).startswith(smoke_dir) and item.get_closest_marker("smoke")
+    ]
+    if not network_items or os.getenv("CI"):
+        return
+    url = _resolve_base_url()
+    if not _is_reachable(url):
+        skip = pytest.mark.skip(reason=f"Deployment unreachable: {url}")
+        for item in network_items:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def base_url() -> str:
+    """Base URL of the deployment under test (SMOKE_TEST_URL, else APP_URL)."""
+    return _resolve_base_url()
+
+
+@pytest.fixture(scope="session")
+def cognito_config() -> dict[str, str]:
+    """Cognito configuration from the environment."""
+    return {
+        "region": os.getenv("AWS_REGION", "us-west-2"),
+        "user_pool_id": os.getenv("COGNITO_USER_POOL_ID", ""),
+        "client_id": os.getenv("COGNITO_CLIENT_ID", ""),
+    }
+
+
+@contextmanager
+def _pooled_session(base_url: str, max_retries: Retry | int) -> Iterator[requests.Session]:
+    """Session with a connection pool to the deployed app, warmed with one HEAD."""
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=max_retries)
+    with requests.Session() as session:
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Best effort: the tests themselves report an unreachable deployment
+        with suppress(requests.RequestException):
+            session.head(base_url, timeout=REQUEST_TIMEOUT)
+        yield session
+
+
+@pytest.fixture(scope="session")
+def http(base_url: str) -> Iterator[requests.Session]:
+    """HTTP session reusing connections to the deployed app across all smoke tests."""
+    # Ride out transient ALB 5xx during target (de)registration; never retry 4xx
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        backoff_jitter=0.1,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"HEAD", "GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    with _pooled_session(base_url, retry) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def timed_http(base_url: str) -> Iterator[requests.Session]:
+    """HTTP session for the latency checks.
+
+    It never retries, so a measurement cannot include retry backoff. The pool
+    is warmed before the first test uses it, so the timed tests measure
+    steady-state latency rather than DNS and TCP setup.
+    """
+    with _pooled_session(base_url, 0) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def probe(http: requests.Session) -> Iterator[Callable[[Iterable[str]], list[requests.Response]]]:
+    """GET several URLs concurrently over the shared session, in the order given."""
+    with ThreadPoolExecutor(max_workers=4) as pool:
+
+        def get_all(urls: Iterable[str]) -> list[requests.Response]:
+            return list(pool.map(lambda url: http.get(url, timeout=REQUEST_TIMEOUT), urls))
+
+        yield get_all
@@ -0,0 +1,326 @@
+"""Documented expectations for the deployed application.
+
+These describe authentication, navigation, integrations and features; they
+are checked for internal consistency by test_specs.py, which makes no
+network calls.
+"""
+
+from typing import Any, Final
+
+# Authentication
+
+COGNITO_ERROR_PATTERNS: Final = {
+    "NotAuthorizedException": "Invalid credentials or user not found",
+    "UserNotFoundException": "User does not exist",
+    "UserNotConfirmedException": "User email not verified",
+    "PasswordResetRequiredException": "Password reset required",
+    "TooManyRequestsException": "Too many failed attempts",
+}
+
+SESSION_STATE_KEYS: Final = (
+    "authenticated",
+    "user_id",
+    "username",
+    "email",
+    "id_token",
+    "access_token",
+    "refresh_token",
+)
+
+AUTH_FLOW_STEPS: Final = (
+    "1. User accesses application",
+    "2. Application checks session state",
+    "3. If not authenticated, show login/signup",
+    "4. User enters credentials",
+    "5. Application calls Cognito InitiateAuth",
+    "6. Cognito returns tokens (access, id, refresh)",
+    "7. Application stores tokens in session",
+    "8. User is redirected to main page",
+)
+
+ID_TOKEN_CLAIMS: Final = (
+    "sub",  # User ID
+    "email",  # User email
+    "email_verified",  # Email verification status
+    "cognito:username",  # Username
+    "exp",  # Expiration time
+    "iat",  # Issued at time
+    "token_use",  # Should be "id"
+)
+
+ACCESS_TOKEN_CLAIMS: Final = (
+    "sub",  # User ID
+    "exp",  # Expiration time
+    "iat",  # Issued at time
+    "token_use",  # Should be "access"
+    "scope",  # Token scope
+    "client_id",  # Cognito client ID
+)
+
+PASSWORD_REQUIREMENTS: Final = {
+    "min_length": 8,
+    "require_uppercase": True,
+    "require_lowercase": True,
+    "require_numbers": True,
+    "require_special_chars": True,
+}
+
+SESSION_TIMEOUTS: Final = {
+    "id_token_validity": 3600,  # 1 hour
+    "access_token_validity": 3600,  # 1 hour
+    "refresh_token_validity": 86400 * 30,  # 30 days
+}
+
+RATE_LIMITS: Final = {
+    "login_attempts": 5,  # Max failed attempts before lockout
+    "lockout_duration": 300,  # 5 minutes
+    "signup_rate": 10,  # Max signups per hour per IP
+}
+
+# Application flow
+
+NAVIGATION_PAGES: Final = (
+    "Home",  # Main page (app.py)
+    "Preference Survey",  # Preference questionnaire
+    "AI Recommendations",  # AI-powered sake recommendations
+    "Rating",  # Rate and record tasting
+    "Image Recognition",  # Upload sake label photos
+    "History",  # View tasting history
+)
+
+USER_JOURNEY: Final[tuple[dict[str, Any], ...]] = (
+    {
+        "step": 1,
+        "action": "Access application",
+        "page": "Home",
+        "expected": "Authentication required",
+    },
+    {
+        "step": 2,
+        "action": "Sign up / Login",
+        "page": "Home",
+        "expected": "Cognito authentication successful",
+    },
+    {
+        "step": 3,
+        "action": "Complete preference survey",
+        "page": "Preference Survey",
+        "expected": "User preferences saved to DynamoDB",
+    },
+    {
+        "step": 4,
+        "action": "Request AI recommendations",
+        "page": "AI Recommendations",
+        "expected": "Agent returns personalized sake recommendations",
+    },
+    {
+        "step": 5,
+        "action": "View sake details",
+        "page": "AI Recommendations",
+        "expected": "Sake card with full information displayed",
+    },
+    {
+        "step": 6,
+        "action": "Rate a sake",
+        "page": "Rating",
+        "expected": "Tasting record saved to DynamoDB",
+    },
+    {
+        "step": 7,
+        "action": "Upload sake label photo",
+        "page": "Image Recognition",
+        "expected": "Claude 4.5 Sonnet identifies sake information",
+    },
+    {
+        "step": 8,
+        "action": "View tasting history",
+        "page": "History",
+        "expected": "Past tastings displayed with statistics",
+    },
+)
+
+INTEGRATIONS: Final[dict[str, dict[str, Any]]] = {
+    "cognito": {
+        "purpose": "User authentication and authorization",
+        "endpoints": ["InitiateAuth", "SignUp", "ConfirmSignUp"],
+    },
+    "lambda_recommendation": {
+        "purpose": "Generate sake recommendations",
+        "trigger": "AgentCore Gateway MCP tool",
+    },
+    "lambda_preference": {
+        "purpose": "Manage user preferences",
+        "operations": ["get", "update", "create"],
+    },
+    "lambda_tasting": {
+        "purpose": "Manage tasting records",
+        "operations": ["create", "get_history", "get_statistics"],
+    },
+    "lambda_brewery": {
+        "purpose": "Retrieve brewery information",
+        "operations": ["get_by_id", "search"],
+    },
+    "lambda_image_recognition": {
+        "purpose": "Recognize sake labels using Claude 4.5 Sonnet",
+        "model": "anthropic.claude-4-5-sonnet-20250930-v1:0",
+    },
+    "agentcore_runtime": {
+        "purpose": "Execute Strands Agent for conversational recommendations",
+        "features": ["streaming", "memory", "tool_invocation"],
+    },
+    "dynamodb": {
+        "purpose": "Data persistence",
+        "tables": ["Users", "Sake", "Breweries", "TastingRecords", "Preferences"],
+    },
+    "s3": {
+        "purpose": "Image storage",
+        "buckets": ["sake-labels", "sake-images"],
+    },
+}
+
+ERROR_SCENARIOS: Final[tuple[dict[str, str], ...]] = (
+    {
+        "scenario": "User not authenticated",
+        "expected_behavior": "Show login dialog, prevent access to protected features",
+    },
+    {
+        "scenario": "Network request fails",
+        "expected_behavior": "Display error message, suggest retry",
+    },
+    {
+        "scenario": "Lambda function timeout",
+        "expected_behavior": "Show timeout error, allow retry",
+    },
+    {
+        "scenario": "Invalid input data",
+        "expected_behavior": "Display validation error, highlight incorrect fields",
+    },
+    {
+        "scenario": "Agent response parsing error",
+        "expected_behavior": "Log error, show fallback message",
+    },
+    {
+        "scenario": "DynamoDB rate limit exceeded",
+        "expected_behavior": "Implement exponential backoff, retry request",
+    },
+    {
+        "scenario": "S3 image upload fails",
+        "expected_behavior": "Show upload error, allow re-upload",
+    },
+    {
+        "scenario": "Session expired",
+        "expected_behavior": "Clear session, redirect to login",
+    },
+)
+
+# Features
+
+PREFERENCE_SURVEY_FEATURES: Final[dict[str, dict[str, Any]]] = {
+    "sake_type_preference": {
+        "options": ["純米酒", "純米吟醸", "純米大吟醸", "本醸造", "吟醸", "大吟醸"],
+        "required": True,
+    },
+    "flavor_profile": {
+        "dimensions": ["甘口-辛口", "香り高い-控えめ", "軽い-濃厚"],
+        "type": "slider",
+    },
+    "drinking_context": {
+        "options": ["食事中", "食前酒", "食後酒", "晩酌"],
+        "multiple": True,
+    },
+    "food_pairing": {
+        "categories": ["魚", "肉", "野菜", "米料理", "チーズ"],
+        "multiple": True,
+    },
+}
+
+RECOMMENDATION_FEATURES: Final[dict[str, dict[str, Any]]] = {
+    "ai_powered_recommendations": {
+        "model": "Claude 4.5 Sonnet",
+        "method": "AgentCore Runtime with Strands Agent",
+        "personalization": True,
+    },
+    "sake_card_display": {
+        "information": [
+            "name",
+            "type",
+            "brewery",
+            "region",
+            "flavor_profile",
+            "food_pairing",
+            "description",
+        ],
+        "interactive": True,
+    },
+    "filtering": {
+        "by_type": True,
+        "by_region": True,
+        "by_price": True,
+    },
+    "memory_integration": {
+        "remembers_preferences": True,
+        "learns_from_ratings": True,
+        "conversation_context": True,
+    },
+}
+
+TASTING_RECORD_FEATURES: Final[dict[str, Any]] = {
+    "rating_dimensions": [
+        "overall_rating",
+        "aroma_rating",
+        "taste_rating",
+        "sweetness",
+        "body",
+        "finish",
+    ],
+    "tasting_notes": {
+        "aroma_descriptors": ["fruity", "floral", "nutty", "earthy", "spicy"],
+        "taste_descriptors": ["sweet", "dry", "umami", "acidic", "bitter"],
+    },
+    "metadata": ["location", "temperature", "vessel", "occasion"],
+    "photo_upload": True,
+}
+
+HISTORY_FEATURES: Final[dict[str, Any]] = {
+    "statistics": [
+        "total_tastings",
+        "favorites_count",
+        "breweries_explored",
+        "average_rating",
+    ],
+    "charts": {
+        "rating_distribution": "bar_chart",
+        "sake_type_distribution": "pie_chart",
+        "tasting_timeline": "line_chart",
+    },
+    "export_formats": ["CSV", "JSON", "summary_text"],
+    "filtering": {
+        "by_date_range": True,
+        "by_sake_type": True,
+        "by_rating": True,
+    },
+}
+
+IMAGE_RECOGNITION_FEATURES: Final[dict[str, Any]] = {
+    "model": "anthropic.claude-4-5-sonnet-20250930-v1:0",
+    "capabilities": [
+        "text_extraction",
+        "sake_name_recognition",
+        "brewery_identification",
+        "type_classification",
+    ],
+    "supported_formats": ["JPEG", "PNG"],
+    "max_file_size": 5 * 1024 * 1024,  # 5MB
+    "processing_time": "< 3 seconds",
+}
+
+# Performance
+
+PERFORMANCE_TARGETS: Final = {
+    "page_load_time": 3.0,  # seconds
+    "health_check_time": 0.5,  # seconds
+    "api_response_time": 2.0,  # seconds
+    "agent_ttft": 0.5,  # Time to first token (seconds)
+    "agent_throughput": 30,  # Tokens per second
+    "agent_total_time": 3.0,  # Total response time (seconds)
+}
@@ -0,0 +1,138 @@
+"""Consistency checks for the documented expectations in specs.py.
+
+These make no network calls and are marked ``docs`` rather than ``smoke``,
+so the post-deploy smoke job (``-m smoke``) skips them.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from tests.smoke import specs
+
+
+def _numbered(steps: tuple[str, ...]) -> bool:
+    return all(step.startswith(f"{i}.") and len(step) > 10 for i, step in enumerate(steps, 1))
+
+
+SPEC_CHECKS = [
+    pytest.param(
+        specs.COGNITO_ERROR_PATTERNS,
+        lambda s: all(code.endswith("Exception") and desc for code, desc in s.items()),
+        id="cognito-error-patterns",
+    ),
+    pytest.param(
+        specs.SESSION_STATE_KEYS,
+        lambda keys: all(key and key == key.lower() for key in keys),
+        id="session-state-keys",
+    ),
+    pytest.param(
+        specs.AUTH_FLOW_STEPS,
+        lambda steps: len(steps) == 8 and _numbered(steps),
+        id="auth-flow-steps",
+    ),
+    pytest.param(
+        (specs.ID_TOKEN_CLAIMS, specs.ACCESS_TOKEN_CLAIMS),
+        lambda claim_sets: all(
+            len(claims) >= 5 and {"sub", "exp"} <= set(claims) for claims in claim_sets
+        ),
+        id="token-claims",
+    ),
+    pytest.param(
+        specs.PASSWORD_REQUIREMENTS,
+        lambda p: p["min_length"] >= 8 and p["require_uppercase"] and p["require_numbers"],
+        id="password-policy",
+    ),
+    pytest.param(
+        specs.SESSION_TIMEOUTS,
+        lambda t: (
+            t["id_token_validity"] > 0
+            and t["access_token_validity"] > 0
+            and t["refresh_token_validity"] > t["id_token_validity"]
+        ),
+        id="session-timeouts",
+    ),
+    pytest.param(
+        specs.RATE_LIMITS, lambda limits: all(v > 0 for v in limits.values()), id="rate-limits"
+    ),
+    pytest.param(
+        specs.NAVIGATION_PAGES,
+        lambda pages: len(pages) == 6 and all(pages),
+        id="navigation-pages",
+    ),
+    pytest.param(
+        specs.USER_JOURNEY,
+        lambda journey: (
+            [step["step"] for step in journey] == list(range(1, 9))
+            and all(step.keys() >= {"action", "page", "expected"} for step in journey)
+        ),
+        id="user-journey",
+    ),
+    pytest.param(
+        specs.INTEGRATIONS,
+        lambda services: len(services) >= 8 and all(c["purpose"] for c in services.values()),
+        id="integrations",
+    ),
+    pytest.param(
+        specs.ERROR_SCENARIOS,
+        lambda scenarios: (
+            len(scenarios) == 8
+            and all(s["scenario"] and len(s["expected_behavior"]) > 10 for s in scenarios)
+        ),
+        id="error-scenarios",
+    ),
+    pytest.param(
+        specs.PREFERENCE_SURVEY_FEATURES,
+        lambda features: len(features) >= 4,
+        id="preference-survey-features",
+    ),
+    pytest.param(
+        specs.RECOMMENDATION_FEATURES,
+        lambda f: (
+            f["ai_powered_recommendations"]["model"] == "Claude 4.5 Sonnet"
+            and f["ai_powered_recommendations"]["personalization"] is True
+        ),
+        id="recommendation-features",
+    ),
+    pytest.param(
+        specs.TASTING_RECORD_FEATURES,
+        lambda f: (
+            len(f["rating_dimensions"]) == 6
+            and "overall_rating" in f["rating_dimensions"]
+            and f["photo_upload"] is True
+        ),
+        id="tasting-record-features",
+    ),
+    pytest.param(
+        specs.HISTORY_FEATURES,
+        lambda f: (
+            len(f["statistics"]) == 4
+            and len(f["charts"]) == 3
+            and {"CSV", "JSON"} <= set(f["export_formats"])
+        ),
+        id="history-features",
+    ),
+    pytest.param(
+        specs.IMAGE_RECOGNITION_FEATURES,
+        lambda f: (
+            f["model"].startswith("anthropic.claude")
+            and "text_extraction" in f["capabilities"]
+            and "JPEG" in f["supported_formats"]
+            and f["max_file_size"] > 0
+        ),
+        id="image-recognition-features",
+    ),
+    pytest.param(
+        specs.PERFORMANCE_TARGETS,
+        lambda targets: all(isinstance(t, int | float) and t > 0 for t in targets.values()),
+        id="performance-targets",
+    ),
+]
+
+
+@pytest.mark.docs
+@pytest.mark.parametrize(("spec", "is_consistent"), SPEC_CHECKS)
+def test_spec_is_consistent(spec: Any, is_consistent: Callable[[Any], bool]) -> None:
+    """Documented expectations stay internally consistent."""
+    assert is_consistent(spec), spec
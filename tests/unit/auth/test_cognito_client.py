@@ -1,9 +1,24 @@
 """Unit tests for Cognito authentication logic."""
 
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+_HAS_UPPER = 1
+_HAS_DIGIT = 2
+
+
+def _meets_password_policy(pwd: str) -> bool:
+    """At least 8 characters with an uppercase letter and a digit, checked in one pass."""
+    flags = 0
+    for c in pwd:
+        if c.isupper():
+            flags |= _HAS_UPPER
+        elif c.isdigit():
+            flags |= _HAS_DIGIT
+    return len(pwd) >= 8 and flags == _HAS_UPPER | _HAS_DIGIT
+
 
 @pytest.mark.unit
 class TestCognitoAuthentication:
@@ -96,9 +111,7 @@ class TestCognitoAuthentication:
         ]
 
         for pwd in valid_passwords:
-            assert len(pwd) >= 8
-            assert any(c.isupper() for c in pwd)
-            assert any(c.isdigit() for c in pwd)
+            assert _meets_password_policy(pwd), pwd
 
         # Invalid passwords (too short, no uppercase, no number, etc.)
         invalid_passwords = [
@@ -108,10 +121,7 @@ class TestCognitoAuthentication:
         ]
 
         for pwd in invalid_passwords:
-            is_valid = (
-                len(pwd) >= 8 and any(c.isupper() for c in pwd) and any(c.isdigit() for c in pwd)
-            )
-            assert not is_valid
+            assert not _meets_password_policy(pwd), pwd
 
 
 @pytest.mark.unit
@@ -139,17 +149,14 @@ class TestJWTValidation:
 
     def test_token_expiration_check(self) -> None:
         """Test token expiration validation logic."""
-        from datetime import datetime, timedelta
+        # JWT exp claims are integer epoch seconds, so compare against one clock read
+        current_timestamp = int(time.time())
 
         # Token expired 1 hour ago
-        expired_time = datetime.utcnow() - timedelta(hours=1)
-        expired_timestamp = int(expired_time.timestamp())
+        expired_timestamp = current_timestamp - 3600
 
         # Token expires 1 hour from now
-        valid_time = datetime.utcnow() + timedelta(hours=1)
-        valid_timestamp = int(valid_time.timestamp())
-
-        current_timestamp = int(datetime.utcnow().timestamp())
+        valid_timestamp = current_timestamp + 3600
 
         assert expired_timestamp < current_timestamp  # Expired
         assert valid_timestamp > current_timestamp  # Still valid
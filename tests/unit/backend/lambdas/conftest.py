@@ -2,16 +2,18 @@
 Pytest configuration for Lambda tests.
 """
 
+import importlib.util
+import json
 import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
+import boto3
 import pytest
 
-# Pre-load modules into sys.modules BEFORE any Lambda handler imports
-# This simulates Lambda environment where Layer modules are available without 'backend.lambdas.layer' prefix
-
-# Step 1: Add Layer modules to sys.modules first
+# Pre-load modules into sys.modules BEFORE any Lambda handler imports. This simulates
+# the Lambda environment, where Layer modules import without the 'backend.lambdas.layer'
+# prefix. Step 1: add the Layer modules to sys.modules first
 import backend.lambdas.layer.error_handler
 import backend.lambdas.layer.logger
 import backend.lambdas.layer.response
@@ -20,85 +22,218 @@ sys.modules["error_handler"] = backend.lambdas.layer.error_handler
 sys.modules["logger"] = backend.lambdas.layer.logger
 sys.modules["response"] = backend.lambdas.layer.response
 
-# Step 2: Import Lambda-specific modules DIRECTLY (avoid __init__.py which imports handler)
-# We need to manually load these as standalone modules
-import importlib.util
+# Step 2: Lambda-specific modules are loaded DIRECTLY from their files in
+# pytest_configure (avoiding __init__.py, which imports handler)
+LAMBDA_MODULES = {
+    "algorithm": "backend/lambdas/recommendation/algorithm.py",
+    "user": "backend/lambdas/preference/user.py",
+    "tasting": "backend/lambdas/tasting/tasting.py",
+}
+
+
+def pytest_configure(config):
+    """Load the standalone Lambda modules once, skipping any already in sys.modules."""
+    for name, path in LAMBDA_MODULES.items():
+        if name in sys.modules:
+            continue
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_env_vars():
+    """Mock environment variables for Lambda functions, set once since no test changes them."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("AWS_REGION", "us-west-2")
+        monkeypatch.setenv("USERS_TABLE", "SakeSensei-Users")
+        monkeypatch.setenv("TASTING_TABLE", "SakeSensei-TastingRecords")
+        monkeypatch.setenv("SAKE_TABLE", "SakeSensei-SakeMaster")
+        monkeypatch.setenv("BREWERY_TABLE", "SakeSensei-BreweryMaster")
+        monkeypatch.setenv("IMAGES_BUCKET", "sakesensei-images")
+        yield
+
+
+@pytest.fixture(scope="session")
+def lambda_context():
+    """Lambda context, shared by every test since handlers only read it.
+
+    A plain namespace rather than a MagicMock: nothing asserts on its calls.
+    """
+    return SimpleNamespace(
+        function_name="test-function",
+        invoked_function_arn="arn:aws:lambda:us-west-2:123456789012:function:test",
+        memory_limit_in_mb=128,
+        request_id="test-request-id",
+        log_group_name="/aws/lambda/test-function",
+        log_stream_name="2025/10/01/[$LATEST]test",
+        get_remaining_time_in_millis=lambda: 300000,
+    )
+
+
+# Key schemas and GSIs from infrastructure/stacks/database_stack.py that the handlers use
+TABLES = {
+    "SakeSensei-Users": {"keys": ("user_id",), "indexes": {}},
+    "SakeSensei-SakeMaster": {
+        "keys": ("sake_id",),
+        "indexes": {"BreweryIndex": ("brewery_id",), "CategoryIndex": ("category", "price")},
+    },
+    "SakeSensei-BreweryMaster": {
+        "keys": ("brewery_id",),
+        "indexes": {"PrefectureIndex": ("prefecture",)},
+    },
+    "SakeSensei-TastingRecords": {"keys": ("user_id", "record_id"), "indexes": {}},
+}
+# Key attributes typed NUMBER in database_stack.py; every other key is STRING
+NUMBER_ATTRIBUTES = frozenset({"price"})
+IMAGES_BUCKET = "sakesensei-images"
+
+
+def _key_schema(keys):
+    return [
+        {"AttributeName": key, "KeyType": key_type}
+        for key, key_type in zip(keys, ("HASH", "RANGE"), strict=False)
+    ]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def aws(_moto):
+    """Moto DynamoDB resource with the Lambda tables and images bucket, created once per module.
+
+    Autouse so that no handler call in these tests can reach real AWS.
+    """
+    dynamodb = boto3.resource("dynamodb", region_name="us-west-2")
+    for name, schema in TABLES.items():
+        attributes = {*schema["keys"]}.union(*schema["indexes"].values())
+        indexes = [
+            {
+                "IndexName": index_name,
+                "KeySchema": _key_schema(keys),
+                "Projection": {"ProjectionType": "ALL"},
+            }
+            for index_name, keys in schema["indexes"].items()
+        ]
+        dynamodb.create_table(
+            TableName=name,
+            KeySchema=_key_schema(schema["keys"]),
+            AttributeDefinitions=[
+                {
+                    "AttributeName": attribute,
+                    "AttributeType": "N" if attribute in NUMBER_ATTRIBUTES else "S",
+                }
+                for attribute in attributes
+            ],
+            BillingMode="PAY_PER_REQUEST",
+            **({"GlobalSecondaryIndexes": indexes} if indexes else {}),
+        )
+    boto3.client("s3", region_name="us-west-2").create_bucket(
+        Bucket=IMAGES_BUCKET, CreateBucketConfiguration={"LocationConstraint": "us-west-2"}
+    )
+    return dynamodb
+
+
+def _emptied_after_test(aws, name):
+    table = aws.Table(name)
+    yield table
+
+    # Reset rows between tests while the tables stay in place
+    keys = TABLES[name]["keys"]
+    with table.batch_writer() as batch:
+        for item in table.scan()["Items"]:
+            batch.delete_item(Key={key: item[key] for key in keys})
 
-# Load algorithm module
-spec_algo = importlib.util.spec_from_file_location(
-    "algorithm",
-    "backend/lambdas/recommendation/algorithm.py"
-)
-algo_module = importlib.util.module_from_spec(spec_algo)
-sys.modules["algorithm"] = algo_module
-spec_algo.loader.exec_module(algo_module)
-
-# Load user module
-spec_user = importlib.util.spec_from_file_location(
-    "user",
-    "backend/lambdas/preference/user.py"
-)
-user_module = importlib.util.module_from_spec(spec_user)
-sys.modules["user"] = user_module
-spec_user.loader.exec_module(user_module)
-
-# Load tasting module
-spec_tasting = importlib.util.spec_from_file_location(
-    "tasting",
-    "backend/lambdas/tasting/tasting.py"
-)
-tasting_module = importlib.util.module_from_spec(spec_tasting)
-sys.modules["tasting"] = tasting_module
-spec_tasting.loader.exec_module(tasting_module)
-
-
-@pytest.fixture(autouse=True)
-def mock_env_vars(monkeypatch):
-    """Mock environment variables for Lambda functions."""
-    monkeypatch.setenv("AWS_REGION", "us-west-2")
-    monkeypatch.setenv("USERS_TABLE", "SakeSensei-Users")
-    monkeypatch.setenv("TASTING_TABLE", "SakeSensei-TastingRecords")
-    monkeypatch.setenv("SAKE_TABLE", "SakeSensei-SakeMaster")
-    monkeypatch.setenv("BREWERY_TABLE", "SakeSensei-BreweryMaster")
-    monkeypatch.setenv("IMAGES_BUCKET", "sakesensei-images")
+
+@pytest.fixture
+def users_table(aws):
+    """Moto Users table, emptied after each test."""
+    yield from _emptied_after_test(aws, "SakeSensei-Users")
 
 
 @pytest.fixture
-def lambda_context():
-    """Mock Lambda context."""
-    context = MagicMock()
-    context.function_name = "test-function"
-    context.invoked_function_arn = "arn:aws:lambda:us-west-2:123456789012:function:test"
-    context.memory_limit_in_mb = 128
-    context.request_id = "test-request-id"
-    context.log_group_name = "/aws/lambda/test-function"
-    context.log_stream_name = "2025/10/01/[$LATEST]test"
-    context.get_remaining_time_in_millis = lambda: 300000
-    return context
+def sake_table(aws):
+    """Moto SakeMaster table, emptied after each test."""
+    yield from _emptied_after_test(aws, "SakeSensei-SakeMaster")
 
 
 @pytest.fixture
-def mock_dynamodb_table():
-    """Mock DynamoDB table."""
-    with patch("boto3.resource") as mock_resource:
-        mock_table = MagicMock()
-        mock_resource.return_value.Table.return_value = mock_table
-        yield mock_table
+def brewery_table(aws):
+    """Moto BreweryMaster table, emptied after each test."""
+    yield from _emptied_after_test(aws, "SakeSensei-BreweryMaster")
 
 
 @pytest.fixture
-def mock_s3_client():
-    """Mock S3 client."""
-    with patch("boto3.client") as mock_client:
-        mock_s3 = MagicMock()
-        mock_client.return_value = mock_s3
-        yield mock_s3
+def tasting_table(aws):
+    """Moto TastingRecords table, emptied after each test."""
+    yield from _emptied_after_test(aws, "SakeSensei-TastingRecords")
 
 
 @pytest.fixture
-def mock_bedrock_client():
-    """Mock Bedrock Runtime client."""
-    with patch("boto3.client") as mock_client:
-        mock_bedrock = MagicMock()
-        mock_client.return_value = mock_bedrock
+def images_bucket(aws):
+    """Moto S3 client with the images bucket, emptied after each test."""
+    s3 = boto3.client("s3", region_name="us-west-2")
+    yield s3
+
+    for obj in s3.list_objects_v2(Bucket=IMAGES_BUCKET).get("Contents", []):
+        s3.delete_object(Bucket=IMAGES_BUCKET, Key=obj["Key"])
+
+
+@pytest.fixture(scope="session")
+def parse_body():
+    """Parse a Lambda proxy response's JSON body ({} for bodiless responses such as 204)."""
+
+    def parse(response):
+        return json.loads(response["body"]) if response.get("body") else {}
+
+    return parse
+
+
+@pytest.fixture(scope="session")
+def brewery_handler(aws_credentials):
+    """Brewery Lambda handler, imported once with AWS credentials and region set."""
+    from backend.lambdas.brewery.handler import handler
+
+    return handler
+
+
+@pytest.fixture(scope="session")
+def image_recognition_handler(aws_credentials):
+    """Image Recognition Lambda handler, imported once with AWS credentials and region set."""
+    from backend.lambdas.image_recognition.handler import handler
+
+    return handler
+
+
+@pytest.fixture(scope="session")
+def preference_handler(aws_credentials):
+    """Preference Lambda handler, imported once with AWS credentials and region set."""
+    from backend.lambdas.preference.handler import handler
+
+    return handler
+
+
+@pytest.fixture(scope="session")
+def recommendation_handler(aws_credentials):
+    """Recommendation Lambda handler, imported once with AWS credentials and region set."""
+    from backend.lambdas.recommendation.handler import handler
+
+    return handler
+
+
+@pytest.fixture(scope="session")
+def tasting_handler(aws_credentials):
+    """Tasting Lambda handler, imported once with AWS credentials and region set."""
+    from backend.lambdas.tasting.handler import handler
+
+    return handler
+
+
+@pytest.fixture
+def mock_bedrock_client(image_recognition_handler):
+    """Mock of the Image Recognition Lambda's Bedrock Runtime client.
+
+    moto does not serve bedrock-runtime, and the handler creates its client at import,
+    so the module attribute is patched rather than boto3.client.
+    """
+    with patch("backend.lambdas.image_recognition.handler.bedrock_runtime") as mock_bedrock:
         yield mock_bedrock
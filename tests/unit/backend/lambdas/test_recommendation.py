@@ -3,148 +3,235 @@ Unit tests for Recommendation Lambda function.
 """
 
 import json
-from unittest.mock import MagicMock, patch
+from decimal import Decimal
+from unittest.mock import DEFAULT, patch
 
 import pytest
 
+# The standalone module the handler itself imports (registered by conftest); importing
+# via the package would run its __init__, which builds the handler's boto3 resources
+from algorithm import RecommendationEngine
+from botocore.exceptions import ClientError
 
+
+@pytest.fixture(scope="module")
+def engine(aws):
+    """One RecommendationEngine over the module's moto tables, shared by the algorithm tests."""
+    return RecommendationEngine(
+        sake_table=aws.Table("SakeSensei-SakeMaster"),
+        brewery_table=aws.Table("SakeSensei-BreweryMaster"),
+        tasting_table=aws.Table("SakeSensei-TastingRecords"),
+    )
+
+
+@pytest.mark.unit
 class TestRecommendationLambda:
     """Tests for Recommendation Lambda handler."""
 
-    def test_handler_missing_user_id(self, lambda_context):
-        """Test handler with missing user_id."""
-        from backend.lambdas.recommendation.handler import handler
+    @pytest.mark.parametrize(
+        ("body", "message"),
+        [
+            pytest.param({}, "user_id", id="missing-user-id"),
+            pytest.param({"user_id": "test_user"}, "preferences", id="missing-preferences"),
+        ],
+    )
+    def test_handler_bad_request(self, recommendation_handler, lambda_context, body, message):
+        """Test handler rejects a request without a user_id or preferences."""
+        event = {"body": json.dumps(body)}
 
-        event = {"body": json.dumps({})}
-
-        response = handler(event, lambda_context)
+        response = recommendation_handler(event, lambda_context)
 
         assert response["statusCode"] == 400
         body = json.loads(response["body"])
         assert body["error"] == "BadRequest"
-        assert "user_id" in body["message"]
-
-    def test_handler_with_preferences(self, lambda_context, mock_dynamodb_table):
-        """Test handler with user preferences."""
-        from backend.lambdas.recommendation.handler import handler
-
-        # Mock user preferences
-        mock_dynamodb_table.get_item.return_value = {
-            "Item": {
-                "user_id": "test_user",
-                "flavor_preference": "light",
-                "sweetness": 3,
-                "dryness": 7,
-            }
-        }
-
-        # Mock sake database query
-        mock_dynamodb_table.scan.return_value = {
-            "Items": [
-                {
-                    "sake_id": "S001",
-                    "name": "獺祭",
-                    "category": "junmai_daiginjo",
-                    "flavor_profile": {"sweetness": 3, "dryness": 7, "umami": 5},
+        assert message in body["message"]
+
+    def test_handler_with_preferences(self, recommendation_handler, lambda_context, sake_table):
+        """Test handler ranks the closest taste match first."""
+        for sake_id, sweetness in [("S001", 5), ("S002", 1)]:
+            sake_table.put_item(
+                Item={
+                    "sake_id": sake_id,
+                    "name": f"Sake {sake_id}",
+                    "brewery_id": "B001",
+                    "category": "junmai",
+                    "price": 3000,
+                    "sweetness": sweetness,
                 }
-            ]
-        }
+            )
 
-        event = {"body": json.dumps({"user_id": "test_user"})}
+        event = {"body": json.dumps({"user_id": "test_user", "preferences": {"sweetness": 5}})}
 
-        response = handler(event, lambda_context)
+        response = recommendation_handler(event, lambda_context)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
-        assert "data" in body
-        assert "recommendations" in body["data"]
-
-    def test_handler_invalid_limit(self, lambda_context):
-        """Test handler with invalid limit parameter."""
-        from backend.lambdas.recommendation.handler import handler
-
-        event = {"body": json.dumps({"user_id": "test_user", "limit": -1})}
-
-        response = handler(event, lambda_context)
-
-        assert response["statusCode"] == 400
-
-    def test_handler_with_category_filter(self, lambda_context, mock_dynamodb_table):
-        """Test handler with category filter."""
-        from backend.lambdas.recommendation.handler import handler
-
-        mock_dynamodb_table.get_item.return_value = {"Item": {"user_id": "test_user"}}
-        mock_dynamodb_table.scan.return_value = {"Items": []}
+        recommendations = json.loads(response["body"])["data"]["recommendations"]
+        assert [r["sake_id"] for r in recommendations] == ["S001", "S002"]
+        assert recommendations[0]["price"] == 3000
+
+    def test_handler_with_category_filter(self, recommendation_handler, lambda_context, sake_table):
+        """Test handler returns only sake in the preferred categories."""
+        for sake_id, category in [("S001", "junmai_daiginjo"), ("S002", "honjozo")]:
+            sake_table.put_item(
+                Item={
+                    "sake_id": sake_id,
+                    "name": f"Sake {sake_id}",
+                    "brewery_id": "B001",
+                    "category": category,
+                    "price": 3000,
+                }
+            )
 
         event = {
-            "body": json.dumps({"user_id": "test_user", "category": "junmai_daiginjo"})
+            "body": json.dumps(
+                {
+                    "user_id": "test_user",
+                    "preferences": {"categories": ["junmai_daiginjo"]},
+                }
+            )
         }
 
-        response = handler(event, lambda_context)
+        response = recommendation_handler(event, lambda_context)
 
         assert response["statusCode"] == 200
+        recommendations = json.loads(response["body"])["data"]["recommendations"]
+        assert [r["sake_id"] for r in recommendations] == ["S001"]
 
 
+@pytest.mark.unit
 class TestRecommendationAlgorithm:
     """Tests for recommendation algorithm."""
 
-    def test_calculate_match_score(self):
-        """Test match score calculation."""
-        from backend.lambdas.recommendation.algorithm import RecommendationEngine
-
-        engine = RecommendationEngine()
-
-        user_prefs = {"sweetness": 5, "dryness": 5, "umami": 5}
-        sake_profile = {"sweetness": 5, "dryness": 5, "umami": 5}
-
-        score = engine._calculate_match_score(user_prefs, sake_profile)
-
-        # Perfect match should have high score
-        assert score > 0.9
-
-    def test_calculate_match_score_mismatch(self):
-        """Test match score with mismatched profiles."""
-        from backend.lambdas.recommendation.algorithm import RecommendationEngine
-
-        engine = RecommendationEngine()
+    def test_calculate_taste_match(self, engine):
+        """Test taste match score calculation."""
+        taste = {"sweetness": 5, "acidity": 5, "richness": 5}
+        # DynamoDB returns numbers as Decimal
+        sake = {key: Decimal(value) for key, value in taste.items()}
 
-        user_prefs = {"sweetness": 1, "dryness": 1, "umami": 1}
-        sake_profile = {"sweetness": 10, "dryness": 10, "umami": 10}
+        score = engine._calculate_taste_match(sake, taste)
 
-        score = engine._calculate_match_score(user_prefs, sake_profile)
+        # Perfect match scores the maximum
+        assert score == 100.0
 
-        # Mismatch should have low score
-        assert score < 0.5
+    def test_calculate_taste_match_mismatch(self, engine):
+        """Test taste match score with opposite profiles."""
+        preferences = {"sweetness": 1, "acidity": 1, "richness": 1}
+        sake = {"sweetness": 5, "acidity": 5, "richness": 5}
 
-    def test_recommend_with_empty_sake_list(self):
-        """Test recommendation with empty sake list."""
-        from backend.lambdas.recommendation.algorithm import RecommendationEngine
+        score = engine._calculate_taste_match(sake, preferences)
 
-        engine = RecommendationEngine()
+        # Maximum distance on every dimension scores zero
+        assert score == 0.0
 
+    def test_recommend_with_empty_sake_table(self, engine, sake_table):
+        """Test recommendation when there is no sake to recommend."""
         recommendations = engine.recommend(
-            user_preferences={"sweetness": 5}, sake_list=[], limit=5
+            "test_user", preferences={"sweetness": 5}, tasting_history=[], limit=5
         )
 
-        assert len(recommendations) == 0
+        assert recommendations == []
 
-    def test_recommend_respects_limit(self):
+    def test_recommend_respects_limit(self, engine, sake_table):
         """Test that recommendation respects limit parameter."""
-        from backend.lambdas.recommendation.algorithm import RecommendationEngine
+        with sake_table.batch_writer() as batch:
+            for i in range(20):
+                batch.put_item(
+                    Item={
+                        "sake_id": f"S{i:03d}",
+                        "name": f"Sake {i}",
+                        "brewery_id": "B001",
+                        "category": "junmai",
+                        "sweetness": i % 5 + 1,
+                        "acidity": 5 - i % 5,
+                    }
+                )
 
-        engine = RecommendationEngine()
+        recommendations = engine.recommend(
+            "test_user", preferences={"sweetness": 5, "acidity": 1}, tasting_history=[], limit=5
+        )
+
+        assert len(recommendations) == 5
+        scores = [r["score"] for r in recommendations]
+        assert scores == sorted(scores, reverse=True)
+        # The four exact taste matches rank ahead of everything else
+        assert {r["sake_id"] for r in recommendations[:4]} == {"S004", "S009", "S014", "S019"}
+
+    def test_recommend_queries_category_index(self, engine, sake_table):
+        """Preferred categories are read from the CategoryIndex GSI, within budget."""
+        for sake_id, category, price in [
+            ("S001", "junmai_daiginjo", 3000),
+            ("S002", "junmai_daiginjo", 9000),
+            ("S003", "honjozo", 2000),
+        ]:
+            sake_table.put_item(
+                Item={
+                    "sake_id": sake_id,
+                    "name": f"Sake {sake_id}",
+                    "brewery_id": "B001",
+                    "category": category,
+                    "price": price,
+                }
+            )
+
+        # Patch the engine's own Table object; the fixture's is a separate instance
+        with patch.object(engine.sake_table, "scan", wraps=engine.sake_table.scan) as scan:
+            recommendations = engine.recommend(
+                "test_user",
+                preferences={"categories": ["junmai_daiginjo"], "budget": 5000},
+                tasting_history=[],
+            )
+
+        assert [r["sake_id"] for r in recommendations] == ["S001"]
+        scan.assert_not_called()
+
+    def test_recommend_skips_failed_category(self, engine, sake_table):
+        """A failed CategoryIndex query drops only that category's sake."""
+        for sake_id, category in [("S001", "junmai_daiginjo"), ("S003", "honjozo")]:
+            sake_table.put_item(
+                Item={
+                    "sake_id": sake_id,
+                    "name": f"Sake {sake_id}",
+                    "brewery_id": "B001",
+                    "category": category,
+                    "price": 3000,
+                }
+            )
+        throttled = ClientError(
+            {"Error": {"Code": "ProvisionedThroughputExceededException"}}, "Query"
+        )
 
-        sake_list = [
-            {
-                "sake_id": f"S{i:03d}",
-                "name": f"Sake {i}",
-                "flavor_profile": {"sweetness": i % 10, "dryness": 10 - (i % 10)},
-            }
-            for i in range(20)
-        ]
+        # The first query (junmai_daiginjo) fails; the next one reaches moto
+        with patch.object(
+            engine.sake_table,
+            "query",
+            wraps=engine.sake_table.query,
+            side_effect=[throttled, DEFAULT],
+        ):
+            recommendations = engine.recommend(
+                "test_user",
+                preferences={"categories": ["junmai_daiginjo", "honjozo"]},
+                tasting_history=[],
+            )
+
+        assert [r["sake_id"] for r in recommendations] == ["S003"]
+
+    def test_recommend_category_index_omits_unpriced_sake(self, engine, sake_table):
+        """CategoryIndex is sparse on price, so only the scan path returns unpriced sake."""
+        for sake_id, price_attr in [("S001", {"price": 3000}), ("S002", {})]:
+            sake_table.put_item(
+                Item={
+                    "sake_id": sake_id,
+                    "name": f"Sake {sake_id}",
+                    "brewery_id": "B001",
+                    "category": "junmai",
+                    **price_attr,
+                }
+            )
 
-        recommendations = engine.recommend(
-            user_preferences={"sweetness": 5, "dryness": 5}, sake_list=sake_list, limit=5
+        by_category = engine.recommend(
+            "test_user", preferences={"categories": ["junmai"]}, tasting_history=[]
         )
+        by_scan = engine.recommend("test_user", preferences={}, tasting_history=[])
 
-        assert len(recommendations) <= 5
+        assert [r["sake_id"] for r in by_category] == ["S001"]
+        assert {r["sake_id"] for r in by_scan} == {"S001", "S002"}
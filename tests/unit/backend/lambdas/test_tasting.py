@@ -3,197 +3,131 @@ Unit tests for Tasting Lambda function.
 """
 
 import json
-from datetime import datetime
-from unittest.mock import MagicMock, patch
 
 import pytest
 
-
-@pytest.fixture
-def lambda_context():
-    """Mock Lambda context."""
-    context = MagicMock()
-    context.function_name = "test-function"
-    context.invoked_function_arn = "arn:aws:lambda:us-west-2:123456789012:function:test"
-    context.memory_limit_in_mb = 128
-    context.request_id = "test-request-id"
-    return context
-
-
-@pytest.fixture
-def mock_dynamodb():
-    """Mock DynamoDB resource."""
-    with patch("boto3.resource") as mock_resource:
-        mock_table = MagicMock()
-        mock_resource.return_value.Table.return_value = mock_table
-        yield mock_table
-
-
+FLAVOR_PROFILE = {"sweetness": 3, "acidity": 2, "body": 4, "aroma_intensity": 5}
+
+# Stored record, as the handler writes it (datetimes as ISO strings)
+RECORD = {
+    "user_id": "test_user",
+    "record_id": "R123",
+    "sake_id": "S001",
+    "rating": 5,
+    "notes": "",
+    "flavor_profile": FLAVOR_PROFILE,
+    "photos": [],
+    "visited_at": "2025-10-01T19:00:00",
+    "created_at": "2025-10-01T19:00:00",
+    "updated_at": "2025-10-01T19:00:00",
+}
+
+# Create request lacking only a rating
+CREATE_BODY = {
+    "user_id": "test_user",
+    "sake_id": "S001",
+    "flavor_profile": FLAVOR_PROFILE,
+    "visited_at": "2025-10-01T19:00:00",
+}
+
+# Table key of RECORD, also its /api/tasting/{user_id}/{record_id} path parameters
+RECORD_KEY = {"user_id": "test_user", "record_id": "R123"}
+
+
+def _event(method, path_parameters=None, body=None):
+    """API Gateway proxy event for the tasting routes."""
+    event = {"httpMethod": method, "pathParameters": path_parameters or {}}
+    if body is not None:
+        event["body"] = json.dumps(body)
+    return event
+
+
+@pytest.mark.unit
 class TestTastingLambda:
     """Tests for Tasting Lambda handler."""
 
-    def test_handler_create_record(self, lambda_context, mock_dynamodb):
+    def test_handler_create_record(self, tasting_handler, lambda_context, tasting_table):
         """Test creating a tasting record."""
-        from backend.lambdas.tasting.handler import handler
-
-        mock_dynamodb.put_item.return_value = {}
+        event = _event("POST", body={**CREATE_BODY, "rating": 5, "notes": "とても美味しい"})
 
-        event = {
-            "body": json.dumps({
-                "action": "create",
-                "user_id": "test_user",
-                "sake_name": "獺祭 純米大吟醸",
-                "rating": 5,
-                "notes": "とても美味しい",
-                "aroma": 5,
-                "taste": 5,
-                "aftertaste": 4,
-            })
-        }
-
-        response = handler(event, lambda_context)
+        response = tasting_handler(event, lambda_context)
 
         assert response["statusCode"] == 201
-        body = json.loads(response["body"])
-        assert "record_id" in body["data"]
-        assert mock_dynamodb.put_item.called
+        record_id = json.loads(response["body"])["data"]["record"]["record_id"]
+        assert response["headers"]["Location"] == f"/api/tasting/test_user/{record_id}"
+        stored = tasting_table.get_item(Key={"user_id": "test_user", "record_id": record_id})
+        assert stored["Item"]["notes"] == "とても美味しい"
 
-    def test_handler_get_record(self, lambda_context, mock_dynamodb):
+    def test_handler_get_record(self, tasting_handler, lambda_context, tasting_table):
         """Test getting a tasting record."""
-        from backend.lambdas.tasting.handler import handler
-
-        mock_dynamodb.get_item.return_value = {
-            "Item": {
-                "record_id": "R123",
-                "user_id": "test_user",
-                "sake_name": "獺祭",
-                "rating": 5,
-                "created_at": "2025-10-01T12:00:00Z",
-            }
-        }
-
-        event = {
-            "body": json.dumps({"action": "get", "user_id": "test_user", "record_id": "R123"})
-        }
+        tasting_table.put_item(Item=RECORD)
 
-        response = handler(event, lambda_context)
+        response = tasting_handler(_event("GET", RECORD_KEY), lambda_context)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
-        assert body["data"]["record_id"] == "R123"
+        record = json.loads(response["body"])["data"]["record"]
+        assert record["record_id"] == "R123"
+        assert record["rating"] == 5
 
-    def test_handler_get_record_not_found(self, lambda_context, mock_dynamodb):
+    def test_handler_get_record_not_found(self, tasting_handler, lambda_context, tasting_table):
         """Test getting non-existent record."""
-        from backend.lambdas.tasting.handler import handler
+        event = _event("GET", {"user_id": "test_user", "record_id": "INVALID"})
 
-        mock_dynamodb.get_item.return_value = {}
-
-        event = {
-            "body": json.dumps({"action": "get", "user_id": "test_user", "record_id": "INVALID"})
-        }
-
-        response = handler(event, lambda_context)
+        response = tasting_handler(event, lambda_context)
 
         assert response["statusCode"] == 404
 
-    def test_handler_list_records(self, lambda_context, mock_dynamodb):
+    def test_handler_list_records(self, tasting_handler, lambda_context, tasting_table):
         """Test listing user's tasting records."""
-        from backend.lambdas.tasting.handler import handler
-
-        mock_dynamodb.query.return_value = {
-            "Items": [
-                {
-                    "record_id": "R123",
-                    "user_id": "test_user",
-                    "sake_name": "獺祭",
-                    "rating": 5,
-                },
-                {
-                    "record_id": "R124",
-                    "user_id": "test_user",
-                    "sake_name": "久保田",
-                    "rating": 4,
-                },
-            ]
-        }
-
-        event = {"body": json.dumps({"action": "list", "user_id": "test_user"})}
-
-        response = handler(event, lambda_context)
+        for item in (
+            RECORD,
+            {**RECORD, "record_id": "R124", "sake_id": "S002"},
+            {**RECORD, "user_id": "other_user", "record_id": "R125"},
+        ):
+            tasting_table.put_item(Item=item)
+
+        response = tasting_handler(_event("GET", {"user_id": "test_user"}), lambda_context)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
-        assert len(body["data"]["records"]) == 2
+        data = json.loads(response["body"])["data"]
+        # Newest record_id first
+        assert [r["record_id"] for r in data["records"]] == ["R124", "R123"]
+        assert data["count"] == 2
 
-    def test_handler_delete_record(self, lambda_context, mock_dynamodb):
+    def test_handler_delete_record(self, tasting_handler, lambda_context, tasting_table):
         """Test deleting a tasting record."""
-        from backend.lambdas.tasting.handler import handler
+        tasting_table.put_item(Item=RECORD)
 
-        mock_dynamodb.delete_item.return_value = {}
-
-        event = {
-            "body": json.dumps({
-                "action": "delete",
-                "user_id": "test_user",
-                "record_id": "R123",
-            })
-        }
-
-        response = handler(event, lambda_context)
+        response = tasting_handler(_event("DELETE", RECORD_KEY), lambda_context)
 
         assert response["statusCode"] == 204
-        assert mock_dynamodb.delete_item.called
-
-    def test_handler_missing_required_fields(self, lambda_context):
-        """Test create with missing required fields."""
-        from backend.lambdas.tasting.handler import handler
-
-        event = {
-            "body": json.dumps({"action": "create", "user_id": "test_user"})
-            # Missing sake_name and rating
-        }
-
-        response = handler(event, lambda_context)
+        assert tasting_table.scan()["Count"] == 0
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            pytest.param({"user_id": "test_user"}, id="missing-fields"),
+            pytest.param({**CREATE_BODY, "rating": 10}, id="rating-too-high"),
+            pytest.param({**CREATE_BODY, "rating": 0}, id="rating-too-low"),
+        ],
+    )
+    def test_handler_create_invalid(self, tasting_handler, lambda_context, tasting_table, body):
+        """Test create with missing fields or an out-of-range rating (valid: 1-5)."""
+        response = tasting_handler(_event("POST", body=body), lambda_context)
 
         assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"] == "ValidationError"
+        assert tasting_table.scan()["Count"] == 0
 
-    def test_handler_invalid_rating(self, lambda_context):
-        """Test create with invalid rating value."""
-        from backend.lambdas.tasting.handler import handler
-
-        event = {
-            "body": json.dumps({
-                "action": "create",
-                "user_id": "test_user",
-                "sake_name": "Test Sake",
-                "rating": 10,  # Invalid: max is 5
-            })
-        }
-
-        response = handler(event, lambda_context)
-
-        assert response["statusCode"] == 400
-
-    def test_handler_update_record(self, lambda_context, mock_dynamodb):
+    def test_handler_update_record(self, tasting_handler, lambda_context, tasting_table):
         """Test updating a tasting record."""
-        from backend.lambdas.tasting.handler import handler
-
-        mock_dynamodb.get_item.return_value = {
-            "Item": {"record_id": "R123", "user_id": "test_user", "sake_name": "獺祭"}
-        }
-        mock_dynamodb.update_item.return_value = {}
+        tasting_table.put_item(Item=RECORD)
 
-        event = {
-            "body": json.dumps({
-                "action": "update",
-                "user_id": "test_user",
-                "record_id": "R123",
-                "rating": 5,
-                "notes": "Updated notes",
-            })
-        }
+        event = _event("PUT", RECORD_KEY, {"rating": 4, "notes": "Updated notes"})
 
-        response = handler(event, lambda_context)
+        response = tasting_handler(event, lambda_context)
 
         assert response["statusCode"] == 200
-        assert mock_dynamodb.update_item.called
+        item = tasting_table.get_item(Key=RECORD_KEY)["Item"]
+        assert item["notes"] == "Updated notes"
+        assert item["rating"] == 4
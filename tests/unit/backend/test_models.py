@@ -1,10 +1,23 @@
 """Unit tests for data models."""
 
+from collections.abc import Mapping
+from typing import Annotated, Any
+
 import pytest
+from pydantic import Field, TypeAdapter
 
 from tests.fixtures.sake import sample_brewery, sample_sake, sample_tasting_record
 from tests.fixtures.users import sample_user, sample_user_preference
 
+# The 1-5 scale shared by every taste attribute, validated by pydantic-core in one call
+SCALES = TypeAdapter(dict[str, Annotated[float, Field(ge=1, le=5)]])
+TASTE_ATTRIBUTES = ("sweetness", "acidity", "richness", "aroma_intensity")
+
+
+def assert_taste_scales(data: Mapping[str, Any]) -> None:
+    """Validate that every taste attribute of ``data`` lies between 1 and 5."""
+    SCALES.validate_python({key: data[key] for key in TASTE_ATTRIBUTES})
+
 
 @pytest.mark.unit
 class TestUserModel:
@@ -21,10 +34,7 @@ class TestUserModel:
         """Test valid user preference model."""
         pref = sample_user_preference()
         assert pref["user_id"] == "test-user-123"
-        assert 1 <= pref["sweetness"] <= 5
-        assert 1 <= pref["acidity"] <= 5
-        assert 1 <= pref["richness"] <= 5
-        assert 1 <= pref["aroma_intensity"] <= 5
+        assert_taste_scales(pref)
 
 
 @pytest.mark.unit
@@ -37,10 +47,7 @@ class TestSakeModel:
         assert sake["sake_id"] == "sake-001"
         assert sake["name"]
         assert sake["type"] == "junmai_daiginjo"
-        assert 1 <= sake["sweetness"] <= 5
-        assert 1 <= sake["acidity"] <= 5
-        assert 1 <= sake["richness"] <= 5
-        assert 1 <= sake["aroma_intensity"] <= 5
+        assert_taste_scales(sake)
 
     def test_sake_flavor_profile(self) -> None:
         """Test sake flavor profile structure."""
@@ -51,7 +58,7 @@ class TestSakeModel:
         assert "rice" in flavor
         assert "spicy" in flavor
         assert "umami" in flavor
-        assert all(1 <= v <= 5 for v in flavor.values())
+        SCALES.validate_python(flavor)
 
     def test_sake_price_positive(self) -> None:
         """Test sake price is positive."""
@@ -88,9 +95,6 @@ class TestTastingRecordModel:
     def test_tasting_record_attributes(self) -> None:
         """Test tasting record attributes."""
         record = sample_tasting_record()
-        assert 1 <= record["sweetness"] <= 5
-        assert 1 <= record["acidity"] <= 5
-        assert 1 <= record["richness"] <= 5
-        assert 1 <= record["aroma_intensity"] <= 5
+        assert_taste_scales(record)
         assert isinstance(record["notes"], str)
-        assert isinstance(record["image_urls"], list)
+        assert isinstance(record["image_urls"], tuple)
@@ -0,0 +1,46 @@
+"""
+Minimal stand-in for the ``streamlit`` module in Streamlit app unit tests.
+
+Provides only what ``utils`` touches: a dict-backed ``session_state`` and
+no-op display calls, without MagicMock's per-access child mocks.
+"""
+
+from typing import Any
+
+
+class SessionState(dict):
+    """Dict with attribute access, like ``st.session_state``."""
+
+    __slots__ = ()
+
+    def __getattr__(self, key: str) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        self[key] = value
+
+    def __delattr__(self, key: str) -> None:
+        try:
+            del self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+
+session_state = SessionState()
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+balloons = _noop
+caption = _noop
+info = _noop
+markdown = _noop
+metric = _noop
+progress = _noop
+success = _noop
+toast = _noop
@@ -3,29 +3,41 @@ Pytest configuration for Streamlit app tests.
 """
 
 import sys
-from unittest.mock import MagicMock
 
 import pytest
 
-# Mock streamlit module globally
-mock_st = MagicMock()
-sys.modules["streamlit"] = mock_st
+from tests.unit.streamlit_app import _streamlit_stub
+
+# Stand in for streamlit globally, before any utils module imports it
+sys.modules["streamlit"] = _streamlit_stub
 
 
 @pytest.fixture(autouse=True)
-def mock_env_vars(monkeypatch):
-    """Mock environment variables for Streamlit app."""
-    monkeypatch.setenv("AWS_REGION", "us-west-2")
-    monkeypatch.setenv("AWS_ACCOUNT_ID", "123456789012")
-    monkeypatch.setenv("COGNITO_USER_POOL_ID", "us-west-2_XXXXX")
-    monkeypatch.setenv("COGNITO_CLIENT_ID", "test-client-id")
-    monkeypatch.setenv("AGENTCORE_GATEWAY_URL", "")
-    monkeypatch.setenv("LAMBDA_PREFERENCE_ARN", "arn:aws:lambda:us-west-2:123:function:pref")
-    monkeypatch.setenv(
-        "LAMBDA_RECOMMENDATION_ARN", "arn:aws:lambda:us-west-2:123:function:rec"
-    )
-    monkeypatch.setenv("LAMBDA_TASTING_ARN", "arn:aws:lambda:us-west-2:123:function:tasting")
-    monkeypatch.setenv("LAMBDA_BREWERY_ARN", "arn:aws:lambda:us-west-2:123:function:brewery")
-    monkeypatch.setenv(
-        "LAMBDA_IMAGE_RECOGNITION_ARN", "arn:aws:lambda:us-west-2:123:function:img"
-    )
+def _restore_session_state():
+    """Undo each test's writes to the stub's shared session_state."""
+    saved = dict(_streamlit_stub.session_state)
+    yield
+    _streamlit_stub.session_state.clear()
+    _streamlit_stub.session_state.update(saved)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_env_vars():
+    """Mock environment variables for Streamlit app, set once for the whole session.
+
+    Tests that need a different value override it locally with monkeypatch.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("AWS_REGION", "us-west-2")
+        monkeypatch.setenv("AWS_ACCOUNT_ID", "123456789012")
+        monkeypatch.setenv("COGNITO_USER_POOL_ID", "us-west-2_XXXXX")
+        monkeypatch.setenv("COGNITO_CLIENT_ID", "test-client-id")
+        monkeypatch.setenv("AGENTCORE_GATEWAY_URL", "")
+        monkeypatch.setenv("LAMBDA_PREFERENCE_ARN", "arn:aws:lambda:us-west-2:123:function:pref")
+        monkeypatch.setenv("LAMBDA_RECOMMENDATION_ARN", "arn:aws:lambda:us-west-2:123:function:rec")
+        monkeypatch.setenv("LAMBDA_TASTING_ARN", "arn:aws:lambda:us-west-2:123:function:tasting")
+        monkeypatch.setenv("LAMBDA_BREWERY_ARN", "arn:aws:lambda:us-west-2:123:function:brewery")
+        monkeypatch.setenv(
+            "LAMBDA_IMAGE_RECOGNITION_ARN", "arn:aws:lambda:us-west-2:123:function:img"
+        )
+        yield
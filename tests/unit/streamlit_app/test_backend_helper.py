@@ -2,95 +2,130 @@
 Unit tests for Streamlit Backend Helper.
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
+from urllib.request import Request
 
+import orjson
 import pytest
+from utils.backend_helper import BackendClient, BackendError, _lambda_client
 
 
+def _proxy_payload(data: dict) -> bytes:
+    """Lambda Payload bytes for an API Gateway-style 200 response wrapping ``data``."""
+    return orjson.dumps({"statusCode": 200, "body": orjson.dumps(data).decode()})
+
+
+PREFERENCES = {"sweetness": 4, "budget": 5000, "experience_level": "beginner"}
+
+# Lambda response payloads, serialized once rather than on every read
+SUCCESS_PAYLOAD = _proxy_payload({"success": True, "data": {"test": "value"}})
+ERROR_PAYLOAD = orjson.dumps({"errorMessage": "Test error"})
+PREFERENCES_PAYLOAD = _proxy_payload({"preferences": PREFERENCES})
+RECOMMENDATIONS_PAYLOAD = _proxy_payload(
+    {"recommendations": [{"sake_id": "S001", "name": "獺祭", "score": 95}]}
+)
+LABEL_PAYLOAD = _proxy_payload(
+    {"sake_name": "獺祭 純米大吟醸", "brewery_name": "旭酒造", "confidence": "high"}
+)
+
+
+def _invoked_event(mock_lambda) -> dict:
+    """The API Gateway-style event BackendClient sent in its last Lambda invoke."""
+    return orjson.loads(mock_lambda.invoke.call_args.kwargs["Payload"])
+
+
+@pytest.fixture(autouse=True)
+def backend(monkeypatch):
+    """Config and boto3 as looked up by utils.backend_helper, in fallback (no Gateway) mode."""
+    mock_config = MagicMock(AGENTCORE_GATEWAY_URL=None, AWS_REGION="us-west-2")
+    mock_boto3 = MagicMock()
+    monkeypatch.setattr("utils.backend_helper.config", mock_config)
+    monkeypatch.setattr("utils.backend_helper.boto3", mock_boto3)
+    # Drop clients cached from the real boto3 or an earlier test's mock
+    _lambda_client.cache_clear()
+    yield SimpleNamespace(config=mock_config, boto3=mock_boto3)
+    _lambda_client.cache_clear()
+
+
+@pytest.mark.unit
 class TestBackendClient:
     """Tests for BackendClient class."""
 
-    @patch("utils.config.config")
-    def test_init_with_gateway_url(self, mock_config):
+    def test_init_with_gateway_url(self, backend):
         """Test BackendClient initialization with Gateway URL."""
-        from utils.backend_helper import BackendClient
-
-        mock_config.AGENTCORE_GATEWAY_URL = "https://gateway.example.com"
-        mock_config.AWS_REGION = "us-west-2"
+        backend.config.AGENTCORE_GATEWAY_URL = "https://gateway.example.com"
 
         client = BackendClient()
 
         assert client.use_gateway is True
         assert client.gateway_url == "https://gateway.example.com"
 
-    @patch("utils.backend_helper.boto3")
-    @patch("utils.config.config")
-    def test_init_without_gateway_url(self, mock_config, mock_boto3):
+    def test_init_without_gateway_url(self, backend):
         """Test BackendClient initialization without Gateway URL (fallback mode)."""
-        from utils.backend_helper import BackendClient
-
-        mock_config.AGENTCORE_GATEWAY_URL = None
-        mock_config.AWS_REGION = "us-west-2"
-
         client = BackendClient()
 
         assert client.use_gateway is False
-        assert mock_boto3.client.called
+        assert backend.boto3.client.called
 
-    @patch("utils.backend_helper.SessionManager")
-    def test_get_headers_with_token(self, mock_session):
+    def test_get_headers_with_token(self, backend):
         """Test _get_headers with authentication token."""
-        from utils.backend_helper import BackendClient
-
-        mock_session.get_id_token.return_value = "test-token-123"
-
-        with patch("utils.config.config") as mock_config:
-            mock_config.AGENTCORE_GATEWAY_URL = "https://gateway.example.com"
-            client = BackendClient()
+        backend.config.AGENTCORE_GATEWAY_URL = "https://gateway.example.com"
+        client = BackendClient()
 
-        headers = client._get_headers()
+        headers = client._get_headers("test-token-123")
 
         assert headers["Content-Type"] == "application/json"
         assert headers["Authorization"] == "Bearer test-token-123"
 
-    @patch("utils.backend_helper.SessionManager")
-    def test_get_headers_without_token(self, mock_session):
-        """Test _get_headers without authentication token."""
-        from utils.backend_helper import BackendClient
+    def test_gateway_session_rejects_cookies(self, backend):
+        """Test the Gateway session never stores cookies, since every user shares the client."""
+        backend.config.AGENTCORE_GATEWAY_URL = "https://gateway.example.com"
+        client = BackendClient()
+        headers = Message()
+        headers["Set-Cookie"] = "session=abc; Path=/"
+        response = SimpleNamespace(info=lambda: headers)
 
-        mock_session.get_id_token.return_value = None
+        client.http.cookies.extract_cookies(
+            response, Request("https://gateway.example.com/invoke-tool")
+        )
 
-        with patch("utils.config.config") as mock_config:
-            mock_config.AGENTCORE_GATEWAY_URL = "https://gateway.example.com"
-            client = BackendClient()
+        assert len(client.http.cookies) == 0
 
-        headers = client._get_headers()
+    def test_gateway_session_per_thread(self, backend):
+        """Test each thread gets its own Gateway session, reused across its calls."""
+        backend.config.AGENTCORE_GATEWAY_URL = "https://gateway.example.com"
+        client = BackendClient()
 
-        assert headers["Content-Type"] == "application/json"
-        assert "Authorization" not in headers
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other_thread_session = pool.submit(lambda: client.http).result()
 
-    @patch("utils.backend_helper.boto3")
-    @patch("utils.config.config")
-    def test_invoke_lambda_direct_success(self, mock_config, mock_boto3):
-        """Test direct Lambda invocation success."""
-        from utils.backend_helper import BackendClient
+        assert client.http is client.http
+        assert other_thread_session is not client.http
+
+    @patch("utils.backend_helper.requests")
+    @patch("utils.backend_helper.SessionManager")
+    def test_make_request_without_token(self, mock_session, mock_requests, backend):
+        """Test _make_request fails fast without authentication token."""
+        mock_session.get_id_token.return_value = None
+
+        backend.config.AGENTCORE_GATEWAY_URL = "https://gateway.example.com"
+        client = BackendClient()
 
-        mock_config.AGENTCORE_GATEWAY_URL = None
-        mock_config.AWS_REGION = "us-west-2"
+        with pytest.raises(BackendError, match="Not authenticated"):
+            client._make_request("test_tool", {"param": "value"})
 
+        mock_requests.Session.return_value.post.assert_not_called()
+
+    def test_invoke_lambda_direct_success(self, backend):
+        """Test direct Lambda invocation success."""
         mock_lambda = MagicMock()
-        mock_boto3.client.return_value = mock_lambda
+        backend.boto3.client.return_value = mock_lambda
 
         # Mock successful Lambda response
-        mock_lambda.invoke.return_value = {
-            "Payload": MagicMock(
-                read=lambda: json.dumps({
-                    "statusCode": 200,
-                    "body": json.dumps({"success": True, "data": {"test": "value"}}),
-                }).encode()
-            )
-        }
+        mock_lambda.invoke.return_value = {"Payload": MagicMock(read=lambda: SUCCESS_PAYLOAD)}
 
         client = BackendClient()
         result = client._invoke_lambda_direct(
@@ -100,24 +135,13 @@ class TestBackendClient:
         assert result["success"] is True
         assert result["data"]["test"] == "value"
 
-    @patch("utils.backend_helper.boto3")
-    @patch("utils.config.config")
-    def test_invoke_lambda_direct_error(self, mock_config, mock_boto3):
+    def test_invoke_lambda_direct_error(self, backend):
         """Test direct Lambda invocation with error."""
-        from utils.backend_helper import BackendClient, BackendError
-
-        mock_config.AGENTCORE_GATEWAY_URL = None
-        mock_config.AWS_REGION = "us-west-2"
-
         mock_lambda = MagicMock()
-        mock_boto3.client.return_value = mock_lambda
+        backend.boto3.client.return_value = mock_lambda
 
         # Mock Lambda error response
-        mock_lambda.invoke.return_value = {
-            "Payload": MagicMock(
-                read=lambda: json.dumps({"errorMessage": "Test error"}).encode()
-            )
-        }
+        mock_lambda.invoke.return_value = {"Payload": MagicMock(read=lambda: ERROR_PAYLOAD)}
 
         client = BackendClient()
 
@@ -128,13 +152,9 @@ class TestBackendClient:
 
     @patch("utils.backend_helper.requests")
     @patch("utils.backend_helper.SessionManager")
-    @patch("utils.config.config")
-    def test_make_request_with_gateway(self, mock_config, mock_session, mock_requests):
+    def test_make_request_with_gateway(self, mock_session, mock_requests, backend):
         """Test _make_request using Gateway."""
-        from utils.backend_helper import BackendClient
-
-        mock_config.AGENTCORE_GATEWAY_URL = "https://gateway.example.com"
-        mock_config.AWS_REGION = "us-west-2"
+        backend.config.AGENTCORE_GATEWAY_URL = "https://gateway.example.com"
         mock_session.get_id_token.return_value = "test-token"
 
         # Mock successful Gateway response
@@ -144,137 +164,86 @@ class TestBackendClient:
             "isError": False,
             "content": {"result": "success"},
         }
-        mock_requests.post.return_value = mock_response
+        mock_requests.Session.return_value.post.return_value = mock_response
 
         client = BackendClient()
         result = client._make_request("test_tool", {"param": "value"})
 
         assert result["result"] == "success"
-        mock_requests.post.assert_called_once()
+        mock_requests.Session.return_value.post.assert_called_once()
 
-    @patch("utils.backend_helper.boto3")
     @patch("utils.backend_helper.SessionManager")
-    @patch("utils.config.config")
-    def test_get_user_preferences_success(self, mock_config, mock_session, mock_boto3):
+    def test_get_user_preferences_success(self, mock_session, backend):
         """Test get_user_preferences success."""
-        from utils.backend_helper import BackendClient
-
-        mock_config.AGENTCORE_GATEWAY_URL = None
-        mock_config.AWS_REGION = "us-west-2"
-        mock_config.LAMBDA_PREFERENCE_ARN = "arn:aws:lambda:us-west-2:123:function:pref"
+        backend.config.LAMBDA_PREFERENCE_ARN = "arn:aws:lambda:us-west-2:123:function:pref"
         mock_session.get_user_id.return_value = "test-user-123"
 
         mock_lambda = MagicMock()
-        mock_boto3.client.return_value = mock_lambda
+        backend.boto3.client.return_value = mock_lambda
 
         # Mock Lambda response
-        mock_lambda.invoke.return_value = {
-            "Payload": MagicMock(
-                read=lambda: json.dumps({
-                    "statusCode": 200,
-                    "body": json.dumps({
-                        "data": {
-                            "user_id": "test-user-123",
-                            "flavor_preference": "rich",
-                            "sweetness": 7,
-                        }
-                    }),
-                }).encode()
-            )
-        }
+        mock_lambda.invoke.return_value = {"Payload": MagicMock(read=lambda: PREFERENCES_PAYLOAD)}
 
         client = BackendClient()
         prefs = client.get_user_preferences()
 
-        assert prefs["user_id"] == "test-user-123"
-        assert prefs["flavor_preference"] == "rich"
+        assert prefs == PREFERENCES
+        event = _invoked_event(mock_lambda)
+        assert orjson.loads(event["body"]) == {"action": "get", "user_id": "test-user-123"}
+        assert mock_lambda.invoke.call_args.kwargs["FunctionName"].endswith("function:pref")
 
-    @patch("utils.backend_helper.boto3")
     @patch("utils.backend_helper.SessionManager")
-    @patch("utils.config.config")
-    def test_get_sake_recommendations(self, mock_config, mock_session, mock_boto3):
-        """Test get_sake_recommendations."""
-        from utils.backend_helper import BackendClient
-
-        mock_config.AGENTCORE_GATEWAY_URL = None
-        mock_config.AWS_REGION = "us-west-2"
-        mock_config.LAMBDA_RECOMMENDATION_ARN = "arn:aws:lambda:us-west-2:123:function:rec"
+    def test_get_recommendations(self, mock_session, backend):
+        """Test get_recommendations."""
+        backend.config.LAMBDA_RECOMMENDATION_ARN = "arn:aws:lambda:us-west-2:123:function:rec"
         mock_session.get_user_id.return_value = "test-user-123"
 
         mock_lambda = MagicMock()
-        mock_boto3.client.return_value = mock_lambda
+        backend.boto3.client.return_value = mock_lambda
 
         # Mock Lambda response
         mock_lambda.invoke.return_value = {
-            "Payload": MagicMock(
-                read=lambda: json.dumps({
-                    "statusCode": 200,
-                    "body": json.dumps({
-                        "data": {
-                            "recommendations": [
-                                {"sake_id": "S001", "name": "獺祭", "score": 95}
-                            ]
-                        }
-                    }),
-                }).encode()
-            )
+            "Payload": MagicMock(read=lambda: RECOMMENDATIONS_PAYLOAD)
         }
 
         client = BackendClient()
-        recs = client.get_sake_recommendations(limit=5)
+        recs = client.get_recommendations(PREFERENCES, limit=5)
 
-        assert len(recs) == 1
-        assert recs[0]["name"] == "獺祭"
+        assert [rec["name"] for rec in recs] == ["獺祭"]
+        assert orjson.loads(_invoked_event(mock_lambda)["body"]) == {
+            "user_id": "test-user-123",
+            "limit": 5,
+            "preferences": PREFERENCES,
+        }
 
-    @patch("utils.backend_helper.boto3")
     @patch("utils.backend_helper.SessionManager")
-    @patch("utils.config.config")
-    def test_recognize_sake_label(self, mock_config, mock_session, mock_boto3):
+    def test_recognize_sake_label(self, mock_session, backend):
         """Test recognize_sake_label."""
-        from utils.backend_helper import BackendClient
-
-        mock_config.AGENTCORE_GATEWAY_URL = None
-        mock_config.AWS_REGION = "us-west-2"
-        mock_config.LAMBDA_IMAGE_RECOGNITION_ARN = (
-            "arn:aws:lambda:us-west-2:123:function:img"
-        )
+        backend.config.LAMBDA_IMAGE_RECOGNITION_ARN = "arn:aws:lambda:us-west-2:123:function:img"
+        mock_session.get_user_id.return_value = "test-user-123"
 
         mock_lambda = MagicMock()
-        mock_boto3.client.return_value = mock_lambda
+        backend.boto3.client.return_value = mock_lambda
 
         # Mock Lambda response
-        mock_lambda.invoke.return_value = {
-            "Payload": MagicMock(
-                read=lambda: json.dumps({
-                    "statusCode": 200,
-                    "body": json.dumps({
-                        "data": {
-                            "sake_name": "獺祭 純米大吟醸",
-                            "brewery_name": "旭酒造",
-                            "confidence": "high",
-                        }
-                    }),
-                }).encode()
-            )
-        }
+        mock_lambda.invoke.return_value = {"Payload": MagicMock(read=lambda: LABEL_PAYLOAD)}
 
         client = BackendClient()
         result = client.recognize_sake_label("base64encodedimage", "image/jpeg")
 
         assert result["sake_name"] == "獺祭 純米大吟醸"
         assert result["brewery_name"] == "旭酒造"
+        event = _invoked_event(mock_lambda)
+        assert orjson.loads(event["body"]) == {
+            "image_base64": "base64encodedimage",
+            "content_type": "image/jpeg",
+        }
+        assert event["requestContext"]["authorizer"]["user_id"] == "test-user-123"
 
-    @patch("utils.backend_helper.boto3")
-    @patch("utils.config.config")
-    def test_backend_error_exception(self, mock_config, mock_boto3):
+    def test_backend_error_exception(self, backend):
         """Test BackendError exception."""
-        from utils.backend_helper import BackendClient, BackendError
-
-        mock_config.AGENTCORE_GATEWAY_URL = None
-        mock_config.AWS_REGION = "us-west-2"
-
         mock_lambda = MagicMock()
-        mock_boto3.client.return_value = mock_lambda
+        backend.boto3.client.return_value = mock_lambda
 
         # Mock Lambda exception
         mock_lambda.invoke.side_effect = Exception("Connection failed")
@@ -282,6 +251,4 @@ class TestBackendClient:
         client = BackendClient()
 
         with pytest.raises(BackendError, match="Lambda invocation failed"):
-            client._invoke_lambda_direct(
-                "arn:aws:lambda:us-west-2:123:function:test", {}
-            )
+            client._invoke_lambda_direct("arn:aws:lambda:us-west-2:123:function:test", {})
@@ -5,100 +5,99 @@ Tests for configuration management and validation.
 """
 
 import os
+from dataclasses import FrozenInstanceError, fields, replace
 from unittest.mock import patch
 
 import pytest
 
 
+def field_names(instance) -> frozenset[str]:
+    """Names of a dataclass instance's fields."""
+    return frozenset(f.name for f in fields(instance))
+
+
+@pytest.fixture(scope="module")
+def config():
+    """App config, imported once the session's test environment is in place."""
+    from streamlit_app.utils.config import config
+
+    return config
+
+
+@pytest.mark.unit
 class TestConfigLoading:
     """Test configuration loading from environment variables."""
 
-    def test_config_defaults(self):
+    def test_config_defaults(self, config):
         """Test default configuration values."""
-        from streamlit_app.utils.config import Config
-
-        assert Config.AWS_REGION == "us-west-2"
-        assert Config.APP_NAME == "Sake Sensei"
-        assert Config.APP_ENV == "development"
-        assert Config.BEDROCK_MAX_TOKENS == 4096
-        assert Config.BEDROCK_TEMPERATURE == 0.7
-        assert Config.RECOMMENDATION_MAX_RESULTS == 5
+        assert config.AWS_REGION == "us-west-2"
+        assert config.APP_NAME == "Sake Sensei"
+        assert config.APP_ENV == "development"
+        assert config.BEDROCK_MAX_TOKENS == 4096
+        assert config.BEDROCK_TEMPERATURE == 0.7
+        assert config.RECOMMENDATION_MAX_RESULTS == 5
 
     @patch.dict(os.environ, {"AWS_REGION": "us-east-1", "APP_ENV": "production"})
     def test_config_from_env(self):
         """Test configuration loaded from environment variables."""
-        from streamlit_app.utils.config import Config
-
         # Reload config with new env vars
-        # Note: Config class variables are set at module load time
+        # Note: config values are read when the instance is created at module load
         assert os.getenv("AWS_REGION") == "us-east-1"
         assert os.getenv("APP_ENV") == "production"
 
-    def test_config_boolean_parsing(self):
+    def test_config_boolean_parsing(self, config):
         """Test boolean configuration parsing."""
-        from streamlit_app.utils.config import Config
-
         # Test default values
-        assert isinstance(Config.APP_DEBUG, bool)
-        assert isinstance(Config.BEDROCK_STREAMING, bool)
-        assert isinstance(Config.FEATURE_IMAGE_RECOGNITION, bool)
+        assert isinstance(config.APP_DEBUG, bool)
+        assert isinstance(config.BEDROCK_STREAMING, bool)
+        assert isinstance(config.FEATURE_IMAGE_RECOGNITION, bool)
 
-    def test_config_integer_parsing(self):
+    def test_config_integer_parsing(self, config):
         """Test integer configuration parsing."""
-        from streamlit_app.utils.config import Config
-
-        assert isinstance(Config.BEDROCK_MAX_TOKENS, int)
-        assert isinstance(Config.RECOMMENDATION_MAX_RESULTS, int)
-        assert isinstance(Config.STREAMLIT_SERVER_PORT, int)
-        assert isinstance(Config.JWT_EXPIRATION_MINUTES, int)
+        assert isinstance(config.BEDROCK_MAX_TOKENS, int)
+        assert isinstance(config.RECOMMENDATION_MAX_RESULTS, int)
+        assert isinstance(config.STREAMLIT_SERVER_PORT, int)
+        assert isinstance(config.JWT_EXPIRATION_MINUTES, int)
 
-    def test_config_float_parsing(self):
+    def test_config_float_parsing(self, config):
         """Test float configuration parsing."""
-        from streamlit_app.utils.config import Config
-
-        assert isinstance(Config.BEDROCK_TEMPERATURE, float)
-        assert isinstance(Config.RECOMMENDATION_DIVERSITY_WEIGHT, float)
-        assert isinstance(Config.RECOMMENDATION_COLLABORATIVE_WEIGHT, float)
-        assert isinstance(Config.RECOMMENDATION_CONTENT_WEIGHT, float)
+        assert isinstance(config.BEDROCK_TEMPERATURE, float)
+        assert isinstance(config.RECOMMENDATION_DIVERSITY_WEIGHT, float)
+        assert isinstance(config.RECOMMENDATION_COLLABORATIVE_WEIGHT, float)
+        assert isinstance(config.RECOMMENDATION_CONTENT_WEIGHT, float)
 
 
+@pytest.mark.unit
 class TestConfigValidation:
     """Test configuration validation."""
 
-    @patch.dict(
-        os.environ,
-        {
-            "AWS_REGION": "us-west-2",
-            "COGNITO_USER_POOL_ID": "test-pool-id",
-            "COGNITO_CLIENT_ID": "test-client-id",
-        },
-    )
-    def test_validate_success(self):
+    def test_validate_success(self, config):
         """Test successful configuration validation."""
-        from streamlit_app.utils.config import Config
-
-        # Create a new config instance with mocked env vars
-        with patch.object(Config, "AWS_REGION", "us-west-2"), patch.object(
-            Config, "COGNITO_USER_POOL_ID", "test-pool-id"
-        ), patch.object(Config, "COGNITO_CLIENT_ID", "test-client-id"):
-            assert Config.validate() is True
+        # Derive a config instance with the required values set
+        valid_config = replace(
+            config,
+            AWS_REGION="us-west-2",
+            COGNITO_USER_POOL_ID="test-pool-id",
+            COGNITO_CLIENT_ID="test-client-id",
+        )
+        assert valid_config.validate() is True
 
-    @patch.dict(os.environ, {"AWS_REGION": "us-west-2"}, clear=True)
-    def test_validate_missing_required(self):
+    def test_validate_missing_required(self, config):
         """Test validation failure with missing required variables."""
-        from streamlit_app.utils.config import Config
+        # Derive a config instance with missing vars
+        invalid_config = replace(
+            config, AWS_REGION="us-west-2", COGNITO_USER_POOL_ID=None, COGNITO_CLIENT_ID=None
+        )
+        assert invalid_config.validate() is False
 
-        # Create a new config instance with missing vars
-        with patch.object(Config, "AWS_REGION", "us-west-2"), patch.object(
-            Config, "COGNITO_USER_POOL_ID", None
-        ), patch.object(Config, "COGNITO_CLIENT_ID", None):
-            assert Config.validate() is False
+    def test_config_is_frozen(self, config):
+        """Test configuration cannot be modified after creation."""
+        with pytest.raises(FrozenInstanceError):
+            config.AWS_REGION = "us-east-1"
 
-    def test_get_info(self):
+    def test_get_info(self, config):
         """Test configuration info retrieval."""
-        from streamlit_app.utils.config import Config
-
-        info = Config.get_info()
+        info = config.get_info()
         assert isinstance(info, dict)
         assert "AWS Region" in info
         assert "Cognito User Pool" in info
@@ -108,52 +107,46 @@ class TestConfigValidation:
         assert "Debug Mode" in info
 
 
+@pytest.mark.unit
 class TestConfigRegion:
     """Test region-specific configuration."""
 
-    def test_region_defaults(self):
+    def test_region_defaults(self, config):
         """Test that all region configs default to AWS_REGION."""
-        from streamlit_app.utils.config import Config
-
         # These should all default to AWS_REGION
-        assert Config.CDK_DEFAULT_REGION == Config.AWS_REGION or Config.CDK_DEFAULT_REGION
-        assert Config.COGNITO_REGION == Config.AWS_REGION or Config.COGNITO_REGION
-        assert Config.S3_BUCKET_REGION == Config.AWS_REGION or Config.S3_BUCKET_REGION
+        assert config.CDK_DEFAULT_REGION == config.AWS_REGION or config.CDK_DEFAULT_REGION
+        assert config.COGNITO_REGION == config.AWS_REGION or config.COGNITO_REGION
+        assert config.S3_BUCKET_REGION == config.AWS_REGION or config.S3_BUCKET_REGION
 
-    def test_bedrock_model_id(self):
+    def test_bedrock_model_id(self, config):
         """Test Bedrock model ID configuration."""
-        from streamlit_app.utils.config import Config
-
-        assert "claude" in Config.BEDROCK_MODEL_ID.lower()
-        assert "sonnet" in Config.BEDROCK_MODEL_ID.lower()
+        assert "claude" in config.BEDROCK_MODEL_ID.lower()
+        assert "sonnet" in config.BEDROCK_MODEL_ID.lower()
 
-    def test_vision_model_id(self):
+    def test_vision_model_id(self, config):
         """Test Vision model ID configuration."""
-        from streamlit_app.utils.config import Config
-
-        assert "claude" in Config.VISION_MODEL_ID.lower()
+        assert "claude" in config.VISION_MODEL_ID.lower()
 
 
+@pytest.mark.unit
 class TestConfigFeatureFlags:
     """Test feature flag configuration."""
 
-    def test_feature_flags_exist(self):
+    def test_feature_flags_exist(self, config):
         """Test that feature flags are properly configured."""
-        from streamlit_app.utils.config import Config
-
-        assert hasattr(Config, "FEATURE_IMAGE_RECOGNITION")
-        assert hasattr(Config, "FEATURE_FOOD_PAIRING")
-        assert hasattr(Config, "FEATURE_SOCIAL_SHARING")
-        assert hasattr(Config, "FEATURE_EXPORT_HISTORY")
-
-    def test_feature_flags_are_boolean(self):
+        assert {
+            "FEATURE_IMAGE_RECOGNITION",
+            "FEATURE_FOOD_PAIRING",
+            "FEATURE_SOCIAL_SHARING",
+            "FEATURE_EXPORT_HISTORY",
+        } <= field_names(config)
+
+    def test_feature_flags_are_boolean(self, config):
         """Test that feature flags are boolean values."""
-        from streamlit_app.utils.config import Config
-
-        assert isinstance(Config.FEATURE_IMAGE_RECOGNITION, bool)
-        assert isinstance(Config.FEATURE_FOOD_PAIRING, bool)
-        assert isinstance(Config.FEATURE_SOCIAL_SHARING, bool)
-        assert isinstance(Config.FEATURE_EXPORT_HISTORY, bool)
+        assert isinstance(config.FEATURE_IMAGE_RECOGNITION, bool)
+        assert isinstance(config.FEATURE_FOOD_PAIRING, bool)
+        assert isinstance(config.FEATURE_SOCIAL_SHARING, bool)
+        assert isinstance(config.FEATURE_EXPORT_HISTORY, bool)
 
     @patch.dict(
         os.environ,
@@ -171,74 +164,66 @@ class TestConfigFeatureFlags:
         assert os.getenv("FEATURE_SOCIAL_SHARING") == "true"
 
 
+@pytest.mark.unit
 class TestConfigSecurity:
     """Test security-related configuration."""
 
-    def test_security_config_exists(self):
+    def test_security_config_exists(self, config):
         """Test that security configuration exists."""
-        from streamlit_app.utils.config import Config
-
-        assert hasattr(Config, "SECRET_KEY")
-        assert hasattr(Config, "JWT_SECRET_KEY")
-        assert hasattr(Config, "JWT_ALGORITHM")
-        assert hasattr(Config, "JWT_EXPIRATION_MINUTES")
-
-    def test_jwt_defaults(self):
+        assert {
+            "SECRET_KEY",
+            "JWT_SECRET_KEY",
+            "JWT_ALGORITHM",
+            "JWT_EXPIRATION_MINUTES",
+        } <= field_names(config)
+
+    def test_jwt_defaults(self, config):
         """Test JWT default configuration."""
-        from streamlit_app.utils.config import Config
-
-        assert Config.JWT_ALGORITHM == "HS256"
-        assert Config.JWT_EXPIRATION_MINUTES == 60
+        assert config.JWT_ALGORITHM == "HS256"
+        assert config.JWT_EXPIRATION_MINUTES == 60
 
 
+@pytest.mark.unit
 class TestConfigDynamoDB:
     """Test DynamoDB configuration."""
 
-    def test_dynamodb_table_names(self):
+    def test_dynamodb_table_names(self, config):
         """Test DynamoDB table name configuration."""
-        from streamlit_app.utils.config import Config
-
-        assert "SakeSensei-Users" in Config.DYNAMODB_USERS_TABLE
-        assert "SakeSensei-SakeMaster" in Config.DYNAMODB_SAKE_TABLE
-        assert "SakeSensei-BreweryMaster" in Config.DYNAMODB_BREWERY_TABLE
-        assert "SakeSensei-TastingRecords" in Config.DYNAMODB_TASTING_TABLE
+        assert "SakeSensei-Users" in config.DYNAMODB_USERS_TABLE
+        assert "SakeSensei-SakeMaster" in config.DYNAMODB_SAKE_TABLE
+        assert "SakeSensei-BreweryMaster" in config.DYNAMODB_BREWERY_TABLE
+        assert "SakeSensei-TastingRecords" in config.DYNAMODB_TASTING_TABLE
 
 
+@pytest.mark.unit
 class TestConfigRecommendation:
     """Test recommendation algorithm configuration."""
 
-    def test_recommendation_weights_sum_to_one(self):
+    def test_recommendation_weights_sum_to_one(self, config):
         """Test that recommendation weights approximately sum to 1.0."""
-        from streamlit_app.utils.config import Config
-
         total_weight = (
-            Config.RECOMMENDATION_DIVERSITY_WEIGHT
-            + Config.RECOMMENDATION_COLLABORATIVE_WEIGHT
-            + Config.RECOMMENDATION_CONTENT_WEIGHT
+            config.RECOMMENDATION_DIVERSITY_WEIGHT
+            + config.RECOMMENDATION_COLLABORATIVE_WEIGHT
+            + config.RECOMMENDATION_CONTENT_WEIGHT
         )
         assert abs(total_weight - 1.0) < 0.01  # Allow small floating point error
 
-    def test_recommendation_max_results(self):
+    def test_recommendation_max_results(self, config):
         """Test recommendation max results configuration."""
-        from streamlit_app.utils.config import Config
-
-        assert Config.RECOMMENDATION_MAX_RESULTS > 0
-        assert Config.RECOMMENDATION_MAX_RESULTS <= 20
+        assert config.RECOMMENDATION_MAX_RESULTS > 0
+        assert config.RECOMMENDATION_MAX_RESULTS <= 20
 
 
+@pytest.mark.unit
 class TestConfigStreamlit:
     """Test Streamlit-specific configuration."""
 
-    def test_streamlit_defaults(self):
+    def test_streamlit_defaults(self, config):
         """Test Streamlit default configuration."""
-        from streamlit_app.utils.config import Config
+        assert config.STREAMLIT_SERVER_PORT == 8501
+        assert config.STREAMLIT_SERVER_ADDRESS == "localhost"
 
-        assert Config.STREAMLIT_SERVER_PORT == 8501
-        assert Config.STREAMLIT_SERVER_ADDRESS == "localhost"
-
-    def test_app_name_and_env(self):
+    def test_app_name_and_env(self, config):
         """Test application name and environment."""
-        from streamlit_app.utils.config import Config
-
-        assert Config.APP_NAME == "Sake Sensei"
-        assert Config.APP_ENV in ["development", "staging", "production"]
+        assert config.APP_NAME == "Sake Sensei"
+        assert config.APP_ENV in ["development", "staging", "production"]
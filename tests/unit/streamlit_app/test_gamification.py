@@ -0,0 +1,202 @@
+"""
+Sake Sensei - Gamification Tests
+
+Tests for achievement checks, progress tracking and panel state.
+"""
+
+import pytest
+
+from streamlit_app.utils import gamification
+from streamlit_app.utils.gamification import (
+    ACHIEVEMENTS,
+    ACHIEVEMENTS_BY_ID,
+    _compute_panel_state,
+    check_achievements,
+    get_achievement_progress,
+    get_user_progress,
+    update_user_progress,
+)
+from tests.unit.streamlit_app import _streamlit_stub
+
+USER_ID = "test-user"
+ALL_IDS = tuple(a.id for a in ACHIEVEMENTS)
+EIGHT_TYPES = {f"type-{i}" for i in range(8)}
+
+# Progress at which every achievement's requirement is met
+MAXED_PROGRESS = {
+    "tastings_count": 100,
+    "recommendations_count": 5,
+    "preferences_set": True,
+    "image_recognitions": 10,
+    "reviews_count": 5,
+    "unique_types": EIGHT_TYPES,
+    "social_tastings": 10,
+}
+
+
+@pytest.fixture(autouse=True)
+def progress():
+    """A fresh progress record in the stub's emptied session state.
+
+    The conftest restores the session state afterwards.
+    """
+    _streamlit_stub.session_state.clear()
+    return get_user_progress(USER_ID)
+
+
+@pytest.fixture
+def notified(monkeypatch):
+    """IDs of the achievements announced by show_achievement_earned, in order."""
+    shown = []
+    monkeypatch.setattr(
+        gamification, "show_achievement_earned", lambda achievement: shown.append(achievement.id)
+    )
+    return shown
+
+
+@pytest.mark.unit
+class TestAchievementThresholds:
+    """Test each achievement unlocks exactly at its requirement."""
+
+    @pytest.mark.parametrize(
+        ("achievement_id", "field", "below", "at"),
+        [
+            pytest.param("first_taste", "tastings_count", 0, 1, id="first_taste"),
+            pytest.param("sake_explorer", "tastings_count", 9, 10, id="sake_explorer"),
+            pytest.param("sake_master", "tastings_count", 49, 50, id="sake_master"),
+            pytest.param("sake_legend", "tastings_count", 99, 100, id="sake_legend"),
+            pytest.param(
+                "preference_complete", "preferences_set", False, True, id="preference_complete"
+            ),
+            pytest.param("ai_enthusiast", "recommendations_count", 4, 5, id="ai_enthusiast"),
+            pytest.param("reviewer", "reviews_count", 4, 5, id="reviewer"),
+            pytest.param(
+                "sake_connoisseur",
+                "unique_types",
+                set(sorted(EIGHT_TYPES)[:7]),
+                EIGHT_TYPES,
+                id="sake_connoisseur",
+            ),
+            pytest.param("social_drinker", "social_tastings", 9, 10, id="social_drinker"),
+            pytest.param("sake_photographer", "image_recognitions", 9, 10, id="sake_photographer"),
+        ],
+    )
+    def test_threshold(self, progress, achievement_id, field, below, at):
+        """Test an achievement is locked just below its requirement and earned at it."""
+        achievement = ACHIEVEMENTS_BY_ID[achievement_id]
+
+        progress[field] = below
+        assert achievement_id not in {a.id for a in check_achievements(USER_ID)}
+
+        progress[field] = at
+        assert get_achievement_progress(achievement, progress) == achievement.requirement
+        assert achievement_id in {a.id for a in check_achievements(USER_ID)}
+
+
+@pytest.mark.unit
+class TestActionCandidates:
+    """Test each action only checks the achievements it can unlock."""
+
+    @pytest.mark.parametrize(
+        ("action", "expected"),
+        [
+            pytest.param(
+                "tasting",
+                [
+                    "first_taste",
+                    "sake_explorer",
+                    "sake_master",
+                    "sake_legend",
+                    "reviewer",
+                    "sake_connoisseur",
+                    "social_drinker",
+                ],
+                id="tasting",
+            ),
+            pytest.param("recommendation", ["ai_enthusiast"], id="recommendation"),
+            pytest.param("preference_set", ["preference_complete"], id="preference_set"),
+            pytest.param("image_recognition", ["sake_photographer"], id="image_recognition"),
+            pytest.param("unknown", [], id="unknown-action"),
+        ],
+    )
+    def test_action_unlocks_only_its_achievements(self, progress, notified, action, expected):
+        """Test an action announces only its own achievements when every requirement is met."""
+        progress.update(MAXED_PROGRESS)
+
+        update_user_progress(USER_ID, action)
+
+        assert notified == expected
+
+    def test_every_achievement_reachable_by_an_action(self, progress, notified):
+        """Test the actions together can unlock every achievement."""
+        progress.update(MAXED_PROGRESS)
+
+        for action in ("tasting", "recommendation", "preference_set", "image_recognition"):
+            update_user_progress(USER_ID, action)
+
+        assert sorted(notified) == sorted(ALL_IDS)
+
+
+@pytest.mark.unit
+class TestProgressTracking:
+    """Test progress updates and repeated checks."""
+
+    def test_tasting_updates_counters(self, progress, notified):
+        """Test a tasting counts toward tastings, reviews, sake types and social tastings."""
+        update_user_progress(USER_ID, "tasting", {"sake_type": "純米", "drinking_scene": "友人と"})
+        update_user_progress(USER_ID, "tasting", {"sake_type": "純米"})
+
+        assert progress["tastings_count"] == 2
+        assert progress["reviews_count"] == 2
+        assert progress["unique_types"] == {"純米"}
+        assert progress["social_tastings"] == 1
+        assert notified == ["first_taste"]
+
+    def test_check_is_idempotent(self, progress):
+        """Test earned achievements are returned once and stay earned."""
+        progress.update(MAXED_PROGRESS)
+
+        first = check_achievements(USER_ID)
+        earned_mask = progress["earned_mask"]
+
+        assert [a.id for a in first] == list(ALL_IDS)
+        assert check_achievements(USER_ID) == []
+        assert progress["earned_mask"] == earned_mask
+
+    def test_progress_is_per_user(self, progress):
+        """Test progress for one user leaves another user's untouched."""
+        update_user_progress("other-user", "recommendation")
+
+        assert progress["recommendations_count"] == 0
+        assert get_user_progress("other-user")["recommendations_count"] == 1
+
+
+@pytest.mark.unit
+class TestPanelState:
+    """Test the derived achievement panel state."""
+
+    def test_nothing_earned(self):
+        """Test the panel state before any achievement is earned."""
+        assert _compute_panel_state(0) == ((), ALL_IDS, 0, 0.0, 1)
+
+    def test_some_earned(self, progress):
+        """Test the panel state follows the earned mask that check_achievements records."""
+        progress["tastings_count"] = 10
+        check_achievements(USER_ID)
+
+        earned, locked, earned_count, completion_rate, level = _compute_panel_state(
+            progress["earned_mask"]
+        )
+
+        assert earned == ("first_taste", "sake_explorer")
+        assert locked == ALL_IDS[2:]
+        assert earned_count == 2
+        assert completion_rate == pytest.approx(20.0)
+        assert level == 2
+
+    def test_all_earned(self, progress):
+        """Test the panel state once every achievement is earned."""
+        progress.update(MAXED_PROGRESS)
+        check_achievements(USER_ID)
+
+        assert _compute_panel_state(progress["earned_mask"]) == (ALL_IDS, (), 10, 100.0, 6)
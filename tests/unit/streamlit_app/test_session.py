@@ -4,19 +4,23 @@ Sake Sensei - Session Management Tests
 Tests for Streamlit session state management.
 """
 
-from unittest.mock import MagicMock, patch
-
 import pytest
 
+from tests.unit.streamlit_app import _streamlit_stub
+
 
 @pytest.fixture
-def mock_streamlit():
-    """Mock Streamlit session state."""
-    with patch("streamlit_app.utils.session.st") as mock_st:
-        mock_st.session_state = {}
-        yield mock_st
+def mock_streamlit(monkeypatch):
+    """The streamlit stub, patched into session.py with its session state emptied for the test.
 
+    The conftest restores the emptied state afterwards.
+    """
+    monkeypatch.setattr("streamlit_app.utils.session.st", _streamlit_stub)
+    _streamlit_stub.session_state.clear()
+    return _streamlit_stub
 
+
+@pytest.mark.unit
 class TestSessionInit:
     """Test session initialization."""
 
@@ -47,6 +51,7 @@ class TestSessionInit:
         assert mock_streamlit.session_state[SessionManager.KEY_USER_ID] == "existing-user"
 
 
+@pytest.mark.unit
 class TestSessionGetSet:
     """Test basic get/set operations."""
 
@@ -76,6 +81,7 @@ class TestSessionGetSet:
         assert mock_streamlit.session_state["test_key"] == "test_value"
 
 
+@pytest.mark.unit
 class TestAuthentication:
     """Test authentication-related methods."""
 
@@ -143,6 +149,7 @@ class TestAuthentication:
         assert mock_streamlit.session_state[SessionManager.KEY_AGENT_SESSION_ID] is None
 
 
+@pytest.mark.unit
 class TestUserGetters:
     """Test user information getter methods."""
 
@@ -194,6 +201,7 @@ class TestUserGetters:
         assert user_info["name"] == "Test User"
 
 
+@pytest.mark.unit
 class TestPreferences:
     """Test user preferences management."""
 
@@ -226,6 +234,7 @@ class TestPreferences:
         assert result == {}
 
 
+@pytest.mark.unit
 class TestChatHistory:
     """Test chat history management."""
 
@@ -284,6 +293,7 @@ class TestChatHistory:
         assert mock_streamlit.session_state[SessionManager.KEY_CHAT_HISTORY] == []
 
 
+@pytest.mark.unit
 class TestAgentSession:
     """Test AgentCore session management."""
 
@@ -293,7 +303,9 @@ class TestAgentSession:
 
         SessionManager.set_agent_session_id("test-session-id")
 
-        assert mock_streamlit.session_state[SessionManager.KEY_AGENT_SESSION_ID] == "test-session-id"
+        assert (
+            mock_streamlit.session_state[SessionManager.KEY_AGENT_SESSION_ID] == "test-session-id"
+        )
 
     def test_get_agent_session_id(self, mock_streamlit):
         """Test getting AgentCore session ID."""
@@ -14,121 +14,102 @@ from streamlit_app.utils.validation import (
     validate_tasting_record,
 )
 
+# Over-limit inputs, built once at import
+EMAIL_TOO_LONG = "a" * 256  # limit 255
+PASSWORD_TOO_LONG = "A" * 130 + "a1"  # limit 128
+NAME_TOO_LONG = "A" * 101  # limit 100
+SAKE_NAME_TOO_LONG = "A" * 201  # limit 200
+LONG_TEXT = "A" * 2000
+
 
 @pytest.mark.unit
 class TestValidation:
     """Test validation functions."""
 
-    def test_validate_email_valid(self) -> None:
-        """Test valid email addresses."""
-        is_valid, _ = validate_email("user@example.com")
-        assert is_valid is True
-
-        is_valid, _ = validate_email("test.user+tag@domain.co.jp")
-        assert is_valid is True
-
-    def test_validate_email_invalid(self) -> None:
-        """Test invalid email addresses."""
-        is_valid, error = validate_email("")
-        assert is_valid is False
-        assert error != ""
-
-        is_valid, error = validate_email("invalid-email")
-        assert is_valid is False
-
-        is_valid, error = validate_email("@example.com")
-        assert is_valid is False
-
-    def test_validate_password_valid(self) -> None:
-        """Test valid passwords."""
-        is_valid, _ = validate_password("StrongPass123!")
-        assert is_valid is True
-
-    def test_validate_password_too_short(self) -> None:
-        """Test password too short."""
-        is_valid, error = validate_password("Short1!")
-        assert is_valid is False
-        assert "at least 8 characters" in error
-
-    def test_validate_password_no_uppercase(self) -> None:
-        """Test password without uppercase."""
-        is_valid, error = validate_password("password123!")
-        assert is_valid is False
-
-    def test_validate_password_no_number(self) -> None:
-        """Test password without number."""
-        is_valid, error = validate_password("Password!")
-        assert is_valid is False
-
-    def test_validate_rating_valid(self) -> None:
-        """Test valid ratings."""
-        for rating in [1, 2, 3, 4, 5]:
-            is_valid, _ = validate_rating(rating)
-            assert is_valid is True
-
-    def test_validate_rating_invalid(self) -> None:
-        """Test invalid ratings."""
-        is_valid, error = validate_rating(0)
-        assert is_valid is False
-
-        is_valid, error = validate_rating(6)
-        assert is_valid is False
-
-        is_valid, error = validate_rating(-1)
-        assert is_valid is False
-
-    def test_validate_sake_name_valid(self) -> None:
-        """Test valid sake names."""
-        is_valid, _ = validate_sake_name("獺祭 純米大吟醸")
-        assert is_valid is True
-
-    def test_validate_sake_name_empty(self) -> None:
-        """Test empty sake name."""
-        is_valid, error = validate_sake_name("")
-        assert is_valid is False
-
-        is_valid, error = validate_sake_name("   ")
-        assert is_valid is False
-
-    def test_validate_image_file_valid(self) -> None:
-        """Test valid image files."""
-        is_valid, _ = validate_image_file("photo.jpg", 1024 * 1024)
-        assert is_valid is True
-
-        is_valid, _ = validate_image_file("image.png", 2 * 1024 * 1024)
-        assert is_valid is True
-
-    def test_validate_image_file_invalid_extension(self) -> None:
-        """Test invalid file extension."""
-        is_valid, error = validate_image_file("document.pdf", 1024)
-        assert is_valid is False
-        assert "Unsupported format" in error
-
-    def test_validate_image_file_too_large(self) -> None:
-        """Test file too large."""
-        is_valid, error = validate_image_file("large.jpg", 20 * 1024 * 1024, max_size_mb=10)
-        assert is_valid is False
-        assert "too large" in error
-
-    def test_validate_email_too_long(self) -> None:
-        """Test email too long."""
-        is_valid, error = validate_email("a" * 256)
-        assert is_valid is False
-
-    def test_validate_password_too_long(self) -> None:
-        """Test password too long."""
-        is_valid, error = validate_password("A" * 130 + "a1")
-        assert is_valid is False
-
-    def test_validate_password_no_lowercase(self) -> None:
-        """Test password without lowercase."""
-        is_valid, error = validate_password("ABCD1234")
-        assert is_valid is False
-
-    def test_validate_password_empty(self) -> None:
-        """Test empty password."""
-        is_valid, error = validate_password("")
-        assert is_valid is False
+    @pytest.mark.parametrize(
+        ("email", "expected_error"),
+        [
+            pytest.param("user@example.com", "", id="valid"),
+            pytest.param("test.user+tag@domain.co.jp", "", id="valid-plus-tag"),
+            pytest.param("", "required", id="empty"),
+            pytest.param("invalid-email", "Invalid email format", id="no-at"),
+            pytest.param("@example.com", "Invalid email format", id="no-local-part"),
+            pytest.param("user@", "Invalid email format", id="no-domain"),
+            pytest.param(EMAIL_TOO_LONG, "too long", id="too-long"),
+        ],
+    )
+    def test_validate_email(self, email: str, expected_error: str) -> None:
+        """Test email presence, length and format."""
+        is_valid, error = validate_email(email)
+        assert is_valid is (not expected_error)
+        assert expected_error in error
+
+    @pytest.mark.parametrize(
+        ("password", "expected_error"),
+        [
+            pytest.param("StrongPass123!", "", id="valid"),
+            pytest.param("", "required", id="empty"),
+            pytest.param("Short1!", "at least 8 characters", id="too-short"),
+            pytest.param(PASSWORD_TOO_LONG, "too long", id="too-long"),
+            pytest.param("password123!", "uppercase", id="no-uppercase"),
+            pytest.param("ABCD1234", "lowercase", id="no-lowercase"),
+            pytest.param("Password!", "digit", id="no-digit"),
+        ],
+    )
+    def test_validate_password(self, password: str, expected_error: str) -> None:
+        """Test password strength rules, one case per rule."""
+        is_valid, error = validate_password(password)
+        assert is_valid is (not expected_error)
+        assert expected_error in error
+
+    @pytest.mark.parametrize(
+        ("rating", "expected"),
+        [
+            *(pytest.param(rating, True, id=f"valid-{rating}") for rating in range(1, 6)),
+            pytest.param(0, False, id="zero"),
+            pytest.param(6, False, id="above-max"),
+            pytest.param(-1, False, id="negative"),
+            pytest.param(3.5, False, id="non-integer"),
+        ],
+    )
+    def test_validate_rating(self, rating: float, expected: bool) -> None:
+        """Test ratings must be integers from 1 to 5."""
+        is_valid, _ = validate_rating(rating)
+        assert is_valid is expected
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            pytest.param("獺祭 純米大吟醸", True, id="valid"),
+            pytest.param("", False, id="empty"),
+            pytest.param("   ", False, id="blank"),
+            pytest.param("A", False, id="too-short"),
+            pytest.param(SAKE_NAME_TOO_LONG, False, id="too-long"),
+        ],
+    )
+    def test_validate_sake_name(self, name: str, expected: bool) -> None:
+        """Test sake name presence and length limits."""
+        is_valid, _ = validate_sake_name(name)
+        assert is_valid is expected
+
+    @pytest.mark.parametrize(
+        ("file_name", "file_size", "expected_error"),
+        [
+            pytest.param("photo.jpg", 1024 * 1024, "", id="jpg"),
+            pytest.param("image.png", 2 * 1024 * 1024, "", id="png"),
+            pytest.param("PHOTO.JPG", 1024, "", id="uppercase-extension"),
+            pytest.param("photo.jpg.exe", 1024, "Unsupported format", id="double-extension"),
+            pytest.param("jpg", 1024, "Unsupported format", id="no-extension"),
+            pytest.param("", 0, "No file selected", id="no-file"),
+            pytest.param("document.pdf", 1024, "Unsupported format", id="bad-extension"),
+            pytest.param("large.jpg", 20 * 1024 * 1024, "too large", id="too-large"),
+        ],
+    )
+    def test_validate_image_file(self, file_name: str, file_size: int, expected_error: str) -> None:
+        """Test image presence, extension and the 10MB default size limit."""
+        is_valid, error = validate_image_file(file_name, file_size)
+        assert is_valid is (not expected_error)
+        assert expected_error in error
 
     def test_validate_name_valid(self) -> None:
         """Test valid name."""
@@ -147,7 +128,7 @@ class TestValidation:
 
     def test_validate_name_too_long(self) -> None:
         """Test name too long."""
-        is_valid, error = validate_name("A" * 101)
+        is_valid, error = validate_name(NAME_TOO_LONG)
         assert is_valid is False
 
     def test_validate_preferences_valid(self) -> None:
@@ -187,27 +168,7 @@ class TestValidation:
 
     def test_validate_tasting_record_too_long(self) -> None:
         """Test tasting record name too long."""
-        is_valid, errors = validate_tasting_record({"sake_name": "A" * 201})
-        assert is_valid is False
-
-    def test_validate_sake_name_too_short(self) -> None:
-        """Test sake name too short."""
-        is_valid, error = validate_sake_name("A")
-        assert is_valid is False
-
-    def test_validate_sake_name_too_long(self) -> None:
-        """Test sake name too long."""
-        is_valid, error = validate_sake_name("A" * 201)
-        assert is_valid is False
-
-    def test_validate_rating_non_integer(self) -> None:
-        """Test rating non-integer."""
-        is_valid, error = validate_rating(3.5)
-        assert is_valid is False
-
-    def test_validate_image_file_no_file(self) -> None:
-        """Test no file selected."""
-        is_valid, error = validate_image_file("", 0)
+        is_valid, errors = validate_tasting_record({"sake_name": SAKE_NAME_TOO_LONG})
         assert is_valid is False
 
     def test_sanitize_text_input_normal(self) -> None:
@@ -225,7 +186,27 @@ class TestValidation:
         result = sanitize_text_input("Text\x00with\x00nulls")
         assert "\x00" not in result
 
+    def test_sanitize_text_input_control_chars(self) -> None:
+        """Test sanitize strips control characters but keeps line breaks and tabs."""
+        result = sanitize_text_input("Line\x1b[0m one\x07\nLine\ttwo\r\n")
+        assert result == "Line[0m one\nLine\ttwo"
+
     def test_sanitize_text_input_truncate(self) -> None:
         """Test sanitize truncates long text."""
-        result = sanitize_text_input("A" * 2000, max_length=100)
+        result = sanitize_text_input(LONG_TEXT, max_length=100)
         assert len(result) == 100
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            pytest.param("ABCDEFGH", "ABCDE", id="plain"),
+            pytest.param("\x00\x07ABCDEFGH", "ABC", id="control-chars-count-toward-limit"),
+            pytest.param("  ABCDEFGH", "ABC", id="whitespace-counts-toward-limit"),
+            pytest.param("ABCDE\x00\x07", "ABCDE", id="control-chars-past-limit"),
+        ],
+    )
+    def test_sanitize_text_input_limit_applies_before_cleanup(
+        self, text: str, expected: str
+    ) -> None:
+        """Test max_length bounds the raw input, so removed characters still count toward it."""
+        assert sanitize_text_input(text, max_length=5) == expected